@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark every Transaction method against a local fake Paystack server.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_transaction --calls 200 --concurrency 16 --latency 0.005 \\
+        --output bench.json --compare previous.json
+
+Each (mode, method) pair reports throughput, p50/p95/p99/mean latency, CPU
+time of the calling thread(s) per call, peak traced allocation per call and
+the number of TCP connections the server accepted. The fake server runs in
+a subprocess so its CPU and allocations do not pollute the client numbers.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.request import Request, urlopen
+
+from benchmarks.fake_paystack import point_at, serve
+from errors import APIError
+from paystackpyAPI.transaction import Transaction
+
+API_KEY = "sk_test_benchmark"
+MODES = ("sequential", "threaded", "async")
+
+
+def method_calls(export_dir: str) -> Dict[str, Callable]:
+    """``name -> fn(client, i)``; works for Transaction and AsyncTransaction alike."""
+    return {
+        "initialize_transaction": lambda t, i: t.initialize_transaction("bench@example.com", 100,
+                                                                        reference=f"bench-init-{i}"),
+        "verify_transaction": lambda t, i: t.verify_transaction(f"ref-{i + 1}"),
+        "list_transactions": lambda t, i: t.list_transactions(perPage=50, page=i % 20 + 1),
+        "fetch_transaction": lambda t, i: t.fetch_transaction(i % 1000 + 1),
+        "charge_authorization": lambda t, i: t.charge_authorization("bench@example.com", 100, f"{i:08d}",
+                                                                    reference=f"bench-charge-{i}"),
+        "show_transaction_timeline": lambda t, i: t.show_transaction_timeline(f"ref-{i + 1}"),
+        "get_total_transactions": lambda t, i: t.get_total_transactions(page=i % 5 + 1),
+        "export_transactions": lambda t, i: t.export_transactions(
+            page=i % 3 + 1, filename=os.path.join(export_dir, f"export-{i}.csv")),
+    }
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def server_stats(base_url: str, reset: bool = False) -> Dict:
+    request = Request(f"{base_url}/__stats", method="POST" if reset else "GET")
+    with urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def make_sync_client(base_url: str, concurrency: int) -> Transaction:
+    return point_at(Transaction(API_KEY, pool_maxsize=max(concurrency, 10), coalesce=False), base_url)
+
+
+def make_async_client(base_url: str, concurrency: int):
+    from paystackpyAPI.async_transaction import AsyncTransaction
+
+    return point_at(AsyncTransaction(API_KEY, max_connections=concurrency,
+                                     max_keepalive_connections=concurrency, coalesce=False), base_url)
+
+
+def timed_call(fn: Callable, client, i: int, latencies: List[float]) -> bool:
+    started = time.perf_counter()
+    try:
+        fn(client, i)
+        return True
+    except APIError:
+        return False
+    finally:
+        latencies.append(time.perf_counter() - started)
+
+
+def run_sequential(fn: Callable, client, calls: int) -> Dict:
+    latencies: List[float] = []
+    cpu = time.thread_time()
+    ok = sum(timed_call(fn, client, i, latencies) for i in range(calls))
+    return {"latencies": latencies, "errors": calls - ok, "cpu": time.thread_time() - cpu}
+
+
+def run_threaded(fn: Callable, client, calls: int, concurrency: int) -> Dict:
+    def worker(indexes):
+        latencies: List[float] = []
+        cpu = time.thread_time()
+        ok = sum(timed_call(fn, client, i, latencies) for i in indexes)
+        return latencies, len(indexes) - ok, time.thread_time() - cpu
+
+    shards = [range(start, calls, concurrency) for start in range(concurrency)]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(worker, shards))
+    return {
+        "latencies": [latency for latencies, _, _ in results for latency in latencies],
+        "errors": sum(errors for _, errors, _ in results),
+        "cpu": sum(cpu for _, _, cpu in results),
+    }
+
+
+async def run_async(fn: Callable, client, calls: int, concurrency: int) -> Dict:
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await fn(client, i)
+            except APIError:
+                errors += 1
+            finally:
+                latencies.append(time.perf_counter() - started)
+
+    cpu = time.thread_time()
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return {"latencies": latencies, "errors": errors, "cpu": time.thread_time() - cpu}
+
+
+def allocation_per_call(call: Callable[[int], None], samples: int) -> float:
+    """Mean peak traced allocation (bytes) of ``call(i)``."""
+    tracemalloc.start()
+    try:
+        peaks = []
+        for i in range(samples):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            try:
+                call(i)
+            except APIError:
+                pass
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        return sum(peaks) / len(peaks) if peaks else 0.0
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(mode: str, method: str, calls: int, wall: float, raw: Dict, connections: int,
+              alloc: Optional[float]) -> Dict:
+    latencies = sorted(raw["latencies"])
+    ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        "mode": mode,
+        "method": method,
+        "calls": calls,
+        "errors": raw["errors"],
+        "wall_seconds": round(wall, 4),
+        "throughput": round(calls / wall, 2) if wall else None,
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+        "cpu_ms_per_call": ms(raw["cpu"] / calls) if calls else None,
+        "alloc_bytes_per_call": round(alloc) if alloc is not None else None,
+        "server_connections": connections,
+    }
+
+
+def run_benchmarks(base_url: str, modes=MODES, methods=None, calls: int = 100, concurrency: int = 8,
+                   alloc_samples: int = 20, export_calls: int = 10) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as export_dir:
+        available = method_calls(export_dir)
+        selected = {name: available[name] for name in (methods or available)}
+        for mode in modes:
+            if mode == "async":
+                try:
+                    import httpx  # noqa: F401
+                except ImportError:
+                    print("skipping async mode: httpx is not installed", file=sys.stderr)
+                    continue
+            for name, fn in selected.items():
+                n = export_calls if name == "export_transactions" else calls
+                server_stats(base_url, reset=True)
+                if mode == "async":
+                    measured = asyncio.run(_async_mode(fn, base_url, n, concurrency, alloc_samples))
+                else:
+                    measured = _sync_mode(mode, fn, base_url, n, concurrency, alloc_samples)
+                results.append(summarize(mode, name, n, *measured))
+    return results
+
+
+def _sync_mode(mode: str, fn: Callable, base_url: str, calls: int, concurrency: int, alloc_samples: int):
+    client = make_sync_client(base_url, concurrency)
+    try:
+        started = time.perf_counter()
+        raw = (run_sequential(fn, client, calls) if mode == "sequential"
+               else run_threaded(fn, client, calls, concurrency))
+        wall = time.perf_counter() - started
+        connections = server_stats(base_url)["connections"]
+        # Threads interleave their allocations, so only the sequential run is traced.
+        alloc = (allocation_per_call(lambda i: fn(client, i), min(alloc_samples, calls))
+                 if mode == "sequential" else None)
+        return wall, raw, connections, alloc
+    finally:
+        client.close()
+
+
+async def _async_mode(fn: Callable, base_url: str, calls: int, concurrency: int, alloc_samples: int):
+    client = make_async_client(base_url, concurrency)
+    try:
+        started = time.perf_counter()
+        raw = await run_async(fn, client, calls, concurrency)
+        wall = time.perf_counter() - started
+        connections = server_stats(base_url)["connections"]
+        tracemalloc.start()
+        peaks = []
+        for i in range(min(alloc_samples, calls)):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            try:
+                await fn(client, i)
+            except APIError:
+                pass
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        tracemalloc.stop()
+        return wall, raw, connections, sum(peaks) / len(peaks) if peaks else 0.0
+    finally:
+        await client.aclose()
+
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float) -> bool:
+    """Print the change against a previous run; return True if any p99/throughput regressed past ``threshold`` %."""
+    previous = {(row["mode"], row["method"]): row for row in baseline}
+    regressed = False
+    print(f"\n{'mode':<11} {'method':<26} {'throughput':>12} {'p99':>10}")
+    for row in results:
+        old = previous.get((row["mode"], row["method"]))
+        if not old or not old["throughput"] or not old["p99_ms"]:
+            continue
+        throughput = (row["throughput"] - old["throughput"]) / old["throughput"] * 100
+        p99 = (row["p99_ms"] - old["p99_ms"]) / old["p99_ms"] * 100
+        flag = ""
+        if throughput < -threshold or p99 > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(f"{row['mode']:<11} {row['method']:<26} {throughput:>+11.1f}% {p99:>+9.1f}%{flag}")
+    return regressed
+
+
+def start_server(latency: float, jitter: float, error_rate: float):
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=("127.0.0.1", 0, latency, jitter, error_rate, child),
+                                      daemon=True)
+    process.start()
+    port = parent.recv()
+    return process, f"http://127.0.0.1:{port}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100, help="calls per method and mode")
+    parser.add_argument("--export-calls", type=int, default=10, help="calls for export_transactions")
+    parser.add_argument("--concurrency", type=int, default=8, help="workers for threaded/async modes")
+    parser.add_argument("--latency", type=float, default=0.002, help="server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.001, help="+/- latency jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--methods", nargs="+", help="subset of Transaction methods")
+    parser.add_argument("--alloc-samples", type=int, default=20, help="calls traced for allocations")
+    parser.add_argument("--output", default="bench_results.json", help="machine-readable results file")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    parser.add_argument("--fail-threshold", type=float, help="exit 1 if a regression exceeds this many percent")
+    args = parser.parse_args(argv)
+
+    process, base_url = start_server(args.latency, args.jitter, args.error_rate)
+    try:
+        results = run_benchmarks(base_url, args.modes, args.methods, args.calls, args.concurrency,
+                                 args.alloc_samples, args.export_calls)
+    finally:
+        process.terminate()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"{'mode':<11} {'method':<26} {'calls/s':>9} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} "
+          f"{'cpu ms':>7} {'alloc B':>9} {'conns':>6} {'errors':>6}")
+    for row in results:
+        print(f"{row['mode']:<11} {row['method']:<26} {row['throughput']:>9} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+              f"{row['p99_ms']:>8} {row['cpu_ms_per_call']:>7} {str(row['alloc_bytes_per_call']):>9} "
+              f"{row['server_connections']:>6} {row['errors']:>6}")
+    print(f"\nresults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressed = compare(results, json.load(file)["results"], args.fail_threshold or float("inf"))
+        if regressed and args.fail_threshold is not None:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
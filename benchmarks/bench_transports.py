@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Compare the requests (HTTP/1.1) and HTTP/2 transports under concurrent calls.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_transports --concurrency 1 8 32 64 --calls 400 --latency 0.02
+
+For each transport and each level N, N threads share one Transaction and
+call ``--method``; every row reports throughput, p50/p95/p99 latency and the
+number of TCP connections the fake server accepted. The HTTP/1.1 pool opens
+up to N sockets, HTTP/2 multiplexes the same calls over one.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.bench_transaction import (API_KEY, method_calls, run_threaded, server_stats, start_server,
+                                          summarize)
+from benchmarks.fake_paystack import point_at
+from paystackpyAPI.transaction import Transaction
+from paystackpyAPI.transports import TRANSPORTS
+
+LEVELS = (1, 8, 32)
+
+
+def make_client(base_url: str, transport: str, concurrency: int) -> Transaction:
+    if transport == "http2":
+        # The fake server is cleartext, so skip ALPN and speak HTTP/2 directly.
+        backend = TRANSPORTS["http2"](headers={"Authorization": f"Bearer {API_KEY}"}, prior_knowledge=True,
+                                      max_connections=concurrency)
+        client = Transaction(API_KEY, transport=backend, coalesce=False)
+    else:
+        client = Transaction(API_KEY, pool_maxsize=concurrency, coalesce=False)
+    return point_at(client, base_url)
+
+
+def run_benchmarks(base_url: str, transports=tuple(TRANSPORTS), levels=LEVELS, calls: int = 200,
+                   method: str = "verify_transaction") -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as export_dir:
+        fn = method_calls(export_dir)[method]
+        for transport in transports:
+            for concurrency in levels:
+                try:
+                    client = make_client(base_url, transport, concurrency)
+                except ImportError as error:
+                    print(f"skipping {transport}: {error}", file=sys.stderr)
+                    break
+                server_stats(base_url, reset=True)
+                try:
+                    started = time.perf_counter()
+                    raw = run_threaded(fn, client, calls, concurrency)
+                    wall = time.perf_counter() - started
+                    connections = server_stats(base_url)["connections"]
+                finally:
+                    client.close()
+                row = summarize("threaded", method, calls, wall, raw, connections, None)
+                row.update(transport=transport, concurrency=concurrency)
+                results.append(row)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="calls per transport and level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(LEVELS), help="threads per run")
+    parser.add_argument("--transports", nargs="+", choices=list(TRANSPORTS), default=list(TRANSPORTS))
+    parser.add_argument("--method", default="verify_transaction", help="Transaction method to call")
+    parser.add_argument("--latency", type=float, default=0.01, help="server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.002, help="+/- latency jitter in seconds")
+    parser.add_argument("--output", help="machine-readable results file")
+    args = parser.parse_args(argv)
+
+    process, base_url = start_server(args.latency, args.jitter, 0.0)
+    try:
+        results = run_benchmarks(base_url, args.transports, args.concurrency, args.calls, args.method)
+    finally:
+        process.terminate()
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"params": vars(args), "results": results}, file, indent=2)
+
+    print(f"{'transport':<10} {'threads':>7} {'calls/s':>9} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} "
+          f"{'conns':>6} {'errors':>6}")
+    for row in results:
+        print(f"{row['transport']:<10} {row['concurrency']:>7} {row['throughput']:>9} {row['p50_ms']:>8} "
+              f"{row['p95_ms']:>8} {row['p99_ms']:>8} {row['server_connections']:>6} {row['errors']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Measure webhook processing throughput (events per second).
+
+Run from the repository root::
+
+    python -m benchmarks.bench_webhooks --events 50000 --senders 8 --duplicates 0.1
+
+Signed ``charge.success`` deliveries, a fraction of them redeliveries, are
+pushed through the WSGI and ASGI adapters in-process (no sockets), so the
+numbers cover signature verification, decoding, deduplication, queueing
+and dispatch to a no-op handler.
+"""
+import argparse
+import asyncio
+import io
+import json
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.fake_paystack import fake_transaction
+from paystackpyAPI.webhooks import (AsyncWebhookProcessor, WebhookProcessor, asgi_app, compute_signature,
+                                    wsgi_app)
+
+SECRET = "sk_test_benchmark"
+MODES = ("wsgi", "asgi")
+
+
+def make_deliveries(events: int, duplicates: float) -> List[tuple]:
+    """``(body, signature)`` pairs; about ``duplicates`` of them repeat an earlier event."""
+    deliveries = []
+    for i in range(events):
+        if deliveries and random.random() < duplicates:
+            deliveries.append(random.choice(deliveries))
+            continue
+        body = json.dumps({"event": "charge.success", "data": fake_transaction(i + 1)}).encode()
+        deliveries.append((body, compute_signature(SECRET, body)))
+    return deliveries
+
+
+def run_wsgi(deliveries: List[tuple], senders: int, workers: int) -> Dict:
+    processor = WebhookProcessor(SECRET, workers=workers, queue_size=len(deliveries))
+    processor.on("*", lambda event: event.transaction.reference)
+    app = wsgi_app(processor)
+
+    def deliver(delivery):
+        body, signature = delivery
+        environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body),
+                   "HTTP_X_PAYSTACK_SIGNATURE": signature}
+        app(environ, lambda status, headers: None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=senders) as executor:
+        list(executor.map(deliver, deliveries, chunksize=256))
+    processor.join()
+    wall = time.perf_counter() - started
+    processor.close()
+    return {"wall": wall, **processor.stats()}
+
+
+def run_asgi(deliveries: List[tuple], senders: int, workers: int) -> Dict:
+    async def main():
+        processor = AsyncWebhookProcessor(SECRET, workers=workers, queue_size=len(deliveries))
+        processor.on("*", lambda event: event.transaction.reference)
+        app = asgi_app(processor)
+
+        async def deliver(body, signature):
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            async def send(message):
+                pass
+            scope = {"type": "http", "method": "POST", "headers": [(b"x-paystack-signature", signature.encode())]}
+            await app(scope, receive, send)
+
+        async def sender(chunk):
+            for body, signature in chunk:
+                await deliver(body, signature)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(sender(deliveries[i::senders]) for i in range(senders)))
+        await processor.join()
+        wall = time.perf_counter() - started
+        await processor.aclose()
+        return {"wall": wall, **processor.stats()}
+    return asyncio.run(main())
+
+
+def run_benchmarks(events: int = 10000, senders: int = 8, workers: int = 4, duplicates: float = 0.1,
+                   modes=MODES) -> List[Dict]:
+    deliveries = make_deliveries(events, duplicates)
+    results = []
+    for mode in modes:
+        stats = (run_wsgi if mode == "wsgi" else run_asgi)(deliveries, senders, workers)
+        wall = stats.pop("wall")
+        results.append({"mode": mode, "events": events, "wall_s": round(wall, 4),
+                        "events_per_s": round(events / wall, 1) if wall else None,
+                        "us_per_event": round(wall / events * 1e6, 2) if events else None, **stats})
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="deliveries to process")
+    parser.add_argument("--senders", type=int, default=8, help="concurrent delivering threads/tasks")
+    parser.add_argument("--workers", type=int, default=4, help="handler workers")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="fraction of redeliveries")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--output", help="write machine-readable results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.events, args.senders, args.workers, args.duplicates, args.modes)
+    print(f"{'mode':<6} {'events/s':>10} {'us/event':>9} {'dispatched':>11} {'duplicates':>11}")
+    for row in results:
+        print(f"{row['mode']:<6} {row['events_per_s']:>10} {row['us_per_event']:>9} {row['dispatched']:>11} "
+              f"{row['duplicates']:>11}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                                "python": platform.python_version(), "params": vars(args)},
+                       "results": results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+"""Local stand-in for api.paystack.co used by the benchmarks"""
+import io
+import json
+import random
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+TRANSACTION_COUNT = 1000
+EXPORT_ROWS = 2000
+# Cleartext HTTP/2 clients with prior knowledge open with this; anything else is HTTP/1.1.
+HTTP2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+def fake_transaction(transaction_id: int, reference: Optional[str] = None) -> dict:
+    return {
+        "id": transaction_id,
+        "reference": reference or f"ref-{transaction_id}",
+        "status": "success" if transaction_id % 10 else "failed",
+        "amount": 5000 * (1 + transaction_id % 7),
+        "currency": "NGN",
+        "channel": "card" if transaction_id % 3 else "bank",
+        "paid_at": "2023-11-01T10:00:00.000Z",
+        "customer": {"id": transaction_id % 50, "email": f"customer{transaction_id % 50}@example.com"},
+        "authorization": {"authorization_code": f"AUTH_{transaction_id:08d}", "last4": "4081", "reusable": True},
+    }
+
+
+class FakePaystackHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise delayed ACKs add ~40ms per response.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    ROUTES = [
+        ("POST", re.compile(r"/transaction/initialize$"), "initialize"),
+        ("POST", re.compile(r"/transaction/charge_authorization$"), "charge_authorization"),
+        ("GET", re.compile(r"/transaction/verify/(?P<key>[^/]+)$"), "verify"),
+        ("GET", re.compile(r"/transaction/timeline/(?P<key>[^/]+)$"), "timeline"),
+        ("GET", re.compile(r"/transaction/totals$"), "totals"),
+        ("GET", re.compile(r"/transaction/export$"), "export"),
+        ("GET", re.compile(r"/exports/(?P<key>[^/]+)\.csv$"), "export_file"),
+        ("GET", re.compile(r"/transaction/(?P<key>\d+)$"), "fetch"),
+        ("GET", re.compile(r"/transaction$"), "list"),
+    ]
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.counted = True
+        with self.server.stats_lock:
+            self.server.connections += 1
+
+    def handle(self):
+        if self._is_http2():
+            self.handle_http2()
+        else:
+            super().handle()
+
+    def _is_http2(self) -> bool:
+        while True:
+            data = self.connection.recv(len(HTTP2_PREFACE), socket.MSG_PEEK)
+            if not data or not HTTP2_PREFACE.startswith(data):
+                return False
+            if len(data) == len(HTTP2_PREFACE):
+                return True
+            time.sleep(0.001)
+
+    def handle_http2(self) -> None:
+        """
+        Serve one cleartext HTTP/2 connection (needs ``h2``). Streams are
+        answered concurrently on a thread pool, through the same routes.
+        """
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False,
+                                                                          header_encoding="utf-8"))
+        connection.initiate_connection()
+        lock = threading.Lock()
+        streams: Dict[int, list] = {}
+        unsent: Dict[int, bytes] = {}
+        self.connection.sendall(connection.data_to_send())
+        with ThreadPoolExecutor(max_workers=128, thread_name_prefix="fake-paystack-h2") as executor:
+            while True:
+                try:
+                    data = self.connection.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with lock:
+                    events = connection.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            streams[event.stream_id] = [dict(event.headers), bytearray()]
+                        elif isinstance(event, h2.events.DataReceived):
+                            streams[event.stream_id][1] += event.data
+                            connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, body = streams.pop(event.stream_id)
+                            executor.submit(self._answer_stream, connection, lock, unsent, event.stream_id,
+                                            headers, bytes(body))
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            self._send_unsent(connection, unsent)
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    self.connection.sendall(connection.data_to_send())
+
+    def _answer_stream(self, connection, lock, unsent: Dict[int, bytes], stream_id: int, headers: Dict,
+                       body: bytes) -> None:
+        exchange = Http2Exchange(self.server, headers, body)
+        exchange.dispatch(headers[":method"])
+        status, content_type, data = exchange.response
+        with lock:
+            try:
+                connection.send_headers(stream_id, [(":status", str(status)), ("content-type", content_type),
+                                                    ("content-length", str(len(data)))])
+                unsent[stream_id] = data
+                self._send_unsent(connection, unsent)
+                self.connection.sendall(connection.data_to_send())
+            except Exception:
+                unsent.pop(stream_id, None)
+
+    @staticmethod
+    def _send_unsent(connection, unsent: Dict[int, bytes]) -> None:
+        """Send as much of each pending body as the flow-control windows allow."""
+        import h2.exceptions
+
+        for stream_id, data in list(unsent.items()):
+            try:
+                while data:
+                    size = min(connection.local_flow_control_window(stream_id),
+                               connection.max_outbound_frame_size, len(data))
+                    if size <= 0:
+                        break
+                    connection.send_data(stream_id, data[:size])
+                    data = data[size:]
+                if data:
+                    unsent[stream_id] = data
+                else:
+                    connection.end_stream(stream_id)
+                    del unsent[stream_id]
+            except h2.exceptions.StreamClosedError:
+                del unsent[stream_id]
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method: str) -> None:
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        if parts.path == "/__stats":
+            # Control endpoint, lets a benchmark read counters from a server subprocess.
+            # Its own connection is not part of the measurement.
+            if self.counted:
+                self.counted = False
+                with server.stats_lock:
+                    server.connections -= 1
+            if method == "POST":
+                server.reset_stats()
+            with server.stats_lock:
+                return self.send_json(200, {"connections": server.connections, "requests": server.requests})
+        with server.stats_lock:
+            server.requests += 1
+        delay = server.latency + random.uniform(-server.jitter, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(parts.path)
+            if route_method == method and match:
+                break
+        else:
+            return self.send_json(404, {"status": False, "message": "Not found"})
+        if name != "export_file" and not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self.send_json(401, {"status": False, "message": "Invalid key"})
+        if name != "export_file" and random.random() < server.error_rate:
+            return self.send_json(500, {"status": False, "message": "Simulated upstream error"})
+        getattr(self, f"route_{name}")(match.groupdict().get("key"), query, body)
+
+    def send_json(self, status: int, payload: dict) -> None:
+        self.send_bytes(status, json.dumps(payload).encode(), "application/json")
+
+    def send_bytes(self, status: int, data: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def route_initialize(self, key, query, body):
+        reference = body.get("reference") or f"ref-{random.getrandbits(48):x}"
+        self.send_json(200, {"status": True, "message": "Authorization URL created", "data": {
+            "authorization_url": f"https://checkout.paystack.com/{reference}",
+            "access_code": reference, "reference": reference}})
+
+    def route_charge_authorization(self, key, query, body):
+        data = fake_transaction(random.randint(1, TRANSACTION_COUNT), body.get("reference"))
+        self.send_json(200, {"status": True, "message": "Charge attempted", "data": data})
+
+    def route_verify(self, key, query, body):
+        transaction_id = int(key.rsplit("-", 1)[-1]) if key.rsplit("-", 1)[-1].isdigit() else 1
+        self.send_json(200, {"status": True, "message": "Verification successful",
+                             "data": fake_transaction(transaction_id, key)})
+
+    def route_fetch(self, key, query, body):
+        self.send_json(200, {"status": True, "message": "Transaction retrieved", "data": fake_transaction(int(key))})
+
+    def route_timeline(self, key, query, body):
+        self.send_json(200, {"status": True, "message": "Timeline retrieved", "data": {
+            "time_spent": 9, "attempts": 1, "success": True, "history": [
+                {"type": "action", "message": "Attempted to pay", "time": 1},
+                {"type": "success", "message": "Successfully paid", "time": 9}]}})
+
+    def route_list(self, key, query, body):
+        per_page = int(query.get("perPage", 50))
+        page = int(query.get("page", 1))
+        first = (page - 1) * per_page + 1
+        ids = range(first, min(first + per_page, TRANSACTION_COUNT + 1))
+        self.send_json(200, {"status": True, "message": "Transactions retrieved",
+                             "data": [fake_transaction(i) for i in ids],
+                             "meta": {"total": TRANSACTION_COUNT, "perPage": per_page, "page": page,
+                                      "pageCount": -(-TRANSACTION_COUNT // per_page)}})
+
+    def route_totals(self, key, query, body):
+        self.send_json(200, {"status": True, "message": "Transaction totals", "data": {
+            "total_transactions": TRANSACTION_COUNT, "total_volume": 25000000,
+            "total_volume_by_currency": [{"currency": "NGN", "amount": 25000000}]}})
+
+    def route_export(self, key, query, body):
+        page = query.get("page", "1")
+        host = self.headers.get("Host")
+        self.send_json(200, {"status": True, "message": "Export successful",
+                             "data": {"path": f"http://{host}/exports/page-{page}.csv"}})
+
+    def route_export_file(self, key, query, body):
+        page = int(key.rsplit("-", 1)[-1])
+        lines = ["Id,Reference,Status,Channel,Currency,Amount,Paid At"]
+        for i in range((page - 1) * EXPORT_ROWS + 1, page * EXPORT_ROWS + 1):
+            transaction = fake_transaction(i)
+            lines.append(f"{i},{transaction['reference']},{transaction['status']},{transaction['channel']},"
+                         f"NGN,{transaction['amount'] / 100:.2f},{transaction['paid_at']}")
+        self.send_bytes(200, ("\n".join(lines) + "\n").encode(), "text/csv")
+
+
+class Http2Exchange(FakePaystackHandler):
+    """One HTTP/2 stream run through the HTTP/1.1 routes; the response is captured, not written."""
+
+    def __init__(self, server, headers: Dict[str, str], body: bytes) -> None:
+        self.server = server
+        self.path = headers[":path"]
+        self.headers = Message()
+        for name, value in headers.items():
+            if not name.startswith(":"):
+                self.headers[name] = value
+        self.headers["Host"] = headers.get(":authority", "")
+        self.headers.replace_header("Content-Length", str(len(body))) if "Content-Length" in self.headers \
+            else self.headers.add_header("Content-Length", str(len(body)))
+        self.rfile = io.BytesIO(body)
+        self.counted = False
+        self.response = None
+
+    def send_bytes(self, status: int, data: bytes, content_type: str) -> None:
+        self.response = (status, content_type, data)
+
+
+class FakePaystackServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering every Transaction endpoint with canned data.
+
+    ``latency`` (+/- ``jitter``) seconds are slept before each response and
+    ``error_rate`` of API responses are 500s. ``connections`` and ``requests``
+    count accepted TCP connections and handled requests.
+
+        with FakePaystackServer(latency=0.005) as server:
+            transaction = server.client(api_key="sk_test_bench")
+    """
+    daemon_threads = True
+    # The default backlog of 5 drops SYNs under concurrency and adds 1s retransmits.
+    request_queue_size = 1024
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0) -> None:
+        super().__init__((host, port), FakePaystackHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.connections = 0
+        self.requests = 0
+        self.stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakePaystackServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-paystack", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakePaystackServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self.stats_lock:
+            self.connections = 0
+            self.requests = 0
+
+
+def point_at(client, base_url: str):
+    """Rewrite a Transaction/AsyncTransaction's endpoint URLs to ``base_url``."""
+    for name, value in list(vars(client).items()):
+        if name.endswith("_url") and isinstance(value, str) and value.startswith("https://api.paystack.co"):
+            setattr(client, name, base_url + value[len("https://api.paystack.co"):])
+    client.BASE_URL = base_url
+    return client
+
+
+def serve(host: str, port: int, latency: float, jitter: float, error_rate: float, ready=None) -> None:
+    """Run a server in the foreground (target for a benchmark subprocess)."""
+    server = FakePaystackServer(host, port, latency, jitter, error_rate)
+    if ready is not None:
+        ready.send(server.server_address[1])
+    server.serve_forever()
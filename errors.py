@@ -15,3 +15,7 @@ class APIError(PaystackError):
         self.status_code = status_code
         self.error_message = error_message
         super().__init__(self.error_message)
+
+
+class CircuitOpenError(APIError):
+    """Raised without calling Paystack while the client's circuit breaker is open."""
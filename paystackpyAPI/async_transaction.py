@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+"""Asyncio counterpart of :class:`paystackpyAPI.transaction.Transaction`"""
+from .base import AsyncPaystackAPI
+from .cache import ResponseCache
+from .endpoints import TRANSACTION_ENDPOINTS, async_endpoint_method
+from .models import PaystackResponse
+from .sharding import range_params
+from .singleflight import AsyncSingleFlight
+from .transaction import BulkResult, Transaction
+from typing import AsyncIterator, Callable, Dict, Iterable, Optional, Union
+import asyncio
+import itertools
+import os
+import time
+from errors import APIError
+
+
+class AsyncTransaction(AsyncPaystackAPI):
+    """
+    Same surface as :class:`Transaction`, but every method is a coroutine
+    running on a pooled ``httpx.AsyncClient``::
+
+        async with AsyncTransaction(api_key) as transaction:
+            results = await asyncio.gather(*(transaction.verify_transaction(ref) for ref in refs))
+    """
+    INITIALIZATION_OPTIONAL_PARAMS = Transaction.INITIALIZATION_OPTIONAL_PARAMS
+    TRANSACTION_LIST_OPTIONAL_PARAMS = Transaction.TRANSACTION_LIST_OPTIONAL_PARAMS
+    CHARGE_AUTHORIZATION_OPTIONAL_PARAMS = Transaction.CHARGE_AUTHORIZATION_OPTIONAL_PARAMS
+    EXPORT_OPTIONAL_PARAMS = Transaction.EXPORT_OPTIONAL_PARAMS
+
+    def __init__(self, api_key: str, cache: Optional[ResponseCache] = None, coalesce: bool = True, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.cache = cache
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self.paystack_initialization_url = "https://api.paystack.co/transaction/initialize"
+        self.paystack_verification_url = "https://api.paystack.co/transaction/verify"
+        self.list_transaction_url = "https://api.paystack.co/transaction"
+        self.fetch_transaction_url = "https://api.paystack.co/transaction"
+        self.charge_authorization_url = "https://api.paystack.co/transaction/charge_authorization"
+        self.transaction_timeline_url = "https://api.paystack.co/transaction/timeline"
+        self.transaction_totals_url = "https://api.paystack.co/transaction/totals"
+        self.export_transactions_url = "https://api.paystack.co/transaction/export"
+
+    @staticmethod
+    def _handle_response(response, message: str) -> PaystackResponse:
+        if response.status_code == 200:
+            return PaystackResponse.from_http(response, message)
+        raise APIError(response.status_code, response.text)
+
+    async def _coalesced_get(self, url: str, timeout: Optional[float] = None):
+        """GET ``url``, sharing the request (and the first caller's ``timeout``) with concurrent callers."""
+        if self._inflight is None:
+            return await self._request("GET", url, timeout=timeout)
+        return await self._inflight.do(url, lambda: self._request("GET", url, timeout=timeout))
+
+    initialize_transaction = async_endpoint_method(TRANSACTION_ENDPOINTS["initialize_transaction"])
+    verify_transaction = async_endpoint_method(TRANSACTION_ENDPOINTS["verify_transaction"])
+    list_transactions = async_endpoint_method(TRANSACTION_ENDPOINTS["list_transactions"])
+    fetch_transaction = async_endpoint_method(TRANSACTION_ENDPOINTS["fetch_transaction"])
+    charge_authorization = async_endpoint_method(TRANSACTION_ENDPOINTS["charge_authorization"])
+    show_transaction_timeline = async_endpoint_method(TRANSACTION_ENDPOINTS["show_transaction_timeline"])
+
+    async def _bulk_verify_one(self, reference: Union[int, str]) -> BulkResult:
+        import httpx
+
+        try:
+            return BulkResult(reference, await self.verify_transaction(reference), None)
+        except APIError as error:
+            return BulkResult(reference, None, error)
+        except httpx.HTTPError as err:
+            return BulkResult(reference, None, APIError(500, f"An error occurred: {err}"))
+
+    async def verify_transactions(self, references: Iterable[Union[int, str]],
+                                  concurrency: int = 100) -> AsyncIterator[BulkResult]:
+        """
+        Verify many transactions concurrently, at most ``concurrency`` at a time.
+
+        See :meth:`Transaction.verify_transactions`; results are yielded as they complete.
+        """
+        references = iter(references)
+        pending = {asyncio.ensure_future(self._bulk_verify_one(reference))
+                   for reference in itertools.islice(references, concurrency)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for reference in itertools.islice(references, len(done)):
+                    pending.add(asyncio.ensure_future(self._bulk_verify_one(reference)))
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_transactions(self, per_page: int = 50, **kwargs: Dict) -> AsyncIterator[Dict]:
+        """
+        Lazily yield every transaction matching the filters, across all pages.
+
+        See :meth:`Transaction.iter_transactions`; the next page is fetched in a
+        background task while the current one is consumed.
+        """
+        page = int(kwargs.pop("page", 1))
+        kwargs.pop("perPage", None)
+
+        async def fetch(page_number):
+            response = await self.list_transactions(perPage=per_page, page=page_number, **kwargs)
+            return response["response_from_api"]
+
+        body = await fetch(page)
+        task = None
+        try:
+            while True:
+                data = body.get("data") or []
+                has_next = bool(data) and Transaction._has_next_page(body.get("meta") or {}, page, len(data), per_page)
+                task = asyncio.ensure_future(fetch(page + 1)) if has_next else None
+                for transaction in data:
+                    yield transaction
+                if task is None:
+                    return
+                page += 1
+                body = await task
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def get_total_transactions(self, per_page=50, page=1, from_date=None, to_date=None,
+                                     timeout=None) -> PaystackResponse:
+        """
+        Retrieve the total amount received on your account based on specified parameters.
+
+        See :meth:`Transaction.get_total_transactions`.
+        """
+        if not self.api_key:
+            raise APIError(401, "Invalid API Key")
+
+        params = {
+            'perPage': per_page,
+            'page': page,
+            **range_params(from_date, to_date)
+        }
+        response = await self._request("GET", self.transaction_totals_url, params=params, timeout=timeout)
+        return self._handle_response(response, "Transaction totals retrieved successfully")
+
+    async def download_csv(self, url, output_filename='exported_file.csv', chunk_size=Transaction.DOWNLOAD_CHUNK_SIZE,
+                           timeout=Transaction.DOWNLOAD_TIMEOUT, max_resumes=3,
+                           progress_callback: Optional[Callable[[int, Optional[int], float], None]] = None) -> str:
+        """
+        Stream an exported file to disk in fixed-size chunks.
+
+        See :meth:`Transaction.download_csv`: writes through a ``.part`` file,
+        resumes dropped connections with Range requests (an earlier call's
+        ``.part`` only for the same ``url`` and an unchanged file) and reports
+        progress through ``progress_callback``.
+        """
+        import httpx
+
+        connect_timeout, read_timeout = timeout
+        part_filename = f"{output_filename}.part"
+        offset, validator = Transaction._resume_state(part_filename, url)
+        started = time.monotonic()
+        received = 0
+        resumes = 0
+        while True:
+            request = self.client.build_request("GET", url, timeout=httpx.Timeout(read_timeout, connect=connect_timeout))
+            # The export lives on a third-party host; never send it our secret key.
+            del request.headers['Authorization']
+            if offset:
+                request.headers['Range'] = f'bytes={offset}-'
+                if validator:
+                    request.headers['If-Range'] = validator
+            try:
+                response = await self.client.send(request, stream=True)
+                try:
+                    if response.status_code == 416 and offset:
+                        # Nothing left to fetch: the partial file is already complete.
+                        break
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        # Range ignored or the file changed (If-Range), start over.
+                        offset = 0
+                    if not offset:
+                        validator = Transaction._validator(response.headers)
+                        Transaction._save_resume_state(part_filename, url, validator)
+                    total = Transaction._content_total(response, offset)
+                    with open(part_filename, 'ab' if offset else 'wb') as file:
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            file.write(chunk)
+                            offset += len(chunk)
+                            received += len(chunk)
+                            if progress_callback:
+                                elapsed = time.monotonic() - started
+                                progress_callback(offset, total, received / elapsed if elapsed else 0.0)
+                finally:
+                    await response.aclose()
+                if total is None or offset >= total:
+                    break
+                raise httpx.RemoteProtocolError(f"Connection closed after {offset} of {total} bytes")
+            except httpx.HTTPStatusError as errh:
+                raise APIError(errh.response.status_code, f"HTTP Error: {errh}")
+            except (httpx.TransportError, httpx.StreamError):
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+
+        os.replace(part_filename, output_filename)
+        os.remove(f"{part_filename}.json")
+        return output_filename
+
+    async def export_transactions(self, per_page=50, page=1, filename="export.csv", timeout=None, **kwargs) -> Dict:
+        """
+        initiate the export, and download the CSV file.
+
+        See :meth:`Transaction.export_transactions`.
+        """
+        import httpx
+
+        optional_kwargs = {key: value for key, value in kwargs.items() if key in self.EXPORT_OPTIONAL_PARAMS}
+        if not self.api_key:
+            raise APIError(401, "Invalid API key")
+
+        params = {
+            'perPage': per_page,
+            'page': page,
+            **optional_kwargs
+        }
+        try:
+            response = await self._request("GET", self.export_transactions_url, params=params, timeout=timeout)
+            if response.status_code != 200:
+                raise APIError(response.status_code, response.text)
+            url_to_visit = response.json()['data']['path']
+            await self.download_csv(url_to_visit, output_filename=filename)
+        except httpx.TimeoutException as errt:
+            raise APIError(500, f"Timeout Error: {errt}")
+        except httpx.ConnectError as errc:
+            raise APIError(500, f"Error Connecting: {errc}")
+        except httpx.HTTPError as err:
+            raise APIError(500, f"An error occurred: {err}")
+
+        return {
+            "status_code": response.status_code,
+            "message": f"Transactions exported successfully to {filename or url_to_visit}",
+            "data": {
+                "exported_file": filename or url_to_visit
+            }
+        }
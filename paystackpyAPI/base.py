@@ -1,5 +1,493 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Union
+
+import requests
+
+from .metrics import MetricsSink, endpoint_name
+from .models import loads
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, Deadline, RetryPolicy
+from .tracing import HttpxTraceRecorder, RequestHooks, RequestTiming, set_current_timing
+from .transports import TRANSPORTS, RequestsTransport, Transport, build_session  # noqa: F401 (re-export)
+
 
 class PaystackAPI:
-    
-    def __init__(self, api_key: str) -> None:
+    """
+    Base class for every Paystack resource.
+
+    Owns a connection-pooled :class:`Transport` (by default a ``requests.Session``)
+    so that all calls made by a client reuse keep-alive connections to
+    api.paystack.co instead of paying a fresh TCP+TLS handshake per request.
+    The transport is built on first use and may be shared across threads.
+
+    A client may be created at import time in a prefork server (gunicorn,
+    uwsgi) or before ``multiprocessing`` forks: a process that finds state
+    created by another PID drops it, without closing the parent's sockets,
+    and builds its own on the next call. :meth:`close` (or leaving a
+    ``with`` block) closes the pooled connections; the client stays usable
+    and reconnects lazily.
+    """
+    BASE_URL = "https://api.paystack.co"
+    DEFAULT_TIMEOUT = 30.0
+
+    def __init__(self, api_key: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, keep_alive: bool = True, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None, metrics: Optional[MetricsSink] = None,
+                 hooks: Optional[RequestHooks] = None, session: Optional[requests.Session] = None,
+                 max_concurrency: Optional[int] = None, transport: Union[str, Transport] = "requests") -> None:
+        """
+        :param api_key: Paystack secret key.
+        :param pool_connections: Number of per-host connection pools to cache.
+        :param pool_maxsize: Maximum number of connections kept open per host.
+        :param pool_block: Block when the per-host pool is exhausted instead of
+                           opening (and then discarding) extra connections.
+        :param keep_alive: Reuse connections between requests.
+        :param timeout: Default deadline of a call in seconds, retries included; calls
+                        take a ``timeout=`` override. ``None`` waits forever.
+        :param retry: Optional :class:`RetryPolicy` for 429/5xx/connection errors.
+        :param circuit_breaker: Optional :class:`CircuitBreaker` to fail fast while Paystack is degraded.
+        :param rate_limiter: Optional :class:`RateLimiter`; calls to Paystack wait for a token.
+        :param metrics: Optional :class:`MetricsSink` receiving per-endpoint metrics.
+        :param hooks: Optional :class:`RequestHooks` receiving a phase timing breakdown per attempt.
+        :param session: Existing session to send through, e.g. one shared by many API keys.
+                        The ``Authorization`` header is then sent per request, and the
+                        pool options above are ignored.
+        :param max_concurrency: Maximum number of requests of this client in flight at once.
+        :param transport: ``"requests"`` (HTTP/1.1 keep-alive, default), ``"http2"`` (one
+                          multiplexed connection, see :class:`HTTP2Transport`) or a
+                          :class:`Transport` instance, which is then shared like ``session``.
+        """
+        self.api_key = api_key
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.hooks = hooks
+        self.headers = {
+            'Authorization': f'Bearer {self.api_key}',
+        }
+        if session is not None:
+            transport = RequestsTransport(session)
+        if isinstance(transport, str):
+            if transport not in TRANSPORTS:
+                raise ValueError(f"Unknown transport {transport!r}, expected one of {sorted(TRANSPORTS)}")
+            self._transport_class, self._transport = TRANSPORTS[transport], None
+        else:
+            self._transport_class, self._transport = type(transport), transport
+        self._shared_transport = self._transport is not None
+        self.max_concurrency = max_concurrency
+        self._reset_process_state()
+
+    def _reset_process_state(self) -> None:
+        """(Re)create the locks and limits that belong to the current process."""
+        self._pid = os.getpid()
+        self._transport_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency) if self.max_concurrency else None
+
+    def _after_fork(self) -> None:
+        """
+        Forget what was inherited from the parent process. Its transport is not
+        closed: the sockets are still the parent's, and shutting them down
+        (TLS close_notify) would break its connections. Locks may have been
+        held by parent threads that do not exist here, so they are replaced;
+        the cache, metrics, retry, breaker and rate limiter replace theirs as
+        soon as the child starts (see :func:`forksafe.fork_safe`).
+        """
+        self._transport = None
+        self._reset_process_state()
+
+    def _check_process(self) -> None:
+        if self._pid != os.getpid():
+            self._after_fork()
+
+    @property
+    def transport(self) -> Transport:
+        """The pooled transport shared by every call made through this client in this process."""
+        self._check_process()
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    self._transport = self._transport_class.for_client(self)
+                    # After a fork, a client that used a shared transport pools on its own from now on.
+                    self._shared_transport = False
+        return self._transport
+
+    @property
+    def session(self) -> requests.Session:
+        """The ``requests.Session`` of the transport (with ``"http2"``, the one used for downloads)."""
+        return self.transport.session
+
+    def close(self) -> None:
+        """Close the pooled connections; the next call opens new ones. A shared transport is left open."""
+        if self._shared_transport:
+            return
+        self._check_process()
+        with self._transport_lock:
+            transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(self, method: str, url: str, **kwargs: Dict) -> requests.Response:
+        """Send a single attempt through the pooled transport."""
+        self._check_process()
+        if self.rate_limiter is not None and url.startswith(self.BASE_URL):
+            self.rate_limiter.acquire(self.api_key, url)
+        if self._shared_transport:
+            # Per-request headers win over the transport's, so ``{'Authorization': None}`` still strips the key.
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if self._slots is None:
+            return self._send_now(method, url, **kwargs)
+        with self._slots:
+            return self._send_now(method, url, **kwargs)
+
+    def _send_now(self, method: str, url: str, **kwargs: Dict) -> requests.Response:
+        if self.hooks is None:
+            return self.transport.request(method, url, **kwargs)
+        return self._traced_send(method, url, **kwargs)
+
+    def _traced_send(self, method: str, url: str, **kwargs: Dict) -> requests.Response:
+        hooks = self.hooks
+        timing = RequestTiming(method, url, endpoint_name(method, url))
+        hooks.on_request_start(timing)
+        set_current_timing(timing)
+        started = time.perf_counter()
+        try:
+            response = self.transport.request(method, url, **kwargs)
+        except Exception as error:
+            timing.error = type(error).__name__
+            timing.total = time.perf_counter() - started
+            hooks.on_request_end(timing)
+            raise
+        finally:
+            set_current_timing(None)
+        received = time.perf_counter()
+        # ``elapsed`` runs from sending until the headers were parsed, including connection setup.
+        elapsed = response.elapsed.total_seconds()
+        timing.status_code = response.status_code
+        timing.ttfb = max(0.0, elapsed - (timing.dns or 0) - (timing.connect or 0) - (timing.tls or 0))
+        body = response.request.body
+        timing.bytes_out = len(body) if body else 0
+        if not kwargs.get("stream"):
+            timing.download = max(0.0, received - started - elapsed)
+            timing.bytes_in = len(response.content)
+            if 'json' in response.headers.get('Content-Type', ''):
+                _prime_json(response, timing)
+        timing.total = time.perf_counter() - started
+        hooks.on_request_end(timing)
+        return response
+
+    def _request(self, method: str, url: str, **kwargs: Dict) -> requests.Response:
+        """Send a request, recording it in the metrics sink if one is configured."""
+        metrics = self.metrics
+        if metrics is None:
+            return self._call(method, url, **kwargs)
+        endpoint = endpoint_name(method, url)
+        metrics.request_started(endpoint)
+        started = time.perf_counter()
+        try:
+            response = self._call(method, url, **kwargs)
+        except Exception as error:
+            metrics.request_finished(endpoint, time.perf_counter() - started, error=type(error).__name__)
+            raise
+        body = response.request.body
+        if kwargs.get("stream"):
+            length = response.headers.get('Content-Length', '')
+            bytes_in = int(length) if length.isdigit() else 0
+        else:
+            bytes_in = len(response.content)
+        metrics.request_finished(endpoint, time.perf_counter() - started, status_code=response.status_code,
+                                 error="APIError" if response.status_code >= 400 else None,
+                                 bytes_out=len(body) if body else 0, bytes_in=bytes_in)
+        return response
+
+    def _call(self, method: str, url: str, **kwargs: Dict) -> requests.Response:
+        """
+        Send a request, applying the deadline, circuit breaker and retry policy if configured.
+        The breaker and the retry budget only cover requests to ``BASE_URL``.
+
+        ``timeout`` (default: the client's) is the budget of the whole call in
+        seconds and is split across the attempts of a retryable call, see
+        :class:`Deadline`; a ``(connect, read)`` tuple is passed to every
+        attempt unchanged.
+        Retryable responses that run out of attempts or time are returned
+        as-is so the caller raises its usual ``APIError``; connection errors
+        are re-raised, and a spent deadline raises ``requests.exceptions.Timeout``.
+        """
+        timeout = kwargs.pop("timeout", None)
+        if timeout is None:
+            timeout = self.timeout
+        retry, breaker = self.retry, self.circuit_breaker
+        paystack = url.startswith(self.BASE_URL)
+        if not paystack:
+            # Third-party hosts (CSV exports) must not open the breaker for Paystack calls.
+            breaker = None
+        if retry is None and breaker is None:
+            return self._send(method, url, timeout=timeout, **kwargs)
+        deadline = Deadline(timeout) if isinstance(timeout, (int, float)) else None
+        if retry is not None and paystack:
+            retry.record_request()
+        # A call that can never be retried gets its whole budget in one attempt.
+        attempts = retry.max_attempts if retry is not None and retry.is_idempotent(method, kwargs) else 1
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if deadline is not None:
+                attempt_timeout = deadline.attempt_timeout(attempts - attempt)
+                if attempt_timeout is None:
+                    raise requests.exceptions.Timeout(f"Deadline of {timeout}s exceeded for {method} {url}")
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                response = self._send(method, url, timeout=attempt_timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = retry.retry_delay(method, kwargs, attempt, budget=paystack) if retry is not None else None
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    raise
+            except requests.exceptions.RequestException:
+                # Broken transfers (ChunkedEncodingError...) count against Paystack but are not retried.
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                # Whatever else ends the attempt must not leave a half-open probe taken forever.
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(response.status_code)
+                if retry is None:
+                    return response
+                delay = retry.retry_delay(method, kwargs, attempt, response.status_code,
+                                          response.headers.get('Retry-After'), budget=paystack)
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+
+def _prime_json(response, timing: RequestTiming) -> None:
+    """
+    Decode the body once to time it, and hand that result to the first consumer,
+    either ``PaystackResponse.from_http`` or a plain ``response.json()`` call.
+    """
+    started = time.perf_counter()
+    try:
+        decoded = [loads(response.content)]
+    except ValueError:
+        return
+    finally:
+        timing.decode = time.perf_counter() - started
+    original = response.json
+
+    def json_once(**kwargs):
+        return decoded.pop() if decoded and not kwargs else original(**kwargs)
+    response.json = json_once
+    response._paystack_decoded = decoded
+
+
+class AsyncPaystackAPI:
+    """
+    Base class for asyncio Paystack resources.
+
+    Owns a pooled ``httpx.AsyncClient`` so that many concurrent calls can be
+    multiplexed over a bounded set of keep-alive connections on one event loop.
+    ``httpx`` is an optional dependency: ``pip install paystackpyAPI[async]``.
+    """
+    BASE_URL = PaystackAPI.BASE_URL
+
+    def __init__(self, api_key: str, max_connections: int = 100, max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 5.0, transport=None,
+                 timeout: Optional[float] = PaystackAPI.DEFAULT_TIMEOUT, retry: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[RateLimiter] = None, metrics: Optional[MetricsSink] = None,
+                 hooks: Optional[RequestHooks] = None) -> None:
+        """
+        :param api_key: Paystack secret key.
+        :param max_connections: Maximum number of concurrent connections.
+        :param max_keepalive_connections: Maximum number of idle connections kept open.
+        :param keepalive_expiry: Seconds an idle connection is kept open.
+        :param transport: Optional ``httpx.AsyncBaseTransport`` (mainly for tests).
+        :param timeout: Default deadline of a call in seconds, retries included; calls
+                        take a ``timeout=`` override. ``None`` waits forever.
+        :param retry: Optional :class:`RetryPolicy` for 429/5xx/connection errors.
+        :param circuit_breaker: Optional :class:`CircuitBreaker` to fail fast while Paystack is degraded.
+        :param rate_limiter: Optional :class:`RateLimiter`; calls to Paystack wait for a token.
+        :param metrics: Optional :class:`MetricsSink` receiving per-endpoint metrics.
+        :param hooks: Optional :class:`RequestHooks` receiving a phase timing breakdown per attempt.
+        """
         self.api_key = api_key
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.transport = transport
+        self.timeout = timeout
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.hooks = hooks
+        self.headers = {
+            'Authorization': f'Bearer {self.api_key}',
+        }
+        self._client = None
+        self._pid = os.getpid()
+
+    def _build_client(self):
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError("AsyncTransaction requires httpx: pip install paystackpyAPI[async]") from exc
+        limits = httpx.Limits(max_connections=self.max_connections,
+                              max_keepalive_connections=self.max_keepalive_connections,
+                              keepalive_expiry=self.keepalive_expiry)
+        return httpx.AsyncClient(headers=self.headers, limits=limits, transport=self.transport)
+
+    @property
+    def client(self):
+        """The pooled async client shared by every call made through this client in this process."""
+        if self._pid != os.getpid():
+            # Inherited from the parent process, see :meth:`PaystackAPI._after_fork`.
+            self._client, self._pid = None, os.getpid()
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    async def _send(self, method: str, url: str, **kwargs: Dict):
+        """Send a single attempt through the pooled async client."""
+        if self.rate_limiter is not None and url.startswith(self.BASE_URL):
+            await self.rate_limiter.acquire_async(self.api_key, url)
+        hooks = self.hooks
+        if hooks is None:
+            return await self.client.request(method, url, **kwargs)
+        timing = RequestTiming(method, url, endpoint_name(method, url))
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions["trace"] = HttpxTraceRecorder(timing)
+        hooks.on_request_start(timing)
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, extensions=extensions, **kwargs)
+        except Exception as error:
+            timing.error = type(error).__name__
+            timing.total = time.perf_counter() - started
+            hooks.on_request_end(timing)
+            raise
+        timing.status_code = response.status_code
+        timing.bytes_out = len(response.request.content)
+        timing.bytes_in = len(response.content)
+        if 'json' in response.headers.get('Content-Type', ''):
+            _prime_json(response, timing)
+        timing.total = time.perf_counter() - started
+        hooks.on_request_end(timing)
+        return response
+
+    async def _request(self, method: str, url: str, **kwargs: Dict):
+        """Send a request, recording it in the metrics sink if one is configured."""
+        metrics = self.metrics
+        if metrics is None:
+            return await self._call(method, url, **kwargs)
+        endpoint = endpoint_name(method, url)
+        metrics.request_started(endpoint)
+        started = time.perf_counter()
+        try:
+            response = await self._call(method, url, **kwargs)
+        except Exception as error:
+            metrics.request_finished(endpoint, time.perf_counter() - started, error=type(error).__name__)
+            raise
+        metrics.request_finished(endpoint, time.perf_counter() - started, status_code=response.status_code,
+                                 error="APIError" if response.status_code >= 400 else None,
+                                 bytes_out=len(response.request.content), bytes_in=len(response.content))
+        return response
+
+    async def _call(self, method: str, url: str, **kwargs: Dict):
+        """
+        Send a request, applying the deadline, circuit breaker and retry policy if configured.
+        The breaker and the retry budget only cover requests to ``BASE_URL``.
+
+        See :meth:`PaystackAPI._call`; a spent deadline raises ``httpx.TimeoutException``.
+        """
+        timeout = kwargs.pop("timeout", None)
+        if timeout is None:
+            timeout = self.timeout
+        retry, breaker = self.retry, self.circuit_breaker
+        paystack = url.startswith(self.BASE_URL)
+        if not paystack:
+            # Third-party hosts (CSV exports) must not open the breaker for Paystack calls.
+            breaker = None
+        if retry is None and breaker is None:
+            return await self._send(method, url, timeout=timeout, **kwargs)
+        import httpx
+
+        deadline = Deadline(timeout) if isinstance(timeout, (int, float)) else None
+        if retry is not None and paystack:
+            retry.record_request()
+        # A call that can never be retried gets its whole budget in one attempt.
+        attempts = retry.max_attempts if retry is not None and retry.is_idempotent(method, kwargs) else 1
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if deadline is not None:
+                attempt_timeout = deadline.attempt_timeout(attempts - attempt)
+                if attempt_timeout is None:
+                    raise httpx.TimeoutException(f"Deadline of {timeout}s exceeded for {method} {url}")
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                response = await self._send(method, url, timeout=attempt_timeout, **kwargs)
+            except httpx.TransportError:
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = retry.retry_delay(method, kwargs, attempt, budget=paystack) if retry is not None else None
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    raise
+            except httpx.HTTPError:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(response.status_code)
+                if retry is None:
+                    return response
+                delay = retry.retry_delay(method, kwargs, attempt, response.status_code,
+                                          response.headers.get('Retry-After'), budget=paystack)
+                if delay is None or (deadline is not None and not deadline.allows(delay)):
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
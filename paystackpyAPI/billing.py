@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+"""Bulk recurring charges on top of Transaction.charge_authorization"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+
+import requests
+
+from errors import APIError
+from .models import PaystackResponse
+from .transaction import Transaction
+
+STARTED = "started"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+UNKNOWN = "unknown"
+REJECTED = "rejected"
+SKIPPED = "skipped"
+# Outcomes after which a reference must never be charged again.
+FINAL_STATES = frozenset([SUCCEEDED, FAILED])
+FAILED_TRANSACTION_STATUSES = frozenset(["failed", "reversed", "abandoned"])
+
+
+class ChargeJob(NamedTuple):
+    """One card to charge. ``amount`` is in major units, as for :meth:`Transaction.charge_authorization`."""
+    email: str
+    amount: int
+    authorization_code: str
+    reference: Optional[str] = None
+
+
+class ChargeResult(NamedTuple):
+    """
+    Outcome of one job. ``status`` is ``succeeded``, ``failed`` (declined),
+    ``unknown`` (the charge may or may not have gone through; the next run
+    reconciles it), ``rejected`` (refused before it was processed, e.g. a bad
+    API key; the next run sends it again) or ``skipped`` (already final in
+    the journal, or a duplicate reference).
+    """
+    reference: str
+    job: ChargeJob
+    status: str
+    response: Optional[PaystackResponse]
+    error: Optional[APIError]
+
+
+def charge_reference(job: ChargeJob, cycle: str, prefix: str = "rc") -> str:
+    """
+    Deterministic reference for ``job`` in billing ``cycle``.
+
+    The same job in the same cycle always maps to the same reference, so a
+    repeated charge is rejected by Paystack as a duplicate instead of
+    billing the customer twice. An explicit ``job.reference`` wins.
+    """
+    if job.reference:
+        return job.reference
+    key = "|".join([cycle, job.email.strip().lower(), job.authorization_code, str(job.amount)])
+    return f"{prefix}-{cycle}-{hashlib.sha256(key.encode()).hexdigest()[:24]}"
+
+
+class ChargeJournal:
+    """
+    Append-only JSON-lines checkpoint log, one line per state change.
+
+    A reference is journalled as ``started`` (flushed and fsynced) before its
+    charge is sent and again with its outcome afterwards, so after a crash
+    every reference is known to be finished, never sent, or in doubt.
+    """
+
+    def __init__(self, path: str, fsync: bool = True) -> None:
+        self.path = path
+        self.fsync = fsync
+        self._states: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        torn = self._load()
+        self._file = open(path, "a", encoding="utf-8")
+        if torn:
+            self._file.write("\n")
+
+    def _load(self) -> bool:
+        """Replay the journal; returns True if it ends in a torn (unterminated) line."""
+        if not os.path.exists(self.path):
+            return False
+        line = ""
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write.
+                    continue
+                self._states[entry["reference"]] = entry["state"]
+        return bool(line) and not line.endswith("\n")
+
+    def state(self, reference: str) -> Optional[str]:
+        with self._lock:
+            return self._states.get(reference)
+
+    def record(self, reference: str, state: str, status_code: Optional[int] = None,
+               error: Optional[str] = None) -> None:
+        entry = {"reference": reference, "state": state, "at": time.time()}
+        if status_code is not None:
+            entry["status_code"] = status_code
+        if error is not None:
+            entry["error"] = error
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._states[reference] = state
+
+    def counts(self) -> Dict[str, int]:
+        """Number of references in each state."""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for state in self._states.values():
+                counts[state] = counts.get(state, 0) + 1
+            return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "ChargeJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BatchCharger:
+    """
+    Charge a stream of saved cards with bounded concurrency and checkpointed resume::
+
+        with ChargeJournal("billing-2023-11.jsonl") as journal:
+            charger = BatchCharger(transaction, journal, cycle="2023-11", max_workers=20)
+            for result in charger.run(ChargeJob(email, amount, code) for email, amount, code in rows):
+                ...
+
+    Running the same jobs again with the same journal skips every charge that
+    already finished and re-sends charges that were rejected before being
+    processed (401/403). References left in doubt by a crash or a 5xx/connection
+    error are first looked up with :meth:`Transaction.verify_transaction` and
+    only charged if Paystack has never seen them. Throughput is bounded by
+    ``max_workers`` and by the transaction's ``rate_limiter``, if any.
+    """
+
+    def __init__(self, transaction: Transaction, journal: ChargeJournal, cycle: str = "",
+                 max_workers: int = 10, **charge_kwargs) -> None:
+        """
+        :param transaction: Client used to charge; size ``pool_maxsize`` to at least ``max_workers``.
+        :param journal: Checkpoint journal shared by every run of this batch.
+        :param cycle: Billing cycle label mixed into generated references (e.g. ``"2023-11"``).
+        :param max_workers: Maximum number of concurrent charges.
+        :param charge_kwargs: Extra :meth:`Transaction.charge_authorization` parameters (``currency``, ``metadata``...).
+        """
+        self.transaction = transaction
+        self.journal = journal
+        self.cycle = cycle
+        self.max_workers = max_workers
+        self.charge_kwargs = charge_kwargs
+
+    def _reconcile(self, reference: str) -> Optional[str]:
+        """Final state of an in-doubt reference, ``None`` if it was never charged, or ``unknown``."""
+        try:
+            response = self.transaction.verify_transaction(reference)
+        except APIError as error:
+            return None if error.status_code in (400, 404) else UNKNOWN
+        except requests.exceptions.RequestException:
+            return UNKNOWN
+        return self._outcome(response)
+
+    @staticmethod
+    def _outcome(response: PaystackResponse) -> str:
+        status = (response.transaction.status if response.transaction else None) or ""
+        if status == "success":
+            return SUCCEEDED
+        if status in FAILED_TRANSACTION_STATUSES:
+            return FAILED
+        return UNKNOWN
+
+    def _charge(self, job: ChargeJob, reference: str, previous: Optional[str]) -> ChargeResult:
+        if previous not in (None, REJECTED):
+            state = self._reconcile(reference)
+            if state is not None:
+                self.journal.record(reference, state, error="reconciled")
+                return ChargeResult(reference, job, state, None, None)
+        self.journal.record(reference, STARTED)
+        try:
+            response = self.transaction.charge_authorization(job.email, job.amount, job.authorization_code,
+                                                             reference=reference, **self.charge_kwargs)
+        except APIError as error:
+            # 400 is a decline of this charge; 429/5xx may have been processed;
+            # anything else (401, 403...) was refused without looking at the charge.
+            if error.status_code == 400:
+                state = FAILED
+            elif error.status_code == 429 or error.status_code >= 500:
+                state = UNKNOWN
+            else:
+                state = REJECTED
+            self.journal.record(reference, state, status_code=error.status_code)
+            return ChargeResult(reference, job, state, None, error)
+        except requests.exceptions.RequestException as err:
+            self.journal.record(reference, UNKNOWN, error=type(err).__name__)
+            return ChargeResult(reference, job, UNKNOWN, None, APIError(500, f"An error occurred: {err}"))
+        state = self._outcome(response)
+        self.journal.record(reference, state, status_code=response.status_code)
+        return ChargeResult(reference, job, state, response, None)
+
+    def run(self, jobs: Iterable[ChargeJob]) -> Iterator[ChargeResult]:
+        """
+        Charge every job, yielding results as they complete (not in input order).
+
+        Only about ``2 * max_workers`` jobs are held at once, so ``jobs`` may
+        be an arbitrarily large lazy iterable.
+        """
+        seen = set()
+
+        def submit(job: ChargeJob):
+            reference = charge_reference(job, self.cycle)
+            previous = self.journal.state(reference)
+            if reference in seen or previous in FINAL_STATES:
+                return ChargeResult(reference, job, SKIPPED, None, None)
+            seen.add(reference)
+            return executor.submit(self._charge, job, reference, previous)
+
+        jobs = iter(jobs)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="paystack-charge")
+        try:
+            pending = set()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < 2 * self.max_workers:
+                    job = next(jobs, None)
+                    if job is None:
+                        exhausted = True
+                    else:
+                        submitted = submit(job)
+                        if isinstance(submitted, ChargeResult):
+                            yield submitted
+                        else:
+                            pending.add(submitted)
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""In-process response cache for Paystack lookups"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from .forksafe import fork_safe
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU + TTL cache of raw response bodies.
+
+    Transactions in a terminal state (``success``, ``failed``, ``reversed``)
+    never change again, so their responses are kept until evicted by the LRU
+    bounds. Anything else (``ongoing``, ``pending``, ``abandoned``...) is only
+    kept for ``pending_ttl`` seconds. Bodies are stored as bytes so that the
+    memory bound is exact and callers can never mutate a cached entry.
+
+        cache = ResponseCache(max_entries=50_000, max_bytes=64 * 1024 * 1024)
+        transaction = Transaction(api_key, cache=cache)
+        ...
+        cache.stats()  # {'hits': ..., 'misses': ..., 'hit_rate': ..., ...}
+    """
+    TERMINAL_STATUSES = frozenset(["success", "failed", "reversed"])
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 32 * 1024 * 1024,
+                 pending_ttl: float = 2.0, terminal_ttl: Optional[float] = None) -> None:
+        """
+        :param max_entries: Maximum number of cached responses.
+        :param max_bytes: Maximum total size of cached bodies.
+        :param pending_ttl: Seconds to keep responses for non-terminal transactions.
+        :param terminal_ttl: Seconds to keep terminal responses (``None`` = until evicted).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.pending_ttl = pending_ttl
+        self.terminal_ttl = terminal_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        fork_safe(self, _lock=threading.Lock)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, decoded: Dict) -> Optional[float]:
+        """TTL for a decoded Paystack response, based on the transaction status."""
+        data = decoded.get("data") if isinstance(decoded, dict) else None
+        status = data.get("status") if isinstance(data, dict) else None
+        if status in self.TERMINAL_STATUSES:
+            return self.terminal_ttl
+        return self.pending_ttl
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            body, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def store(self, key: Hashable, body: bytes, decoded: Dict) -> None:
+        """Cache ``body`` under ``key`` with a TTL derived from ``decoded``."""
+        ttl = self.ttl_for(decoded)
+        if (ttl is not None and ttl <= 0) or len(body) > self.max_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (body, expires_at)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache, if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        body, _ = self._entries.pop(key)
+        self._bytes -= len(body)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size, for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
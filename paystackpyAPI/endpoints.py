@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+"""Declarative endpoint table, compiled once into request builders and client methods"""
+import inspect
+from string import Formatter
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from errors import APIError
+from .models import PaystackResponse
+
+
+class EndpointSpec(NamedTuple):
+    """
+    Description of one API call, turned into a client method by :func:`endpoint_method`.
+
+    ``url_attr`` names the client attribute holding the base URL (so it can be
+    pointed elsewhere per instance) and ``path`` is appended to it, with
+    ``{name}`` placeholders filled from required parameters. Required
+    parameters are the method's positional arguments; the ones not used in
+    the path go into the JSON body (POST) or query string (GET) together with
+    whitelisted ``optional`` keyword arguments.
+    """
+    name: str
+    method: str
+    url_attr: str
+    message: str
+    path: str = ""
+    required: Tuple[str, ...] = ()
+    optional: FrozenSet[str] = frozenset()
+    # ``(params, error message)`` checks run in order; each fails if any of its params is falsy.
+    # ``None`` checks every required parameter; ``()`` checks nothing.
+    missing: Optional[Tuple[Tuple[Tuple[str, ...], str], ...]] = None
+    # Amounts are passed in major units and sent in kobo/cents.
+    scaled: FrozenSet[str] = frozenset()
+    # ``(param, format string)`` pairs applied to the value before sending, e.g. ``("code", "AUTH_{}")``.
+    formats: Tuple[Tuple[str, str], ...] = ()
+    key_message: str = "Invalid API key"
+    # Validate parameters before checking for an API key (legacy ordering of some methods).
+    validate_first: bool = False
+    cached: bool = False
+    coalesced: bool = False
+    doc: str = ""
+
+
+class CompiledEndpoint:
+    """An :class:`EndpointSpec` with everything that does not depend on the call precomputed."""
+    __slots__ = ("spec", "method", "url_attr", "path", "required", "path_params", "body_params", "optional",
+                 "checks", "scaled", "formats", "location", "message", "key_message", "validate_first")
+
+    def __init__(self, spec: EndpointSpec) -> None:
+        self.spec = spec
+        self.method = spec.method.upper()
+        self.url_attr = spec.url_attr
+        self.path = spec.path
+        self.required = tuple(spec.required)
+        self.path_params = frozenset(field for _, field, _, _ in Formatter().parse(spec.path) if field)
+        unknown = self.path_params.difference(self.required)
+        if unknown:
+            raise ValueError(f"{spec.name}: path uses undeclared parameters {sorted(unknown)}")
+        self.body_params = tuple(name for name in self.required if name not in self.path_params)
+        self.optional = frozenset(spec.optional)
+        self.checks = spec.missing if spec.missing is not None else tuple(
+            ((name,), f"Missing required parameter: {name}") for name in self.required)
+        self.scaled = frozenset(spec.scaled)
+        self.formats = dict(spec.formats)
+        self.location = "params" if self.method == "GET" else "json"
+        if spec.coalesced and (self.method != "GET" or self.body_params or self.optional):
+            raise ValueError(f"{spec.name}: only GETs without query parameters can be coalesced")
+        self.message = spec.message
+        self.key_message = spec.key_message
+        self.validate_first = spec.validate_first
+
+    def bind(self, args: tuple, kwargs: Dict) -> Dict:
+        """Map positional/keyword arguments onto the required parameter names."""
+        if len(args) > len(self.required):
+            raise TypeError(f"{self.spec.name}() takes {len(self.required)} positional arguments "
+                            f"but {len(args)} were given")
+        values = dict(zip(self.required, args))
+        for name in self.required[len(args):]:
+            values[name] = kwargs.pop(name, None)
+        return values
+
+    def validate(self, client, values: Dict) -> None:
+        if self.validate_first:
+            self._check_params(values)
+            self._check_key(client)
+        else:
+            self._check_key(client)
+            self._check_params(values)
+
+    def _check_key(self, client) -> None:
+        if not client.api_key:
+            raise APIError(401, self.key_message)
+
+    def _check_params(self, values: Dict) -> None:
+        for names, message in self.checks:
+            for name in names:
+                if not values[name]:
+                    raise APIError(400, message)
+
+    def prepare(self, client, args: tuple, kwargs: Dict) -> Tuple[str, Dict]:
+        """Validate a call and build its URL and ``_request`` keyword arguments."""
+        values = self.bind(args, kwargs)
+        self.validate(client, values)
+        url = getattr(client, self.url_attr)
+        if self.path:
+            url += self.path.format(**values)
+        payload = {name: values[name] for name in self.body_params}
+        optional = self.optional
+        for key, value in kwargs.items():
+            # requests drops None-valued params but httpx would send them empty.
+            if key in optional and value is not None:
+                payload[key] = value
+        for name in self.scaled.intersection(payload):
+            payload[name] = payload[name] * 100
+        for name, template in self.formats.items():
+            if name in payload:
+                payload[name] = template.format(payload[name])
+        return url, ({self.location: payload} if payload or self.location == "json" else {})
+
+    def handle(self, client, url: str, response) -> PaystackResponse:
+        """Turn an HTTP response into a :class:`PaystackResponse`, or raise ``APIError``."""
+        if response.status_code != 200:
+            raise APIError(response.status_code, response.text)
+        result = PaystackResponse.from_http(response, self.message)
+        if self.spec.cached and client.cache is not None:
+            client.cache.store(url, result.content, result.body)
+        return result
+
+    def cached(self, client, url: str):
+        if not self.spec.cached or client.cache is None:
+            return None
+        body = client.cache.get(url)
+        return PaystackResponse(200, self.message, body) if body is not None else None
+
+    def signature(self) -> inspect.Signature:
+        parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        parameters += [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in self.required]
+        parameters.append(inspect.Parameter("timeout", inspect.Parameter.KEYWORD_ONLY, default=None))
+        if self.optional:
+            parameters.append(inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD))
+        return inspect.Signature(parameters, return_annotation=PaystackResponse)
+
+
+def _describe(function, endpoint: CompiledEndpoint):
+    spec = endpoint.spec
+    function.__name__ = function.__qualname__ = spec.name
+    function.__signature__ = endpoint.signature()
+    doc = spec.doc or f"``{endpoint.method} {spec.path or '/'}``."
+    if endpoint.optional:
+        doc += f"\n\nOptional parameters: {', '.join(sorted(endpoint.optional))}."
+    doc += "\n\n``timeout`` overrides the client's deadline (seconds, retries included) for this call."
+    function.__doc__ = doc
+    function.endpoint = endpoint
+    return function
+
+
+def endpoint_method(spec: EndpointSpec):
+    """Build a :class:`Transaction`-style method (``self._request``/``self._coalesced_get``) for ``spec``."""
+    endpoint = CompiledEndpoint(spec)
+    method = endpoint.method
+
+    def call(self, *args, timeout: Optional[float] = None, **kwargs) -> PaystackResponse:
+        url, request_kwargs = endpoint.prepare(self, args, kwargs)
+        hit = endpoint.cached(self, url)
+        if hit is not None:
+            return hit
+        if spec.coalesced:
+            response = self._coalesced_get(url, timeout)
+        else:
+            response = self._request(method, url, timeout=timeout, **request_kwargs)
+        return endpoint.handle(self, url, response)
+    return _describe(call, endpoint)
+
+
+def async_endpoint_method(spec: EndpointSpec):
+    """Coroutine counterpart of :func:`endpoint_method` for :class:`AsyncTransaction`."""
+    endpoint = CompiledEndpoint(spec)
+    method = endpoint.method
+
+    async def call(self, *args, timeout: Optional[float] = None, **kwargs) -> PaystackResponse:
+        url, request_kwargs = endpoint.prepare(self, args, kwargs)
+        hit = endpoint.cached(self, url)
+        if hit is not None:
+            return hit
+        if spec.coalesced:
+            response = await self._coalesced_get(url, timeout)
+        else:
+            response = await self._request(method, url, timeout=timeout, **request_kwargs)
+        return endpoint.handle(self, url, response)
+    return _describe(call, endpoint)
+
+
+TRANSACTION_ENDPOINTS = {spec.name: spec for spec in [
+    EndpointSpec(
+        name="initialize_transaction", method="POST", url_attr="paystack_initialization_url",
+        message="Transaction initialized successfully",
+        required=("email", "amount"),
+        optional=frozenset(["currency", "reference", "callback_url", "plan", "invoice_limit", "metadata",
+                            "channels", "split_code", "subaccount", "transaction_charge", "bearer"]),
+        missing=((("email", "amount"), "Missing required parameters: email and/or amount"),),
+        scaled=frozenset(["amount"]), validate_first=True,
+        doc="Initialize a Paystack transaction. ``amount`` is in major units (naira, cedis...)."),
+    EndpointSpec(
+        name="verify_transaction", method="GET", url_attr="paystack_verification_url",
+        message="Transaction details retrieved successfully",
+        path="/{reference}", required=("reference",), validate_first=True, cached=True, coalesced=True,
+        doc="Verify a Paystack transaction by reference (int or str)."),
+    EndpointSpec(
+        name="list_transactions", method="GET", url_attr="list_transaction_url",
+        message="Transactions details below",
+        optional=frozenset(["customer", "terminalid", "status", "currency", "from", "to", "amount", "perPage",
+                            "page"]),
+        key_message="Invalid API Key",
+        doc="Retrieve one page of transactions; see :meth:`iter_transactions` to walk all pages."),
+    EndpointSpec(
+        name="fetch_transaction", method="GET", url_attr="fetch_transaction_url",
+        message="Transaction Successfully fetched",
+        path="/{id}", required=("id",), missing=(), key_message="Invalid Api Key", cached=True, coalesced=True,
+        doc="Fetch the details of a transaction by id."),
+    EndpointSpec(
+        name="charge_authorization", method="POST", url_attr="charge_authorization_url",
+        message="Transaction initialized successfully",
+        required=("email", "amount", "authorization_code"),
+        optional=frozenset(["reference", "currency", "metadata", "channels", "subaccount", "transaction_charge",
+                            "bearer", "queue"]),
+        missing=((("amount",), "Missing required parameter amount"),
+                 (("email",), "Missing required parameter email"),
+                 (("authorization_code",), "Missing required parameter authorization_code")),
+        scaled=frozenset(["amount"]), formats=(("authorization_code", "AUTH_{}"),), key_message="Invalid API Key",
+        doc="Charge a saved authorization. ``amount`` is in major units."),
+    EndpointSpec(
+        name="show_transaction_timeline", method="GET", url_attr="transaction_timeline_url",
+        message="Transaction timeline retrieved",
+        path="/{id_or_reference}", required=("id_or_reference",), coalesced=True,
+        doc="Show the timeline of a transaction by id or reference."),
+]}
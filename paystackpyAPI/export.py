@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+"""Streaming readers and writers for the CSV files written by ``Transaction.export_transactions``"""
+import csv
+import datetime
+import gzip
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+DECIMAL_COLUMN = re.compile(r"(amount|fee|fees|charge|total)$")
+INTEGER_COLUMN = re.compile(r"(^id|_id)$")
+DATE_COLUMN = re.compile(r"(date|_at)$")
+
+
+def normalize_column(name: str) -> str:
+    """``"Customer Email"`` -> ``"customer_email"``."""
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name.strip()).strip("_").lower()
+    return name if name and not name[0].isdigit() else f"column_{name}"
+
+
+def _to_decimal(value: str) -> Optional[Decimal]:
+    try:
+        return Decimal(value.replace(",", "")) if value else None
+    except InvalidOperation:
+        return None
+
+
+def _to_int(value: str):
+    return int(value) if value.isdigit() else (value or None)
+
+
+def _to_datetime(value: str):
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+
+
+def _to_str(value: str) -> Optional[str]:
+    return value or None
+
+
+def column_converter(column: str) -> Callable[[str], object]:
+    """Pick the parser for a normalized export column from its name."""
+    if DECIMAL_COLUMN.search(column):
+        return _to_decimal
+    if INTEGER_COLUMN.search(column):
+        return _to_int
+    if DATE_COLUMN.search(column):
+        return _to_datetime
+    return _to_str
+
+
+def open_export(path: str, encoding: str = "utf-8-sig"):
+    """Open an export for reading as text, transparently handling ``.gz`` files."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding=encoding, newline="")
+    return open(path, "r", encoding=encoding, newline="")
+
+
+def open_merged_export(path: str, compress: Optional[bool] = None) -> BinaryIO:
+    """
+    Open the binary output of a merged export.
+
+    :param compress: gzip the output; by default only if ``path`` ends with ``.gz``.
+    """
+    if compress is None:
+        compress = path.endswith(".gz")
+    return gzip.open(path, "wb") if compress else open(path, "wb")
+
+
+def append_export(output: BinaryIO, path: str, with_header: bool, chunk_size: int = 64 * 1024) -> Optional[int]:
+    """
+    Copy the export at ``path`` onto ``output`` chunk by chunk.
+
+    The header line is dropped unless ``with_header``, and a missing final
+    newline is added so the next page starts on its own row.
+
+    :return: Bytes of rows copied after the header, or ``None`` for an empty file (no header either).
+    """
+    with open(path, "rb") as source:
+        header = source.readline()
+        if not header:
+            return None
+        if with_header:
+            output.write(header)
+        last = header if with_header else b"\n"
+        copied = 0
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            output.write(chunk)
+            copied += len(chunk)
+            last = chunk
+        if not last.endswith(b"\n"):
+            output.write(b"\n")
+    return copied
+
+
+def read_export(path: str) -> Iterator[Tuple]:
+    """
+    Lazily yield one typed record per row of an exported transactions CSV.
+
+    Records are named tuples whose fields are the normalized column names
+    (``"Customer Email"`` becomes ``customer_email``). Amount/fee columns are
+    parsed to ``Decimal``, id columns to ``int``, date columns to ``datetime``
+    and empty cells to ``None``. Only one row is held in memory at a time.
+
+    :param path: Path of the CSV (or ``.csv.gz``) export.
+    :return: Iterator of records.
+    """
+    with open_export(path) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = [normalize_column(name) for name in header]
+        record = namedtuple("ExportRecord", columns, rename=True)
+        converters = [column_converter(column) for column in record._fields]
+        width = len(columns)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield record._make([convert(value) for convert, value in zip(converters, row)])
+
+
+def aggregate_export(path: str, group_by: Iterable[str] = ("status", "channel", "currency"),
+                     sum_columns: Iterable[str] = ("amount",)) -> Dict[Tuple, Dict]:
+    """
+    Compute counts and sums grouped by columns in a single pass over an export.
+
+    Only the requested columns are parsed and only one accumulator per group
+    is kept, so memory is bounded by the number of distinct groups, not by
+    the size of the file.
+
+    :param path: Path of the CSV (or ``.csv.gz``) export.
+    :param group_by: Normalized column names to group by.
+    :param sum_columns: Normalized numeric column names to total per group.
+    :return: ``{(group values...): {"count": int, <column>: Decimal, ...}}``.
+    :raises ValueError: If a requested column is not present in the export.
+    """
+    group_by = tuple(group_by)
+    sum_columns = tuple(sum_columns)
+    totals: Dict[Tuple, Dict] = {}
+    with open_export(path) as file:
+        reader = csv.reader(file)
+        header = [normalize_column(name) for name in next(reader, [])]
+        missing = [column for column in group_by + sum_columns if column not in header]
+        if missing:
+            raise ValueError(f"Columns not found in export: {', '.join(missing)}")
+        group_index = [header.index(column) for column in group_by]
+        sum_index = [header.index(column) for column in sum_columns]
+        width = max(group_index + sum_index, default=-1) + 1
+        for row in reader:
+            if len(row) < width:
+                continue
+            key = tuple(row[index] for index in group_index)
+            bucket = totals.get(key)
+            if bucket is None:
+                bucket = totals[key] = {"count": 0, **{column: Decimal(0) for column in sum_columns}}
+            bucket["count"] += 1
+            for column, index in zip(sum_columns, sum_index):
+                value = _to_decimal(row[index])
+                if value is not None:
+                    bucket[column] += value
+    return totals
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+"""Locks that are replaced in a forked child process"""
+import os
+import threading
+import weakref
+from typing import Callable, Dict
+
+_registry: "weakref.WeakKeyDictionary[object, Dict[str, Callable[[], object]]]" = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def fork_safe(obj, **factories: Callable[[], object]) -> None:
+    """
+    Set ``obj.<name> = factory()`` for each keyword, and again in every child forked later.
+
+    A lock held by a parent thread when the process forks stays held forever
+    in the child, where that thread does not exist, so the child's first
+    call taking it would deadlock. Registered attributes are rebuilt right
+    after ``fork()``, before any other code runs in the child::
+
+        fork_safe(self, _lock=threading.Lock)
+    """
+    for name, factory in factories.items():
+        setattr(obj, name, factory())
+    with _registry_lock:
+        _registry.setdefault(obj, {}).update(factories)
+
+
+def _after_fork_in_child() -> None:
+    global _registry_lock
+    _registry_lock = threading.Lock()
+    for obj, factories in list(_registry.items()):
+        for name, factory in factories.items():
+            setattr(obj, name, factory())
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""Hedged requests: race a second copy of a slow idempotent GET"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeout, wait
+from typing import Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Latencies of the last ``window`` requests of one endpoint, with a cached quantile."""
+    __slots__ = ("samples", "quantile", "refresh", "_value", "_stale")
+
+    def __init__(self, window: int = 500, quantile: float = 0.95, refresh: int = 16) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.quantile = quantile
+        self.refresh = refresh
+        self._value: Optional[float] = None
+        self._stale = 0
+
+    def observe(self, latency: float) -> None:
+        self.samples.append(latency)
+        self._stale += 1
+
+    def value(self) -> Optional[float]:
+        """The ``quantile`` of the window, re-sorted at most every ``refresh`` observations."""
+        if self._value is None or self._stale >= self.refresh:
+            if not self.samples:
+                return None
+            ordered = sorted(self.samples)
+            self._value = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+            self._stale = 0
+        return self._value
+
+
+class HedgePolicy:
+    """
+    Send a second copy of a slow read and use whichever answer arrives first.
+
+    Tail latency of lookups is mostly a few slow upstream responses. When a
+    request has not answered after the endpoint's recent ``quantile`` latency
+    (p95 by default), an identical request is sent and the first response
+    wins; the other one is discarded when it completes. Only idempotent GETs
+    may be hedged: :class:`Transaction` uses it for verify, fetch and
+    timeline lookups::
+
+        transaction = Transaction(api_key, hedge=HedgePolicy(max_delay=0.5))
+
+    Hedges are capped at ``budget_ratio`` of requests, so a slow Paystack
+    sees at most that much extra load instead of double.
+    """
+
+    def __init__(self, quantile: float = 0.95, min_delay: float = 0.01, max_delay: float = 1.0,
+                 window: int = 500, min_samples: int = 20, budget_ratio: float = 0.1,
+                 budget_max_tokens: float = 10.0, max_workers: int = 32) -> None:
+        """
+        :param quantile: Latency quantile after which a request is hedged.
+        :param min_delay: Lower bound of the hedge delay in seconds.
+        :param max_delay: Upper bound of the hedge delay, also used until ``min_samples`` are seen.
+        :param window: Number of recent latencies kept per endpoint.
+        :param min_samples: Latencies needed before the quantile is trusted.
+        :param budget_ratio: Hedge tokens earned per request.
+        :param budget_max_tokens: Cap on accumulated hedge tokens.
+        :param max_workers: Threads running hedged requests (both copies run on them).
+        """
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.budget_ratio = budget_ratio
+        self.budget_max_tokens = budget_max_tokens
+        self.max_workers = max_workers
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._tokens = 1.0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid = os.getpid()
+        self._counters = {"requests": 0, "hedges": 0, "hedge_wins": 0}
+
+    def delay(self, key: str) -> float:
+        """Seconds to wait for the first copy of a ``key`` request before hedging."""
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is None or len(tracker.samples) < self.min_samples:
+                return self.max_delay
+            return min(self.max_delay, max(self.min_delay, tracker.value()))
+
+    def observe(self, key: str, latency: float) -> None:
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is None:
+                tracker = self._trackers[key] = LatencyTracker(self.window, self.quantile)
+            tracker.observe(latency)
+
+    def _withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._counters["hedges"] += 1
+            return True
+
+    def _start(self) -> ThreadPoolExecutor:
+        if self._pid != os.getpid():
+            # The parent's worker threads do not exist in a forked child.
+            self._lock, self._executor, self._pid = threading.Lock(), None, os.getpid()
+        with self._lock:
+            self._counters["requests"] += 1
+            self._tokens = min(self._tokens + self.budget_ratio, self.budget_max_tokens)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="paystack-hedge")
+            return self._executor
+
+    def _timed(self, key: str, send: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = send()
+        self.observe(key, time.perf_counter() - started)
+        return result
+
+    def run(self, key: str, send: Callable[[], T], discard: Optional[Callable[[T], None]] = None) -> T:
+        """
+        Call ``send()``, racing a second call if the first is slower than ``delay(key)``.
+
+        :param key: Endpoint the latency statistics are kept for.
+        :param send: Performs one request; must be safe to call twice.
+        :param discard: Called with the losing result, e.g. to release its connection.
+        :return: The first result; an exception is only raised if both copies fail.
+        """
+        executor = self._start()
+        primary = executor.submit(self._timed, key, send)
+        try:
+            return primary.result(timeout=self.delay(key))
+        except FutureTimeout:
+            pass
+        if not self._withdraw():
+            return primary.result()
+        backup = executor.submit(self._timed, key, send)
+        pending, error = {primary, backup}, None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is backup:
+                    with self._lock:
+                        self._counters["hedge_wins"] += 1
+                if discard is not None:
+                    for loser in pending:
+                        loser.add_done_callback(lambda late: late.exception() is None and discard(late.result()))
+                return future.result()
+        raise error
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def close(self, wait: bool = False) -> None:
+        """
+        Stop the worker threads once running requests finish.
+
+        :param wait: Block until they have, including losing copies still in flight.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""Per-endpoint request metrics for the PaystackAPI transport"""
+import bisect
+import re
+import threading
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from .forksafe import fork_safe
+
+PAYSTACK_HOST = "api.paystack.co"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATIC_SEGMENT = re.compile(r"[a-z_]+")
+# Segments following these are always identifiers, even if they look static.
+IDENTIFIER_PARENTS = frozenset(["verify", "timeline"])
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """
+    Low-cardinality name for a request: ``GET /transaction/verify/:id``.
+
+    References and ids are replaced by ``:id`` so that per-endpoint series do
+    not grow with the number of transactions. Hosts other than Paystack's
+    (e.g. export downloads) are kept in the name.
+    """
+    parts = urlsplit(url)
+    segments = []
+    previous = None
+    for segment in parts.path.split("/"):
+        if not segment:
+            continue
+        if previous in IDENTIFIER_PARENTS or not STATIC_SEGMENT.fullmatch(segment):
+            segments.append(":id")
+        else:
+            segments.append(segment)
+        previous = segment
+    host = "" if parts.netloc in ("", PAYSTACK_HOST) else parts.netloc
+    return f"{method.upper()} {host}/{'/'.join(segments)}"
+
+
+class MetricsSink:
+    """
+    Interface for receiving transport metrics; subclass and override what you need.
+
+    ``request_started`` is called before the first attempt of a call and
+    ``request_finished`` once the call is done (after any retries), with
+    either a ``status_code`` or the class name of the raised ``error``.
+    """
+
+    def request_started(self, endpoint: str) -> None:
+        pass
+
+    def request_finished(self, endpoint: str, latency: float, status_code: Optional[int] = None,
+                         error: Optional[str] = None, bytes_out: int = 0, bytes_in: int = 0) -> None:
+        pass
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket containing the ``q`` quantile (``inf`` past the last bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class _EndpointStats:
+    __slots__ = ("latency", "statuses", "errors", "in_flight", "bytes_out", "bytes_in")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.latency = Histogram(bounds)
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.in_flight = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Thread-safe in-memory sink; read it with :meth:`snapshot` or scrape
+    :meth:`export_prometheus`.
+
+        metrics = InMemoryMetrics()
+        transaction = Transaction(api_key, metrics=metrics)
+        ...
+        metrics.snapshot()["GET /transaction/verify/:id"]["p99"]
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        fork_safe(self, _lock=threading.Lock)
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats(self.buckets)
+        return stats
+
+    def request_started(self, endpoint: str) -> None:
+        with self._lock:
+            self._stats(endpoint).in_flight += 1
+
+    def request_finished(self, endpoint: str, latency: float, status_code: Optional[int] = None,
+                         error: Optional[str] = None, bytes_out: int = 0, bytes_in: int = 0) -> None:
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.in_flight -= 1
+            stats.latency.observe(latency)
+            if status_code is not None:
+                stats.statuses[status_code] = stats.statuses.get(status_code, 0) + 1
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Plain-dict copy of every endpoint's metrics."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "count": stats.latency.count,
+                    "latency_sum": stats.latency.sum,
+                    "latency_buckets": dict(zip(self.buckets + (float("inf"),), stats.latency.counts)),
+                    "p50": stats.latency.quantile(0.5),
+                    "p95": stats.latency.quantile(0.95),
+                    "p99": stats.latency.quantile(0.99),
+                    "statuses": dict(stats.statuses),
+                    "errors": dict(stats.errors),
+                    "in_flight": stats.in_flight,
+                    "bytes_out": stats.bytes_out,
+                    "bytes_in": stats.bytes_in,
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def export_prometheus(self, prefix: str = "paystack") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = [
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+            f"# TYPE {prefix}_responses_total counter",
+            f"# TYPE {prefix}_errors_total counter",
+            f"# TYPE {prefix}_requests_in_flight gauge",
+            f"# TYPE {prefix}_bytes_out_total counter",
+            f"# TYPE {prefix}_bytes_in_total counter",
+        ]
+        for endpoint, data in sorted(self.snapshot().items()):
+            label = 'endpoint="%s"' % endpoint.replace('"', '\\"')
+            cumulative = 0
+            for bound, count in data["latency_buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{label}}} {data['latency_sum']}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{label}}} {data['count']}")
+            for status, count in sorted(data["statuses"].items()):
+                lines.append(f'{prefix}_responses_total{{{label},status="{status}"}} {count}')
+            for error, count in sorted(data["errors"].items()):
+                lines.append(f'{prefix}_errors_total{{{label},error="{error}"}} {count}')
+            lines.append(f"{prefix}_requests_in_flight{{{label}}} {data['in_flight']}")
+            lines.append(f"{prefix}_bytes_out_total{{{label}}} {data['bytes_out']}")
+            lines.append(f"{prefix}_bytes_in_total{{{label}}} {data['bytes_in']}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+"""Local SQLite mirror of a Paystack account's transactions"""
+import datetime
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+from .transaction import Transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    reference TEXT,
+    status TEXT,
+    amount INTEGER,
+    currency TEXT,
+    channel TEXT,
+    customer_id INTEGER,
+    customer_email TEXT,
+    created_at TEXT,
+    paid_at TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status, created_at);
+CREATE INDEX IF NOT EXISTS transactions_currency ON transactions (currency, created_at);
+CREATE INDEX IF NOT EXISTS transactions_customer_id ON transactions (customer_id, created_at);
+CREATE INDEX IF NOT EXISTS transactions_customer_email ON transactions (customer_email, created_at);
+CREATE INDEX IF NOT EXISTS transactions_reference ON transactions (reference);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+UPSERT = """
+INSERT OR REPLACE INTO transactions
+    (id, reference, status, amount, currency, channel, customer_id, customer_email, created_at, paid_at, raw)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+DateLike = Union[str, datetime.date, datetime.datetime]
+
+
+def _timestamp(value: Optional[DateLike]) -> Optional[str]:
+    """ISO-8601 string comparable with the ``created_at`` values Paystack returns."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="milliseconds") + "Z"
+    return value.isoformat()
+
+
+def _row(transaction: Dict) -> Tuple:
+    customer = transaction.get("customer") or {}
+    created_at = transaction.get("created_at") or transaction.get("createdAt") or transaction.get("paid_at")
+    return (transaction["id"], transaction.get("reference"), transaction.get("status"), transaction.get("amount"),
+            transaction.get("currency"), transaction.get("channel"), customer.get("id"), customer.get("email"),
+            created_at, transaction.get("paid_at") or transaction.get("paidAt"),
+            json.dumps(transaction, separators=(",", ":")))
+
+
+class TransactionMirror:
+    """
+    Incrementally synced SQLite copy of the account's transactions.
+
+    The first :meth:`sync` backfills the whole history; later ones only ask
+    Paystack for transactions created after the stored watermark (minus
+    ``overlap``, so that late status changes are picked up too). Queries and
+    totals are then answered from indexed local tables without any network
+    call::
+
+        mirror = TransactionMirror(transaction, "transactions.db")
+        mirror.sync()
+        mirror.query(status="success", currency="NGN", from_date="2023-10-01")
+        mirror.totals(from_date="2023-10-01", to_date="2023-11-01")
+    """
+    WATERMARK = "created_at_watermark"
+
+    def __init__(self, transaction: Transaction, path: str = ":memory:",
+                 overlap: datetime.timedelta = datetime.timedelta(hours=1), per_page: int = 100,
+                 batch_size: int = 500) -> None:
+        """
+        :param transaction: Client used to sync.
+        :param path: SQLite database file (``":memory:"`` for a throwaway mirror).
+        :param overlap: How far before the watermark each incremental sync starts.
+        :param per_page: Page size used while syncing.
+        :param batch_size: Rows written per SQLite transaction.
+        """
+        self.transaction = transaction
+        self.path = path
+        self.overlap = overlap
+        self.per_page = per_page
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock, self._db:
+            self._db.executescript(SCHEMA)
+            if path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """``created_at`` of the newest transaction seen by a completed sync."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM sync_state WHERE key = ?", (self.WATERMARK,)).fetchone()
+        return row["value"] if row else None
+
+    def _sync_from(self) -> Optional[str]:
+        watermark = self.watermark
+        if watermark is None:
+            return None
+        try:
+            moment = datetime.datetime.fromisoformat(watermark.replace("Z", "+00:00"))
+        except ValueError:
+            return watermark
+        return _timestamp(moment - self.overlap)
+
+    def _write(self, rows: List[Tuple]) -> None:
+        with self._lock, self._db:
+            self._db.executemany(UPSERT, rows)
+
+    def sync(self, **filters) -> int:
+        """
+        Pull transactions created since the last sync (everything on the first run).
+
+        The watermark only moves once the whole range was fetched, so an
+        interrupted sync is simply redone by the next call.
+
+        :param filters: Extra :meth:`Transaction.list_transactions` filters (rarely needed).
+        :return: Number of transactions written.
+        :raises APIError: If a page request fails.
+        """
+        sync_from = self._sync_from()
+        if sync_from is not None:
+            filters["from"] = sync_from
+        newest = self.watermark
+        written = 0
+        batch: List[Tuple] = []
+        for transaction in self.transaction.iter_transactions(per_page=self.per_page, **filters):
+            row = _row(transaction)
+            if row[8] and (newest is None or row[8] > newest):
+                newest = row[8]
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+            written += len(batch)
+        if newest is not None:
+            with self._lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                                 (self.WATERMARK, newest))
+        return written
+
+    @staticmethod
+    def _where(status: Optional[str] = None, customer: Optional[Union[int, str]] = None,
+               currency: Optional[str] = None, channel: Optional[str] = None,
+               from_date: Optional[DateLike] = None, to_date: Optional[DateLike] = None) -> Tuple[str, List]:
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if customer is not None:
+            clauses.append("customer_id = ?" if isinstance(customer, int) else "customer_email = ?")
+            params.append(customer)
+        if currency is not None:
+            clauses.append("currency = ?")
+            params.append(currency)
+        if channel is not None:
+            clauses.append("channel = ?")
+            params.append(channel)
+        if from_date is not None:
+            clauses.append("created_at >= ?")
+            params.append(_timestamp(from_date))
+        if to_date is not None:
+            clauses.append("created_at < ?")
+            params.append(_timestamp(to_date))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, limit: Optional[int] = None, offset: int = 0, **filters) -> List[Dict]:
+        """
+        Mirrored transactions matching the filters, newest first, as Paystack returned them.
+
+        :param limit: Maximum number of rows (``None`` for all).
+        :param offset: Rows to skip.
+        :param filters: ``status``, ``customer`` (id or email), ``currency``, ``channel``,
+                        ``from_date`` (inclusive) and ``to_date`` (exclusive).
+        """
+        where, params = self._where(**filters)
+        sql = f"SELECT raw FROM transactions{where} ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [json.loads(row["raw"]) for row in rows]
+
+    def get(self, reference: Union[int, str]) -> Optional[Dict]:
+        """A mirrored transaction by id or reference."""
+        column = "id" if isinstance(reference, int) else "reference"
+        with self._lock:
+            row = self._db.execute(f"SELECT raw FROM transactions WHERE {column} = ?", (reference,)).fetchone()
+        return json.loads(row["raw"]) if row else None
+
+    def totals(self, **filters) -> Dict:
+        """
+        Local equivalent of :meth:`Transaction.get_total_transactions`.
+
+        Volumes only count successful transactions, like Paystack's totals;
+        ``total_transactions`` counts every match.
+
+        :param filters: Same as :meth:`query`.
+        :return: ``{"total_transactions", "total_volume", "total_volume_by_currency"}``.
+        """
+        where, params = self._where(**filters)
+        success = "status = 'success'"
+        with self._lock:
+            count = self._db.execute(f"SELECT COUNT(*) FROM transactions{where}", params).fetchone()[0]
+            by_currency = self._db.execute(
+                f"SELECT currency, SUM(amount) AS amount FROM transactions"
+                f"{where + ' AND ' if where else ' WHERE '}{success} GROUP BY currency ORDER BY currency",
+                params).fetchall()
+        volumes = [{"currency": row["currency"], "amount": row["amount"]} for row in by_currency]
+        return {
+            "total_transactions": count,
+            "total_volume": sum(volume["amount"] for volume in volumes),
+            "total_volume_by_currency": volumes,
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "TransactionMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
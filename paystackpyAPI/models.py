@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+"""Compact, lazily-decoded response objects"""
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    import json
+
+    loads = json.loads
+    JSON_BACKEND = "json"
+
+_UNSET = object()
+
+
+class _Model:
+    """
+    Read-only view over one object of a decoded Paystack payload.
+
+    Fields are looked up in the underlying dict on access, so wrapping a
+    large list costs one small object per item and nothing per field.
+    """
+    __slots__ = ("raw",)
+    FIELDS = ()
+
+    def __init__(self, raw: Dict) -> None:
+        self.raw = raw
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self.FIELDS:
+            return self.raw.get(name)
+        raise AttributeError(f"{type(self).__name__!s} has no field {name!r}")
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other.raw == self.raw
+
+    def __repr__(self) -> str:
+        shown = ", ".join(f"{field}={self.raw.get(field)!r}" for field in self.FIELDS[:4])
+        return f"{type(self).__name__}({shown})"
+
+
+class Customer(_Model):
+    __slots__ = ()
+    FIELDS = ("id", "email", "first_name", "last_name", "phone", "customer_code", "metadata", "risk_action")
+
+
+class Authorization(_Model):
+    __slots__ = ()
+    FIELDS = ("authorization_code", "bin", "last4", "exp_month", "exp_year", "channel", "card_type", "bank",
+              "country_code", "brand", "reusable", "signature", "account_name")
+
+
+class PageMeta(_Model):
+    __slots__ = ()
+    FIELDS = ("total", "skipped", "perPage", "page", "pageCount", "next", "previous")
+
+
+class TransactionData(_Model):
+    __slots__ = ()
+    FIELDS = ("id", "domain", "status", "reference", "amount", "message", "gateway_response", "paid_at",
+              "created_at", "channel", "currency", "ip_address", "metadata", "fees", "plan", "requested_amount",
+              "authorization_url", "access_code")
+
+    @property
+    def customer(self) -> Optional[Customer]:
+        value = self.raw.get("customer")
+        return Customer(value) if isinstance(value, dict) else None
+
+    @property
+    def authorization(self) -> Optional[Authorization]:
+        value = self.raw.get("authorization")
+        return Authorization(value) if isinstance(value, dict) else None
+
+
+class PaystackResponse(dict):
+    """
+    Result of a Transaction call.
+
+    A real ``{"status_code", "message", "response_from_api"}`` dict, as the
+    methods used to return, but the body is only JSON-decoded the first time
+    it is needed: reading ``response["response_from_api"]``, :attr:`body`,
+    :attr:`data`..., or anything that walks the whole dict (iteration,
+    ``json.dumps``, ``print``, comparison, mutation). Decoding uses ``orjson``
+    when installed. Typed accessors wrap the payload in ``__slots__`` models::
+
+        response = transaction.list_transactions(perPage=100)
+        response["status_code"]                 # no decode
+        [t.reference for t in response.transactions]
+        response.meta.pageCount
+    """
+    __slots__ = ("content", "_decoded")
+    KEYS = ("status_code", "message", "response_from_api")
+
+    def __init__(self, status_code: int, message: str, content: bytes, decoded: Any = _UNSET) -> None:
+        super().__init__(status_code=status_code, message=message)
+        self.content = content
+        self._decoded = _UNSET
+        if decoded is not _UNSET:
+            self._store(decoded)
+
+    @classmethod
+    def from_http(cls, response, message: str) -> "PaystackResponse":
+        """Wrap a ``requests``/``httpx`` response, reusing a body already decoded by tracing hooks."""
+        decoded = _UNSET
+        primed = getattr(response, "_paystack_decoded", None)
+        if primed:
+            try:
+                decoded = primed.pop()
+            except IndexError:
+                pass
+        return cls(response.status_code, message, response.content, decoded)
+
+    def _store(self, decoded: Any) -> None:
+        self._decoded = decoded
+        dict.__setitem__(self, "response_from_api", decoded)
+
+    @property
+    def status_code(self) -> int:
+        return dict.__getitem__(self, "status_code")
+
+    @property
+    def message(self) -> str:
+        return dict.__getitem__(self, "message")
+
+    @property
+    def body(self) -> Any:
+        """The decoded JSON payload (what ``response_from_api`` holds)."""
+        if self._decoded is _UNSET:
+            self._store(loads(self.content))
+        return self._decoded
+
+    @property
+    def decoded(self) -> bool:
+        return self._decoded is not _UNSET
+
+    @property
+    def status(self) -> Optional[bool]:
+        return self.body.get("status")
+
+    @property
+    def data(self) -> Any:
+        return self.body.get("data")
+
+    @property
+    def transaction(self) -> Optional[TransactionData]:
+        data = self.data
+        return TransactionData(data) if isinstance(data, dict) else None
+
+    @property
+    def transactions(self) -> List[TransactionData]:
+        data = self.data
+        return [TransactionData(item) for item in data] if isinstance(data, list) else []
+
+    @property
+    def meta(self) -> Optional[PageMeta]:
+        meta = self.body.get("meta")
+        return PageMeta(meta) if isinstance(meta, dict) else None
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "response_from_api" and self._decoded is _UNSET:
+            return self.body
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.body
+        if key == "response_from_api":
+            self._store(value)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def to_dict(self) -> Dict:
+        """Plain ``dict`` copy, e.g. to hand to code that checks ``type(x) is dict``."""
+        return {key: self[key] for key in self}
+
+    def __reduce__(self):
+        return PaystackResponse, (self.status_code, self.message, self.content, self.body)
+
+    def __repr__(self) -> str:
+        self.body
+        return dict.__repr__(self)
+
+
+def _decoding(name: str):
+    """Wrap a ``dict`` method that sees every key so the lazy body is decoded first."""
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.body
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = wrapper.__qualname__ = name
+    return wrapper
+
+
+for _name in ("__iter__", "__len__", "__contains__", "__eq__", "__ne__", "__delitem__", "__or__", "__ior__",
+              "__reversed__", "keys", "items", "values", "get", "pop", "popitem", "setdefault", "update", "clear",
+              "copy"):
+    setattr(PaystackResponse, _name, _decoding(_name))
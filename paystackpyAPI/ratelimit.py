@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""Client-side token-bucket rate limiting for Paystack calls"""
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from .forksafe import fork_safe
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+def _refill(tokens: float, last: float, now: float, rate: float, burst: float, cost: float):
+    """
+    Reserve ``cost`` tokens and return ``(tokens, wait)``.
+
+    The balance is allowed to go negative: a caller that overdraws is told how
+    long to wait for the debt to be repaid, and later callers queue behind it.
+    That spreads a burst evenly over time instead of failing it.
+    """
+    tokens = min(burst, tokens + max(0.0, now - last) * rate) - cost
+    return tokens, max(0.0, -tokens / rate)
+
+
+class InProcessBackend:
+    """Token buckets held in memory, shared by every thread of one process."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, list] = {}
+        fork_safe(self, _lock=threading.Lock)
+
+    def reserve(self, key: str, cost: float, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [burst, now]
+            bucket[0], wait = _refill(bucket[0], bucket[1], now, rate, burst, cost)
+            bucket[1] = now
+        return wait
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+class FileLockBackend:
+    """
+    Token buckets stored in small files guarded by ``flock``.
+
+    Every process on the host that points at the same ``directory`` shares the
+    buckets, which is what gunicorn/uwsgi workers using one secret key need.
+    POSIX only.
+    """
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        if fcntl is None:
+            raise RuntimeError("FileLockBackend requires fcntl (POSIX)")
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "paystackpyAPI-ratelimit")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bucket")
+
+    def reserve(self, key: str, cost: float, rate: float, burst: float) -> float:
+        fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # Wall clock: monotonic clocks are not comparable across processes.
+            now = time.time()
+            raw = os.pread(fd, self._STATE.size, 0)
+            tokens, last = self._STATE.unpack(raw) if len(raw) == self._STATE.size else (burst, now)
+            tokens, wait = _refill(tokens, last, now, rate, burst, cost)
+            os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            return wait
+        finally:
+            os.close(fd)
+
+    def discard(self, key: str) -> None:
+        """Buckets are shared with other processes, so they are left in place."""
+
+
+class RateLimiter:
+    """
+    Per-key token bucket with per-endpoint weights.
+
+    Calls never fail because of the limiter; they are delayed just long enough
+    to keep the long-run rate at ``rate`` requests per second (with bursts of up
+    to ``burst``). Heavier endpoints can cost more than one token::
+
+        limiter = RateLimiter(rate=10, burst=20, weights={"/transaction/export": 5},
+                              backend=FileLockBackend())
+        transaction = Transaction(api_key, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float = 10.0, burst: float = 20.0, weights: Optional[Dict[str, float]] = None,
+                 backend=None) -> None:
+        """
+        :param rate: Tokens added per second.
+        :param burst: Bucket capacity.
+        :param weights: Cost per URL path prefix; the longest matching prefix wins, default 1.
+        :param backend: :class:`InProcessBackend` (default) or :class:`FileLockBackend`.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.weights = dict(weights or {})
+        self._prefixes = sorted(self.weights, key=len, reverse=True)
+        self.backend = backend or InProcessBackend()
+
+    @staticmethod
+    def bucket_key(api_key: str) -> str:
+        """Bucket name for an API key, without exposing the key itself."""
+        return hashlib.sha256((api_key or "").encode()).hexdigest()[:32]
+
+    def weight(self, url: str) -> float:
+        path = urlsplit(url).path
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self.weights[prefix]
+        return 1.0
+
+    def reserve(self, api_key: str, url: str) -> float:
+        """Reserve tokens for a call and return how long to wait before sending it."""
+        return self.backend.reserve(self.bucket_key(api_key), self.weight(url), self.rate, self.burst)
+
+    def forget(self, api_key: str) -> None:
+        """Drop the bucket of an API key that is no longer used (it restarts full)."""
+        self.backend.discard(self.bucket_key(api_key))
+
+    def acquire(self, api_key: str, url: str) -> float:
+        """Block until the call may be sent; returns the time waited."""
+        wait = self.reserve(api_key, url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, api_key: str, url: str) -> float:
+        """Asyncio counterpart of :meth:`acquire`."""
+        wait = self.reserve(api_key, url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
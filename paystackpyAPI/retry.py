@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""Retry policy, deadlines and circuit breaker used by the PaystackAPI transport"""
+import email.utils
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from errors import CircuitOpenError
+from .forksafe import fork_safe
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    * Only idempotent requests are retried: GETs always, POSTs only when the
+      caller supplied a ``reference`` in the JSON body, so Paystack dedupes
+      the replay instead of creating a second transaction.
+    * Delays use exponential backoff with full jitter, and a ``Retry-After``
+      header is honoured when it is larger (but never beyond ``max_retry_after``).
+    * A retry budget caps retries at ``budget_ratio`` of recent requests (plus
+      a small floor), so an outage cannot multiply load by ``max_attempts``.
+    """
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 max_retry_after: float = 60.0, budget_ratio: float = 0.2, budget_min_tokens: float = 10.0,
+                 budget_max_tokens: float = 100.0, retry_statuses=RETRY_STATUSES) -> None:
+        """
+        :param max_attempts: Total attempts per call, including the first one.
+        :param backoff_base: Backoff ceiling for the first retry, doubled per attempt.
+        :param backoff_max: Largest backoff ceiling.
+        :param max_retry_after: Give up rather than wait longer than this for ``Retry-After``.
+        :param budget_ratio: Retry tokens earned per request.
+        :param budget_min_tokens: Retry tokens available before any request is made.
+        :param budget_max_tokens: Cap on accumulated retry tokens.
+        :param retry_statuses: HTTP statuses that are retried.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_min_tokens = budget_min_tokens
+        self.budget_max_tokens = budget_max_tokens
+        self.retry_statuses = frozenset(retry_statuses)
+        self._tokens = budget_min_tokens
+        fork_safe(self, _lock=threading.Lock)
+
+    def is_idempotent(self, method: str, kwargs: Dict) -> bool:
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return True
+        body = kwargs.get("json")
+        return isinstance(body, dict) and bool(body.get("reference"))
+
+    def record_request(self) -> None:
+        """Earn retry budget for a new (first-attempt) request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget_ratio, self.budget_max_tokens)
+
+    def _withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt + 1``."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            moment = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, moment.timestamp() - time.time())
+
+    def retry_delay(self, method: str, kwargs: Dict, attempt: int, status_code: Optional[int] = None,
+                    retry_after: Optional[str] = None, budget: bool = True) -> Optional[float]:
+        """
+        Delay before the next attempt, or ``None`` if the call should not be retried.
+
+        :param attempt: Zero-based number of the attempt that just failed.
+        :param status_code: Response status, or ``None`` for a connection error.
+        :param retry_after: Raw ``Retry-After`` header of the response, if any.
+        :param budget: Whether the retry is paid for from the retry budget.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+        if not self.is_idempotent(method, kwargs):
+            return None
+        delay = self.backoff(attempt)
+        server_delay = self.parse_retry_after(retry_after)
+        if server_delay is not None:
+            if server_delay > self.max_retry_after:
+                return None
+            delay = max(delay, server_delay)
+        if budget and not self._withdraw():
+            return None
+        return delay
+
+
+class Deadline:
+    """
+    Time budget of one call, shared by all of its attempts.
+
+    Each attempt gets an equal share of what is left, so a stalled first
+    attempt still leaves time for the retries instead of eating the whole
+    budget. Waiting for the rate limiter is not counted.
+    """
+    __slots__ = ("timeout", "expires")
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.expires = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        return self.expires - time.monotonic()
+
+    def attempt_timeout(self, attempts_left: int = 1) -> Optional[float]:
+        """Socket timeout for the next attempt, or ``None`` once the budget is spent."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        return remaining / max(1, attempts_left)
+
+    def allows(self, delay: float) -> bool:
+        """Whether sleeping ``delay`` seconds still leaves time for another attempt."""
+        return delay < self.remaining()
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while Paystack is degraded.
+
+    After ``failure_threshold`` consecutive failures (connection errors,
+    broken transfers, 429 or 5xx) the breaker opens and every call raises :class:`CircuitOpenError`
+    without touching the network. After ``reset_timeout`` seconds it lets
+    ``half_open_max_calls`` probe requests through; a successful probe closes
+    it again, a failed one re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        fork_safe(self, _lock=threading.Lock)
+
+    @staticmethod
+    def is_failure(status_code: int) -> bool:
+        return status_code == 429 or status_code >= 500
+
+    def before_request(self) -> None:
+        """Raise :class:`CircuitOpenError` if the call must not be attempted."""
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(503, f"Circuit breaker open, retry in {remaining:.1f}s")
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(503, "Circuit breaker half-open, probe in progress")
+                self._probes += 1
+
+    def release(self) -> None:
+        """Give back the probe slot of a call that ended without a verdict on Paystack (e.g. a hook raised)."""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record(self, status_code: int) -> None:
+        if self.is_failure(status_code):
+            self.record_failure()
+        else:
+            self.record_success()
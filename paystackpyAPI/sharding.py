@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""Helpers for splitting date-range queries into concurrently fetched windows"""
+import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+DateLike = Union[str, datetime.date, datetime.datetime]
+# Paystack timestamps have millisecond resolution and ``to`` is inclusive.
+RESOLUTION = datetime.timedelta(milliseconds=1)
+
+
+def parse_timestamp(value: DateLike) -> datetime.datetime:
+    """Naive UTC datetime from a date, datetime or ISO-8601 string (``Z`` suffix allowed)."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not isinstance(value, datetime.datetime):
+        return datetime.datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _is_day(value: DateLike) -> bool:
+    if isinstance(value, str):
+        return len(value) == len("YYYY-MM-DD")
+    return not isinstance(value, datetime.datetime)
+
+
+def format_timestamp(value: datetime.datetime) -> str:
+    return value.isoformat(timespec="milliseconds") + "Z"
+
+
+class Window(NamedTuple):
+    """Half-open ``[start, end)`` slice of a date range."""
+    start: datetime.datetime
+    end: datetime.datetime
+
+    def params(self) -> Dict[str, str]:
+        """``from``/``to`` query parameters covering exactly this window."""
+        return {"from": format_timestamp(self.start), "to": format_timestamp(self.end - RESOLUTION)}
+
+    def halves(self) -> List["Window"]:
+        """The two halves of the window, newest first (the order Paystack lists in)."""
+        middle = self.start + (self.end - self.start) / 2
+        return [Window(middle, self.end), Window(self.start, middle)]
+
+    @property
+    def span(self) -> datetime.timedelta:
+        return self.end - self.start
+
+
+def range_end(to_date: DateLike) -> datetime.datetime:
+    """Exclusive end of a range ending at ``to_date``: the whole day for a plain date, else just after it."""
+    if _is_day(to_date):
+        return parse_timestamp(to_date) + datetime.timedelta(days=1)
+    return parse_timestamp(to_date) + RESOLUTION
+
+
+def range_params(from_date: Optional[DateLike], to_date: Optional[DateLike]) -> Dict[str, DateLike]:
+    """
+    ``from``/``to`` of one query over the range :func:`split_range` splits.
+
+    Unsharded calls send these so that turning sharding on never changes
+    which transactions are covered. Values that are not ISO-8601 are passed
+    through unchanged.
+    """
+    params: Dict[str, DateLike] = {}
+    for key, value, convert in (("from", from_date, parse_timestamp),
+                                ("to", to_date, lambda value: range_end(value) - RESOLUTION)):
+        if value is None:
+            continue
+        try:
+            params[key] = format_timestamp(convert(value))
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def split_range(from_date: DateLike, to_date: DateLike, shards: int) -> List[Window]:
+    """
+    Split the range from ``from_date`` to ``to_date`` (inclusive) into ``shards`` equal windows, newest first.
+
+    A plain date as ``to_date`` includes that whole day; together the windows
+    cover exactly what one query with :func:`range_params` does.
+    """
+    start = parse_timestamp(from_date)
+    end = range_end(to_date)
+    if end <= start:
+        raise ValueError("to_date must be after from_date")
+    shards = max(1, shards)
+    step = (end - start) / shards
+    bounds = [start + step * i for i in range(shards)] + [end]
+    return [Window(bounds[i], bounds[i + 1]) for i in reversed(range(len(bounds) - 1)) if bounds[i] < bounds[i + 1]]
+
+
+def merge_totals(parts: Iterable[Dict]) -> Dict:
+    """
+    Sum the ``data`` blocks of several ``/transaction/totals`` responses.
+
+    Scalar counters are added and ``*_by_currency`` lists are summed per
+    currency. ``unique_customers`` cannot be added across windows and is
+    dropped.
+    """
+    merged: Dict = {}
+    for data in parts:
+        for key, value in data.items():
+            if key == "unique_customers":
+                continue
+            if isinstance(value, list):
+                by_currency = merged.setdefault(key, {})
+                for item in value:
+                    by_currency[item["currency"]] = by_currency.get(item["currency"], 0) + (item.get("amount") or 0)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+    return {key: [{"currency": currency, "amount": amount} for currency, amount in sorted(value.items())]
+            if isinstance(value, dict) else value
+            for key, value in merged.items()}
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+"""Shared clients for platforms that call Paystack with many merchants' keys"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Type
+
+from .base import PaystackAPI
+from .cache import ResponseCache
+from .ratelimit import RateLimiter
+from .transaction import Transaction
+from .transports import HTTP2Transport, RequestsTransport
+
+
+class ClientRegistry:
+    """
+    Hand out one client per API key, all sending through one connection pool.
+
+    Creating a ``Transaction(api_key)`` per request allocates a session and
+    opens fresh connections every time. A registry keeps one client per
+    tenant instead, and every client sends through the same pooled transport
+    (the key travels in a per-request ``Authorization`` header). Each tenant
+    gets its own token bucket (``rate``/``burst``) and at most
+    ``max_concurrency`` requests in flight, so one busy merchant queues
+    behind its own quota instead of taking every pooled connection::
+
+        registry = ClientRegistry(max_tenants=5000, idle_timeout=600, rate=5, max_concurrency=4)
+        response = registry.get(merchant.secret_key).verify_transaction(reference)
+
+    At most ``max_tenants`` clients are kept; the least recently handed out
+    one is dropped first, as is any client not handed out for
+    ``idle_timeout`` seconds. A dropped client keeps working for whoever
+    still holds it, and the next :meth:`get` for its key builds a new one.
+    """
+
+    def __init__(self, client_class: Type[PaystackAPI] = Transaction, max_tenants: int = 1000,
+                 idle_timeout: Optional[float] = None, rate: Optional[float] = 10.0, burst: float = 20.0,
+                 rate_backend=None, max_concurrency: Optional[int] = 4, pool_maxsize: int = 50,
+                 pool_block: bool = False, cache_factory: Optional[Callable[[], ResponseCache]] = None,
+                 transport: str = "requests", **client_kwargs) -> None:
+        """
+        :param client_class: Client built for each tenant, e.g. :class:`Transaction`.
+        :param max_tenants: Maximum number of clients kept.
+        :param idle_timeout: Seconds after which a client not handed out is dropped (``None`` = never).
+        :param rate: Requests per second allowed per tenant (``None`` = unlimited).
+        :param burst: Token bucket capacity per tenant.
+        :param rate_backend: :class:`RateLimiter` backend, e.g. ``FileLockBackend()`` to share across processes.
+        :param max_concurrency: Requests per tenant in flight at once (``None`` = unlimited).
+        :param pool_maxsize: Connections kept open to Paystack, shared by every tenant.
+        :param pool_block: Block when every pooled connection is busy instead of opening extra ones.
+        :param cache_factory: Builds a :class:`ResponseCache` per tenant. Caches are keyed by URL,
+                              so one cache must never be shared between API keys.
+        :param transport: ``"requests"`` or ``"http2"``, where every tenant's calls are
+                          multiplexed over one connection (see :class:`HTTP2Transport`).
+        :param client_kwargs: Other options for every client (``retry``, ``metrics``...).
+        """
+        if "cache" in client_kwargs:
+            raise ValueError("A cache shared between API keys would leak responses; pass cache_factory")
+        self.client_class = client_class
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.max_concurrency = max_concurrency
+        self.cache_factory = cache_factory
+        self.client_kwargs = client_kwargs
+        self.rate_limiter = RateLimiter(rate, burst, backend=rate_backend) if rate else None
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        if transport not in ("requests", "http2"):
+            raise ValueError(f"Unknown transport {transport!r}")
+        self.transport_name = transport
+        self._counters = {"hits": 0, "created": 0, "evicted": 0}
+        self._start()
+
+    def _start(self) -> None:
+        """Per-process state; a forked child drops its parent's clients and pool (see :class:`PaystackAPI`)."""
+        self._pid = os.getpid()
+        if self.transport_name == "http2":
+            self.transport = HTTP2Transport(max_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize,
+                                            pool_block=self.pool_block)
+        else:
+            self.transport = RequestsTransport(pool_maxsize=self.pool_maxsize, pool_block=self.pool_block,
+                                               timed=self.client_kwargs.get("hooks") is not None)
+        self._clients: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _build(self, api_key: str) -> PaystackAPI:
+        kwargs = dict(self.client_kwargs)
+        if self.cache_factory is not None:
+            kwargs["cache"] = self.cache_factory()
+        return self.client_class(api_key, transport=self.transport, rate_limiter=self.rate_limiter,
+                                 max_concurrency=self.max_concurrency, **kwargs)
+
+    def get(self, api_key: str) -> PaystackAPI:
+        """The client for ``api_key``, built on first use."""
+        if self._pid != os.getpid():
+            self._start()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.get(api_key)
+            if entry is not None:
+                self._clients.move_to_end(api_key)
+                entry[1] = now
+                self._counters["hits"] += 1
+            else:
+                entry = self._clients[api_key] = [self._build(api_key), now]
+                self._counters["created"] += 1
+            self._evict(now)
+            return entry[0]
+
+    __getitem__ = get
+
+    def _evict(self, now: float) -> None:
+        """Drop clients over capacity, then idle ones; the oldest are at the front."""
+        while self._clients:
+            api_key, (_, last_used) = next(iter(self._clients.items()))
+            idle = self.idle_timeout is not None and now - last_used > self.idle_timeout
+            if len(self._clients) <= self.max_tenants and not idle:
+                return
+            self._drop(api_key)
+
+    def _drop(self, api_key: str) -> None:
+        del self._clients[api_key]
+        self._counters["evicted"] += 1
+        if self.rate_limiter is not None:
+            self.rate_limiter.forget(api_key)
+
+    def evict_idle(self) -> None:
+        """Drop idle clients now (they are otherwise dropped on the next :meth:`get`)."""
+        with self._lock:
+            self._evict(time.monotonic())
+
+    def evict(self, api_key: str) -> None:
+        """Drop the client of ``api_key``, e.g. after the merchant rotated it."""
+        with self._lock:
+            if api_key in self._clients:
+                self._drop(api_key)
+
+    def __contains__(self, api_key: str) -> bool:
+        with self._lock:
+            return api_key in self._clients
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"tenants": len(self._clients), **self._counters}
+
+    def close(self) -> None:
+        """Drop every client and close the pooled connections."""
+        if self._pid != os.getpid():
+            self._start()
+        with self._lock:
+            self._clients.clear()
+        self.transport.close()
+
+    def __enter__(self) -> "ClientRegistry":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+
+"""Per-request phase timing and tracing hooks for the PaystackAPI transport"""
+import heapq
+import itertools
+import logging
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from .forksafe import fork_safe
+
+logger = logging.getLogger(__name__)
+
+_current = threading.local()
+
+
+class RequestTiming:
+    """
+    Timing breakdown of one request attempt, in seconds.
+
+    ``dns``, ``connect`` and ``tls`` are ``None`` when a pooled keep-alive
+    connection was reused (``connection_reused`` is then True). ``ttfb`` is
+    the time the server took to send the response headers once the request
+    was on the wire, ``download`` the time to read the body and ``decode``
+    the time to parse it as JSON.
+    """
+    __slots__ = ("method", "url", "endpoint", "started_at", "status_code", "error", "dns", "connect", "tls",
+                 "ttfb", "download", "decode", "total", "bytes_out", "bytes_in", "attributes")
+
+    def __init__(self, method: str, url: str, endpoint: str) -> None:
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.started_at = time.time()
+        self.status_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.tls: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.total: Optional[float] = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.attributes: Dict = {}
+
+    @property
+    def connection_reused(self) -> bool:
+        return self.connect is None
+
+    def as_dict(self) -> Dict:
+        data = {name: getattr(self, name) for name in self.__slots__ if name != "attributes"}
+        data["connection_reused"] = self.connection_reused
+        data.update(self.attributes)
+        return data
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={getattr(self, name) * 1000:.1f}ms"
+                           for name in ("dns", "connect", "tls", "ttfb", "download", "decode", "total")
+                           if getattr(self, name) is not None)
+        return f"<RequestTiming {self.endpoint} status={self.status_code} {phases}>"
+
+
+class RequestHooks:
+    """
+    Span-style request lifecycle callbacks; subclass and override what you need.
+
+    ``on_request_start`` runs before every attempt is sent and
+    ``on_request_end`` after it completed or failed, with the same
+    :class:`RequestTiming` object filled in. To bridge to a tracer, start a
+    span in the first and finish it in the second::
+
+        class OTelHooks(RequestHooks):
+            def on_request_start(self, timing):
+                timing.attributes["span"] = tracer.start_span(timing.endpoint)
+
+            def on_request_end(self, timing):
+                span = timing.attributes.pop("span")
+                span.set_attributes({k: v for k, v in timing.as_dict().items() if v is not None})
+                span.end()
+    """
+
+    def on_request_start(self, timing: RequestTiming) -> None:
+        pass
+
+    def on_request_end(self, timing: RequestTiming) -> None:
+        pass
+
+
+class SlowRequestLog(RequestHooks):
+    """
+    Debug hook keeping the ``size`` slowest requests and logging each new entrant
+    with its timing breakdown.
+    """
+
+    def __init__(self, size: int = 10, threshold: float = 0.0, log_level: int = logging.DEBUG) -> None:
+        self.size = size
+        self.threshold = threshold
+        self.log_level = log_level
+        self._heap: List = []
+        self._counter = itertools.count()
+        fork_safe(self, _lock=threading.Lock)
+
+    def on_request_end(self, timing: RequestTiming) -> None:
+        if timing.total is None or timing.total < self.threshold:
+            return
+        entry = (timing.total, next(self._counter), timing)
+        with self._lock:
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, entry)
+            elif entry > self._heap[0]:
+                heapq.heapreplace(self._heap, entry)
+            else:
+                return
+        logger.log(self.log_level, "Slow Paystack request: %r", timing)
+
+    def slowest(self) -> List[RequestTiming]:
+        """The recorded requests, slowest first."""
+        with self._lock:
+            return [timing for _, _, timing in sorted(self._heap, reverse=True)]
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return getattr(_current, "timing", None)
+
+
+def set_current_timing(timing: Optional[RequestTiming]) -> None:
+    _current.timing = timing
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        timing = current_timing()
+        if timing is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError:
+            # Let urllib3 look the name up again and raise its usual NameResolutionError.
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timing.dns = resolved - started
+        # Connect to the addresses found above, in order, so create_connection
+        # only parses an IP literal instead of resolving the name a second time.
+        # TLS still verifies and sends SNI for self.host.
+        host, error = self._dns_host, None
+        try:
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (ConnectTimeoutError, NewConnectionError) as exc:
+                    error = exc
+            else:
+                raise error
+        finally:
+            self._dns_host = host
+        timing.connect = time.perf_counter() - resolved
+        return sock
+
+    def connect(self):
+        timing = current_timing()
+        started = time.perf_counter()
+        super().connect()
+        if timing is not None and timing.connect is not None and isinstance(self, HTTPSConnection):
+            timing.tls = max(0.0, time.perf_counter() - started - timing.dns - timing.connect)
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report DNS/connect/TLS time to the current :class:`RequestTiming`."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class HttpxTraceRecorder:
+    """
+    ``httpx`` ``trace`` extension callback filling a :class:`RequestTiming`.
+
+    httpcore does not report name resolution separately, so ``dns`` is folded
+    into ``connect`` for the async transport.
+    """
+
+    def __init__(self, timing: RequestTiming) -> None:
+        self.timing = timing
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: Dict) -> None:
+        now = time.perf_counter()
+        step, _, state = event_name.rpartition(".")
+        if state == "started":
+            self._started[step] = now
+            return
+        if state != "complete" or step not in self._started:
+            return
+        elapsed = now - self._started[step]
+        if step == "connection.connect_tcp":
+            self.timing.connect = elapsed
+        elif step == "connection.start_tls":
+            self.timing.tls = elapsed
+        elif step.endswith("receive_response_headers"):
+            self.timing.ttfb = elapsed
+        elif step.endswith("receive_response_body"):
+            self.timing.download = elapsed
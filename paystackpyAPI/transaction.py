@@ -3,47 +3,43 @@
 """Handles All Paystack related tasks"""
 import requests
 from .base import PaystackAPI
-from typing import Dict, Union
+from .cache import ResponseCache
+from .endpoints import TRANSACTION_ENDPOINTS, endpoint_method
+from .export import append_export, open_merged_export
+from .hedging import HedgePolicy
+from .metrics import endpoint_name
+from .models import PaystackResponse
+from .retry import Deadline
+from .sharding import Window, merge_totals, range_params, split_range
+from .singleflight import SingleFlight
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from errors import APIError
 from decimal import Decimal
+import collections
 import datetime
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import time
 import webbrowser
 
+
+class BulkResult(NamedTuple):
+    """Outcome of one item of a bulk call: exactly one of ``response``/``error`` is set."""
+    reference: Union[int, str]
+    response: Optional[PaystackResponse]
+    error: Optional[APIError]
+
+
 class Transaction(PaystackAPI):
-    INITIALIZATION_OPTIONAL_PARAMS = [
-        "currency",
-        "reference",
-        "callback_url",
-        "plan",
-        "invoice_limit",
-        "metadata",
-        "channels",
-        "split_code",
-        "subaccount",
-        "transaction_charge",
-        "bearer"
-    ]
-
-    TRANSACTION_LIST_OPTIONAL_PARAMS = [
-        "customer",
-        "terminalid",
-        "status",
-        "from",
-        "to",
-        "amount"
-    ]
-    CHARGE_AUTHORIZATION_OPTIONAL_PARAMS = [
-        "reference",
-        "currency",
-        "metadata",
-        "channels",
-        "subaccount",
-        "transaction_charge",
-        "bearer",
-        "queue"
-    ]
+    INITIALIZATION_OPTIONAL_PARAMS = TRANSACTION_ENDPOINTS["initialize_transaction"].optional
+    TRANSACTION_LIST_OPTIONAL_PARAMS = TRANSACTION_ENDPOINTS["list_transactions"].optional
+    CHARGE_AUTHORIZATION_OPTIONAL_PARAMS = TRANSACTION_ENDPOINTS["charge_authorization"].optional
     
-    EXPORT_OPTIONAL_PARAMS = [
+    EXPORT_OPTIONAL_PARAMS = frozenset([
         'from',
         'to',
         'customer',
@@ -53,10 +49,26 @@ class Transaction(PaystackAPI):
         'settled',
         'settlement',
         'payment_page'
-    ]
+    ])
+
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_TIMEOUT = (10, 60)
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, cache: Optional[ResponseCache] = None, coalesce: bool = True,
+                 hedge: Optional[HedgePolicy] = None, **kwargs):
+        """
+        :param api_key: Paystack secret key.
+        :param cache: Optional :class:`ResponseCache` for verify/fetch lookups.
+        :param coalesce: Share one in-flight request between concurrent identical
+                         verify/fetch/timeline lookups (default True).
+        :param hedge: Optional :class:`HedgePolicy` racing a second request when a
+                      verify/fetch/timeline lookup is slower than usual.
+        :param kwargs: Connection pool options, see :class:`PaystackAPI`.
+        """
+        super().__init__(api_key, **kwargs)
+        self.cache = cache
+        self.hedge = hedge
+        self._inflight = SingleFlight() if coalesce else None
         self.paystack_initialization_url = "https://api.paystack.co/transaction/initialize"
         self.paystack_verification_url = "https://api.paystack.co/transaction/verify"
         self.list_transaction_url = "https://api.paystack.co/transaction"
@@ -65,221 +77,234 @@ class Transaction(PaystackAPI):
         self.transaction_timeline_url = "https://api.paystack.co/transaction/timeline"
         self.transaction_totals_url = "https://api.paystack.co/transaction/totals"
         self.export_transactions_url = "https://api.paystack.co/transaction/export"
-        
-
-    def initialize_transaction(self, email: str, amount: int, **kwargs):
-        """
-        Initialize a Paystack transaction.
-
-        :param email: Customer's email address.
-        :param amount: Transaction amount.
-        :param kwargs: Optional parameters for the transaction.
-                       Example: `currency`, `callback_url`, etc.
-        :return: JSON response from Paystack API.
-        :raises APIError: If required parameters are missing or the API key is invalid.
-        """
-        if not email or not amount:
-            raise APIError(400, "Missing required parameters: email and/or amount")
-
-        valid_kwargs = {key: value for key, value in kwargs.items() if key in self.INITIALIZATION_OPTIONAL_PARAMS}
-        data = {
-            "email": email,
-            "amount": amount * 100,
-            **valid_kwargs
-        }
-
-        if not self.api_key:
-            raise APIError(401, "Invalid API key")
-
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-        }
-        response = requests.post(self.paystack_initialization_url, headers=headers, json=data)
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction initialized successfully",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
-        return custom_response
 
-    def verify_transaction(self, reference: Union[int, str]) -> Dict:
-        """
-        Verify a Paystack transaction.
+    # Plain request/response calls are generated from the endpoint table, see endpoints.py.
+    initialize_transaction = endpoint_method(TRANSACTION_ENDPOINTS["initialize_transaction"])
+    verify_transaction = endpoint_method(TRANSACTION_ENDPOINTS["verify_transaction"])
+    list_transactions = endpoint_method(TRANSACTION_ENDPOINTS["list_transactions"])
+    fetch_transaction = endpoint_method(TRANSACTION_ENDPOINTS["fetch_transaction"])
+    charge_authorization = endpoint_method(TRANSACTION_ENDPOINTS["charge_authorization"])
+    show_transaction_timeline = endpoint_method(TRANSACTION_ENDPOINTS["show_transaction_timeline"])
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        # Calls in flight in the parent never finish here; waiting on them would hang.
+        if self._inflight is not None:
+            self._inflight = SingleFlight()
+
+    def _coalesced_get(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """GET ``url``, sharing the request (and the first caller's ``timeout``) with concurrent callers."""
+        self._check_process()
+        get = self._hedged_get if self.hedge is not None else self._get
+        if self._inflight is None:
+            return get(url, timeout)
+        return self._inflight.do(url, lambda: get(url, timeout))
+
+    def _get(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        return self._request("GET", url, timeout=timeout)
+
+    def _hedged_get(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """GET ``url`` through the hedge policy; both copies share one deadline."""
+        if timeout is None:
+            timeout = self.timeout
+        deadline = Deadline(timeout) if isinstance(timeout, (int, float)) else None
+
+        def send() -> requests.Response:
+            if deadline is None:
+                return self._request("GET", url, timeout=timeout)
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                raise requests.exceptions.Timeout(f"Deadline of {timeout}s exceeded for GET {url}")
+            return self._request("GET", url, timeout=remaining)
+        return self.hedge.run(endpoint_name("GET", url), send, discard=requests.Response.close)
+
+    def _bulk_verify_one(self, reference: Union[int, str]) -> BulkResult:
+        try:
+            return BulkResult(reference, self.verify_transaction(reference), None)
+        except APIError as error:
+            return BulkResult(reference, None, error)
+        except requests.exceptions.RequestException as err:
+            return BulkResult(reference, None, APIError(500, f"An error occurred: {err}"))
 
-        :param reference: Reference id of the transaction (int or str).
-        :return: Customized response from Paystack API.
-        :raises APIError: If the reference is missing or the API key is invalid.
+    def verify_transactions(self, references: Iterable[Union[int, str]], max_workers: int = 10) -> Iterator[BulkResult]:
         """
-        if not reference:
-            raise APIError(400, "Missing required parameter: reference")
-
-        if not self.api_key:
-            raise APIError(401, "Invalid API key")
+        Verify many transactions concurrently on a bounded worker pool.
 
-        url = f"{self.paystack_verification_url}/{reference}"
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-        response = requests.get(url, headers=headers)
+        Results are yielded as they complete, not in input order. Only about
+        ``2 * max_workers`` references are in flight at once, so ``references``
+        may be an arbitrarily large lazy iterable. Size ``pool_maxsize`` to at
+        least ``max_workers`` so every worker gets a pooled connection.
 
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction details retrieved successfully",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
-
-        return custom_response
-
-    def list_transactions(self, **kwargs: Dict) -> Dict:
+        :param references: Transaction references to verify.
+        :param max_workers: Maximum number of concurrent requests.
+        :return: Iterator of :class:`BulkResult`; a failed verification carries
+                 its ``APIError`` instead of aborting the batch.
         """
-        Retrieve a list of transactions based on optional parameters.
-
-        :param kwargs: Optional parameters for filtering the list of transactions.
-                       Supported parameters:
-                       - `perPage`: Number of transactions to retrieve per page.
-                       - `page`: Page number for pagination.
-                       - `from`: Start date for transactions in the format 'YYYY-MM-DD'.
-                       - `to`: End date for transactions in the format 'YYYY-MM-DD'.
-                       - `customer`: Customer's email or identification.
-                       - `status`: Transaction status (e.g., 'success', 'failed').
-                       - `currency`: Currency code (e.g., 'NGN', 'USD').
-                       - `amount`: Transaction amount.
-                       - `reference`: Transaction reference.
-                       - `gateway`: Payment gateway used (e.g., 'card', 'bank').
-                       - `channel`: Transaction channel (e.g., 'card', 'bank').
-                       - `plan`: Plan code associated with the transaction.
-
-        :return: Customized response with the list of transactions.
-                 Format: {
-                     "status_code": int,
-                     "message": str,
-                     "data": dict
-                 }
-
-        :raises APIError: If the API key is invalid or if there's an issue with the request.
+        references = iter(references)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="paystack-verify")
+        try:
+            pending = {executor.submit(self._bulk_verify_one, reference)
+                       for reference in itertools.islice(references, 2 * max_workers)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for reference in itertools.islice(references, len(done)):
+                    pending.add(executor.submit(self._bulk_verify_one, reference))
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _has_next_page(meta: Dict, page: int, page_size: int, per_page: int) -> bool:
+        """Decide from a list response's ``meta`` block whether another page exists."""
+        if meta.get("pageCount") is not None:
+            return page < int(meta["pageCount"])
+        if meta.get("total") is not None:
+            return page * per_page < int(meta["total"])
+        # No pagination block: a short page is the last one.
+        return page_size >= per_page > 0
+
+    def iter_transactions(self, per_page: int = 50, prefetch: bool = True, **kwargs: Dict) -> Iterator[Dict]:
         """
-        if not self.api_key:
-            raise APIError(401, "Invalid API Key")
-
-        valid_kwargs = {key: value for key, value in kwargs.items() if key in self.TRANSACTION_LIST_OPTIONAL_PARAMS}
-
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-
-        data = {
-            **valid_kwargs
-        }
-
-        response = requests.get(self.list_transaction_url, headers=headers, params=data)
+        Lazily yield every transaction matching the filters, across all pages.
 
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transactions details below",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
+        While the caller consumes page N, page N+1 is fetched on a background
+        thread, so at most two pages are held in memory at any time.
 
-        return custom_response
-
-    def fetch_transaction(self, id: int) -> Dict:
+        :param per_page: Number of transactions to request per page.
+        :param prefetch: Fetch the next page in the background (default True).
+        :param kwargs: Filters accepted by :meth:`list_transactions`. ``page``
+                       sets the first page to fetch.
+        :return: Iterator over transaction dicts.
+        :raises APIError: If any page request fails.
         """
-        Fetches the details of  a transaction using the id provided
-        :param id:
-            Transaction Id
-        """
-        if not self.api_key:
-            raise APIError(401, "Invalid Api Key")
-        url = f"{self.fetch_transaction_url}/{id}"
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction Successfully fetched",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
-        return custom_response
+        page = int(kwargs.pop("page", 1))
+        kwargs.pop("perPage", None)
 
-    def charge_authorization(self, email: str, amount: int, authorization_code: str, **kwargs: Dict) -> Dict:
-        """charge  a transaction"""
+        def fetch(page_number):
+            return self.list_transactions(perPage=per_page, page=page_number, **kwargs)["response_from_api"]
 
-        if not self.api_key:
-            raise APIError(401, "Invalid API Key")
-        valid_kwargs = {key: value for key, value in kwargs.items() if key in self.CHARGE_AUTHORIZATION_OPTIONAL_PARAMS}
-        if not amount:
-            raise APIError(400, "Missing required parameter amount")
-        if not email:
-            raise APIError(400, "Missing required parameter email")
-        if not authorization_code:
-            raise APIError(400, "Missing required parameter authorization_code")
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-        }
-        data = {
-            "amount": amount * 100,
-            "email": email,
-            "authorization_code": f"AUTH_{authorization_code}",
-            **valid_kwargs
-        }
-        response = requests.post(self.charge_authorization_url, headers=headers, json=data)
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction initialized successfully",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
-        return custom_response
-
-    def show_transaction_timeline(self, id_or_reference: str) -> Dict:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paystack-prefetch") if prefetch else None
+        try:
+            body = fetch(page)
+            while True:
+                data = body.get("data") or []
+                has_next = bool(data) and self._has_next_page(body.get("meta") or {}, page, len(data), per_page)
+                future = executor.submit(fetch, page + 1) if has_next and executor else None
+                yield from data
+                if not has_next:
+                    return
+                page += 1
+                body = future.result() if future else fetch(page)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _window_total(self, window: Window, filters: Dict) -> Optional[int]:
+        """Number of transactions in ``window``, from a one-row page (``None`` if not reported)."""
+        body = self.list_transactions(perPage=1, page=1, **window.params(), **filters)["response_from_api"]
+        meta = body.get("meta") or {}
+        return int(meta["total"]) if meta.get("total") is not None else None
+
+    def _window_page(self, window: Window, page: Optional[int], last: bool, per_page: int, filters: Dict) -> list:
+        """Rows of one page of ``window``; ``page=None`` walks the whole window."""
+        if page is None:
+            return list(self.iter_transactions(per_page=per_page, prefetch=False, **window.params(), **filters))
+        rows = []
+        while True:
+            body = self.list_transactions(perPage=per_page, page=page, **window.params(), **filters)
+            data = body["response_from_api"].get("data") or []
+            rows.extend(data)
+            # Rows created since the window was sized push older ones past its last page.
+            if not last or len(data) < per_page:
+                return rows
+            page += 1
+
+    def iter_transactions_sharded(self, from_date, to_date, shards: int = 8, max_workers: int = 8,
+                                  per_page: int = 100, max_pages_per_window: int = 10,
+                                  min_window: datetime.timedelta = datetime.timedelta(minutes=1),
+                                  **kwargs: Dict) -> Iterator[Dict]:
         """
-        SHow a transaction timeline
+        Yield every transaction between two dates by fetching time windows concurrently.
+
+        The range is cut into ``shards`` windows whose sizes are probed in
+        parallel; a window holding more than ``max_pages_per_window`` pages is
+        halved (down to ``min_window``) and probed again. All pages of all
+        windows are then fetched on ``max_workers`` threads with a bounded
+        lookahead and yielded in the same newest-first order as
+        :meth:`iter_transactions`, each transaction id at most once.
+
+        :param from_date: Start of the range (date, datetime or ISO-8601 string).
+        :param to_date: End of the range; a plain date includes that whole day.
+        :param shards: Number of initial windows.
+        :param max_workers: Maximum number of concurrent requests.
+        :param per_page: Number of transactions to request per page.
+        :param max_pages_per_window: Pages above which a window is split.
+        :param min_window: Windows are never split below this span.
+        :param kwargs: Other filters accepted by :meth:`list_transactions`.
+        :return: Iterator over transaction dicts.
+        :raises APIError: If any request fails.
         """
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-        url = f"{self.transaction_timeline_url}/{id_or_reference}"
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction timeline retrieved",
-                "response_from_api": response.json()
-            }
-        else:
-            error_message = response.text
-            raise APIError(response.status_code, error_message)
-        return custom_response
-
-    def get_total_transactions(self, per_page=50, page=1, from_date=None, to_date=None):
+        filters = {key: value for key, value in kwargs.items() if key not in ("from", "to", "page", "perPage")}
+        dense = per_page * max_pages_per_window
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="paystack-shard")
+        try:
+            totals: Dict[Window, Optional[int]] = {}
+            probes = {executor.submit(self._window_total, window, filters): window
+                      for window in split_range(from_date, to_date, shards)}
+            while probes:
+                done, _ = wait(probes, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = probes.pop(future)
+                    total = future.result()
+                    if total is not None and total > dense and window.span >= 2 * min_window:
+                        for half in window.halves():
+                            probes[executor.submit(self._window_total, half, filters)] = half
+                    else:
+                        totals[window] = total
+
+            def pages():
+                for window in sorted(totals, reverse=True):
+                    total = totals[window]
+                    if total is None:
+                        yield window, None, True
+                        continue
+                    page_count = -(-total // per_page)
+                    for page in range(1, page_count + 1):
+                        yield window, page, page == page_count
+
+            tasks = pages()
+            pending = collections.deque(executor.submit(self._window_page, *task, per_page, filters)
+                                        for task in itertools.islice(tasks, 2 * max_workers))
+            seen = set()
+            while pending:
+                rows = pending.popleft().result()
+                for task in itertools.islice(tasks, 1):
+                    pending.append(executor.submit(self._window_page, *task, per_page, filters))
+                for row in rows:
+                    row_id = row.get("id")
+                    if row_id is not None:
+                        if row_id in seen:
+                            continue
+                        seen.add(row_id)
+                    yield row
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_total_transactions(self, per_page=50, page=1, from_date=None, to_date=None, shards=1, max_workers=8,
+                               timeout=None):
         """
         Retrieve the total amount received on your account based on specified parameters.
 
         :param per_page: Number of records to retrieve per page (default is 50).
         :param page: Page number to retrieve (default is 1).
         :param from_date: Start date for listing transactions in the format 'YYYY-MM-DDTHH:mm:ss.SSSZ'.
-        :param to_date: End date for listing transactions in the format 'YYYY-MM-DDTHH:mm:ss.SSSZ'.
+        :param to_date: End date (inclusive) in the format 'YYYY-MM-DDTHH:mm:ss.SSSZ'; a plain
+                        date includes that whole day, sharded or not (see :func:`sharding.range_params`).
+        :param shards: Split ``from_date``..``to_date`` into this many windows, total them
+                       concurrently and sum the results (see :func:`sharding.merge_totals`).
+        :param max_workers: Maximum number of concurrent requests when sharding.
+        :param timeout: Deadline in seconds (default: the client's); each shard gets its own.
 
         :return: Customized response with the total amount received.
                  Format: {
@@ -295,47 +320,164 @@ class Transaction(PaystackAPI):
         if not self.api_key:
             raise APIError(401, "Invalid API Key")
 
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
+        if shards > 1:
+            return self._sharded_totals(per_page, page, from_date, to_date, shards, max_workers, timeout)
 
         params = {
             'perPage': per_page,
             'page': page,
-            'from': from_date,
-            'to': to_date
+            **range_params(from_date, to_date)
         }
 
-        response = requests.get(self.transaction_totals_url, headers=headers, params=params)
+        response = self._request("GET", self.transaction_totals_url, params=params, timeout=timeout)
 
         if response.status_code == 200:
-            custom_response = {
-                "status_code": response.status_code,
-                "message": "Transaction totals retrieved successfully",
-                "response_from_api": response.json()
-            }
+            custom_response = PaystackResponse.from_http(response, "Transaction totals retrieved successfully")
         else:
             error_message = response.text
             raise APIError(response.status_code, error_message)
 
         return custom_response
     
-    def download_csv(self, url, output_filename='exported_file.csv'):
-        response = requests.get(url)
-        response.raise_for_status()
-
-        with open(output_filename, 'wb') as file:
-            file.write(response.content)
-
-        print(f'File downloaded successfully: {output_filename}')
+    def _sharded_totals(self, per_page, page, from_date, to_date, shards, max_workers,
+                        timeout=None) -> PaystackResponse:
+        if not from_date or not to_date:
+            raise APIError(400, "Missing required parameters for sharded totals: from_date and to_date")
+
+        def window_totals(window: Window) -> Dict:
+            params = window.params()
+            response = self.get_total_transactions(per_page, page, params["from"], params["to"], timeout=timeout)
+            return response["response_from_api"].get("data") or {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="paystack-shard") as executor:
+            parts = list(executor.map(window_totals, split_range(from_date, to_date, shards)))
+        body = {"status": True, "message": "Transaction totals", "data": merge_totals(parts)}
+        return PaystackResponse(200, "Transaction totals retrieved successfully", json.dumps(body).encode(), body)
+
+    @staticmethod
+    def _content_total(response: requests.Response, offset: int) -> Optional[int]:
+        """Full size of the file being downloaded, if the server says."""
+        content_range = response.headers.get('Content-Range', '')
+        if response.status_code == 206 and '/' in content_range:
+            total = content_range.rsplit('/', 1)[1]
+            return int(total) if total.isdigit() else None
+        length = response.headers.get('Content-Length')
+        return int(length) + offset if length and length.isdigit() else None
+
+    @staticmethod
+    def _validator(headers) -> Optional[str]:
+        """``If-Range`` value identifying this version of a file: a strong ETag, else Last-Modified."""
+        etag = headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return headers.get('Last-Modified')
+
+    @staticmethod
+    def _resume_state(part_filename: str, url: str):
+        """
+        ``(offset, validator)`` of a ``.part`` file left by an earlier download.
 
-    def export_transactions(self, per_page=50, page=1, filename="export.csv", **kwargs):
+        It is only kept if its ``.part.json`` record names the same ``url`` and
+        a validator to send as ``If-Range``; anything else (another export
+        written to the same filename, an unknown version) is discarded.
+        """
+        state_filename = f"{part_filename}.json"
+        try:
+            with open(state_filename) as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            state = {}
+        if os.path.exists(part_filename) and state.get('url') == url and state.get('validator'):
+            return os.path.getsize(part_filename), state['validator']
+        for stale in (part_filename, state_filename):
+            if os.path.exists(stale):
+                os.remove(stale)
+        return 0, None
+
+    @staticmethod
+    def _save_resume_state(part_filename: str, url: str, validator: Optional[str]) -> None:
+        with open(f"{part_filename}.json", 'w') as file:
+            json.dump({'url': url, 'validator': validator}, file)
+
+    def download_csv(self, url, output_filename='exported_file.csv', chunk_size=DOWNLOAD_CHUNK_SIZE,
+                     timeout=DOWNLOAD_TIMEOUT, max_resumes=3,
+                     progress_callback: Optional[Callable[[int, Optional[int], float], None]] = None) -> str:
+        """
+        Stream an exported file to disk in fixed-size chunks.
+
+        The body is written to ``<output_filename>.part`` and renamed into place
+        once complete, so readers never see a truncated file. If the connection
+        drops, the download resumes from the bytes already on disk with an HTTP
+        Range request. A ``.part`` file left by an earlier call is only resumed
+        if it was downloaded from the same ``url`` and the server confirms,
+        through ``If-Range``, that the file has not changed since.
+
+        :param url: URL of the exported file.
+        :param output_filename: Destination path.
+        :param chunk_size: Bytes read from the socket per write.
+        :param timeout: ``(connect, read)`` timeout in seconds.
+        :param max_resumes: How many times to resume after a dropped connection.
+        :param progress_callback: Called after every chunk as
+                                  ``callback(bytes_done, total_bytes_or_None, bytes_per_second)``.
+        :return: ``output_filename``.
+        :raises requests.exceptions.RequestException: If the download fails for good.
+        """
+        part_filename = f"{output_filename}.part"
+        offset, validator = self._resume_state(part_filename, url)
+        started = time.monotonic()
+        received = 0
+        resumes = 0
+        while True:
+            # The export lives on a third-party host; never send it our secret key.
+            headers = {'Authorization': None}
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+                if validator:
+                    headers['If-Range'] = validator
+            try:
+                with self._request("GET", url, headers=headers, stream=True, timeout=timeout) as response:
+                    if response.status_code == 416 and offset:
+                        # Nothing left to fetch: the partial file is already complete.
+                        break
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        # Range ignored or the file changed (If-Range), start over.
+                        offset = 0
+                    if not offset:
+                        validator = self._validator(response.headers)
+                        self._save_resume_state(part_filename, url, validator)
+                    total = self._content_total(response, offset)
+                    with open(part_filename, 'ab' if offset else 'wb') as file:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            file.write(chunk)
+                            offset += len(chunk)
+                            received += len(chunk)
+                            if progress_callback:
+                                elapsed = time.monotonic() - started
+                                progress_callback(offset, total, received / elapsed if elapsed else 0.0)
+                if total is None or offset >= total:
+                    break
+                raise requests.exceptions.ChunkedEncodingError(
+                    f"Connection closed after {offset} of {total} bytes")
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout):
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+
+        os.replace(part_filename, output_filename)
+        os.remove(f"{part_filename}.json")
+        return output_filename
+
+    def export_transactions(self, per_page=50, page=1, filename="export.csv", timeout=None, **kwargs):
         """
         initiate the export, and download the CSV file.
 
         :param per_page: Number of records to retrieve per page (default is 50).
         :param page: Page number to retrieve (default is 1).
         :param filename: Optional filename for the exported CSV file.
+        :param timeout: Deadline in seconds of the export request (default: the client's);
+                        the download itself is bounded by ``DOWNLOAD_TIMEOUT``.
 
         :return: Customized response indicating the success of the export.
                  Format: {
@@ -351,17 +493,13 @@ class Transaction(PaystackAPI):
         optional_kwargs = {key: value for key, value in kwargs.items() if key in self.EXPORT_OPTIONAL_PARAMS}
         if not self.api_key:
             raise APIError(401, "Invalid API key")
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-
         params = {
             'perPage': per_page,
             'page': page,
             **optional_kwargs
         }
         try:
-            response = requests.get(self.export_transactions_url, headers=headers, params=params)
+            response = self._request("GET", self.export_transactions_url, params=params, timeout=timeout)
             if response.status_code == 200:
                data = response.json()
                url_to_visit = data['data']['path']
@@ -387,3 +525,95 @@ class Transaction(PaystackAPI):
             raise APIError(500, f"Timeout Error: {errt}")
         except requests.exceptions.RequestException as err:
             raise APIError(500, f"An error occurred: {err}")
+
+    def _export_page_count(self, per_page: int, timeout: Optional[float], filters: Dict) -> int:
+        """
+        Pages an export of ``per_page`` rows will have at most, from the listing's ``meta``.
+
+        Filters the listing does not support (``settled``, ``settlement``,
+        ``payment_page``) cannot narrow the count, so it may be too high.
+        """
+        filters = {key: value for key, value in filters.items() if key in self.TRANSACTION_LIST_OPTIONAL_PARAMS}
+        meta = self.list_transactions(perPage=per_page, page=1, timeout=timeout, **filters).body.get("meta") or {}
+        if meta.get("pageCount") is not None:
+            return int(meta["pageCount"])
+        return -(-int(meta.get("total") or 0) // per_page)
+
+    def export_all_transactions(self, filename="export.csv", per_page=50, pages=None, max_workers=4, compress=None,
+                                timeout=None, **kwargs) -> Dict:
+        """
+        Export every page concurrently and merge them into one CSV file.
+
+        ``max_workers`` threads run :meth:`export_transactions` for one page
+        each into a temporary directory next to ``filename``. Pages are
+        appended to the output in page order as soon as each is ready, with
+        the header written once, and then deleted. The first page without
+        rows ends the export, since the default page count may cover more
+        than the export filters select. At most ``2 * max_workers``
+        pages are on disk and one chunk in memory at a time, however many
+        pages there are. The output is written to ``<filename>.part`` and
+        renamed into place when complete.
+
+        :param filename: Merged output file.
+        :param per_page: Number of records per export page.
+        :param pages: Maximum number of pages to export; by default the ``pageCount``
+                      of :meth:`list_transactions` with the filters it supports.
+        :param max_workers: Maximum number of pages exported at once.
+        :param compress: gzip the output; by default only if ``filename`` ends with ``.gz``.
+        :param timeout: Deadline in seconds of each export request (default: the client's).
+        :param kwargs: Export filters, see :meth:`export_transactions`.
+        :return: ``{"status_code": 200, "message": str, "data": {"exported_file": str, "pages": int}}``,
+                 ``pages`` being the number of pages with rows.
+        :raises APIError: If the API key is invalid or any page fails to export.
+        """
+        if not self.api_key:
+            raise APIError(401, "Invalid API key")
+        if pages is None:
+            pages = self._export_page_count(per_page, timeout, kwargs)
+        directory = tempfile.mkdtemp(prefix=".paystack-export-", dir=os.path.dirname(os.path.abspath(filename)))
+        part_filename = f"{filename}.part"
+        if compress is None:
+            compress = filename.endswith(".gz")
+
+        def export_page(page: int) -> str:
+            path = os.path.join(directory, f"page-{page}.csv")
+            result = self.export_transactions(per_page, page, filename=path, timeout=timeout, **kwargs)
+            if result["status_code"] != 200:
+                raise APIError(result["status_code"], f"Export of page {page} failed")
+            return path
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="paystack-export")
+        try:
+            numbers = iter(range(1, pages + 1))
+            pending = collections.deque(executor.submit(export_page, page)
+                                        for page in itertools.islice(numbers, 2 * max_workers))
+            header_written, exported = False, 0
+            with open_merged_export(part_filename, compress) as output:
+                while pending:
+                    path = pending.popleft().result()
+                    copied = append_export(output, path, not header_written, self.DOWNLOAD_CHUNK_SIZE)
+                    os.remove(path)
+                    header_written = header_written or copied is not None
+                    if not copied:
+                        break
+                    exported += 1
+                    for page in itertools.islice(numbers, 1):
+                        pending.append(executor.submit(export_page, page))
+            os.replace(part_filename, filename)
+        except BaseException:
+            if os.path.exists(part_filename):
+                os.remove(part_filename)
+            raise
+        finally:
+            # Let running downloads finish before their directory goes away.
+            executor.shutdown(wait=True, cancel_futures=True)
+            shutil.rmtree(directory, ignore_errors=True)
+
+        return {
+            "status_code": 200,
+            "message": f"{exported} pages of transactions exported successfully to {filename}",
+            "data": {
+                "exported_file": filename,
+                "pages": exported
+            }
+        }
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""Pluggable HTTP transports behind PaystackAPI"""
+import asyncio
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .tracing import TimedHTTPAdapter
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                  keep_alive: bool = True, timed: bool = False,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Build a ``requests.Session`` with one pooled adapter for http and https.
+
+    :param timed: Mount a :class:`TimedHTTPAdapter`, needed by clients with ``hooks``.
+    :param headers: Headers sent with every request, e.g. ``Authorization``.
+    """
+    session = requests.Session()
+    adapter_class = TimedHTTPAdapter if timed else HTTPAdapter
+    adapter = adapter_class(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers or {})
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+class Transport:
+    """
+    Sends the HTTP requests of a :class:`PaystackAPI` client.
+
+    ``request`` takes the keyword arguments of ``requests.Session.request``
+    (``params``, ``json``, ``headers``, ``timeout``, ``stream``...) and
+    returns a ``requests.Response``; failures raise ``requests`` exceptions,
+    which is what the retry and error handling above it expect. Register a
+    subclass in :data:`TRANSPORTS` to select it by name.
+    """
+    name = "transport"
+    # Plain ``requests.Session`` (used for streamed downloads).
+    session: requests.Session
+
+    @classmethod
+    def for_client(cls, client) -> "Transport":
+        """Build a transport from a client's pool options and headers."""
+        raise NotImplementedError
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 keep-alive through a pooled ``requests.Session`` (the default)."""
+    name = "requests"
+
+    def __init__(self, session: Optional[requests.Session] = None, **pool_options) -> None:
+        """
+        :param session: Session to send through; built from ``pool_options`` (see :func:`build_session`) if omitted.
+        """
+        self.session = session if session is not None else build_session(**pool_options)
+
+    @classmethod
+    def for_client(cls, client) -> "RequestsTransport":
+        return cls(pool_connections=client.pool_connections, pool_maxsize=client.pool_maxsize,
+                   pool_block=client.pool_block, keep_alive=client.keep_alive, timed=client.hooks is not None,
+                   headers=client.headers)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    HTTP/2 through ``httpx``: concurrent calls from any number of threads are
+    multiplexed as streams over one connection per host, instead of taking
+    one pooled socket each. Requires ``pip install paystackpyAPI[http2]``.
+
+    httpx's synchronous HTTP/2 connection is not safe to share between
+    threads, so the connection is owned by an ``AsyncClient`` on a private
+    event loop thread (started on first use) and callers wait on it.
+
+    HTTP/2 is negotiated with TLS ALPN, falling back to HTTP/1.1 if the
+    server does not offer it; ``prior_knowledge=True`` speaks cleartext
+    HTTP/2 directly (local test servers). Streamed downloads go through a
+    plain ``requests`` session, and request hooks only see the total time of
+    each attempt, not its phases.
+    """
+    name = "http2"
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, max_connections: int = 10,
+                 keepalive_expiry: float = 60.0, prior_knowledge: bool = False, **pool_options) -> None:
+        """
+        :param headers: Headers sent with every request, e.g. ``Authorization``.
+        :param max_connections: Maximum number of connections; one per host is enough for HTTP/2.
+        :param keepalive_expiry: Seconds an idle connection is kept open.
+        :param prior_knowledge: Use cleartext HTTP/2 without negotiation (``http://`` URLs).
+        :param pool_options: Options of the ``requests`` session used for streamed downloads.
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("HTTP2Transport requires httpx with HTTP/2 support: "
+                              "pip install paystackpyAPI[http2]") from exc
+        self._httpx = httpx
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                              keepalive_expiry=keepalive_expiry)
+        self._client_options = dict(http1=not prior_knowledge, http2=True, headers=headers, limits=limits)
+        self.client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._headers = dict(headers or {})
+        self._pool_options = pool_options
+        self._session: Optional[requests.Session] = None
+
+    @classmethod
+    def for_client(cls, client) -> "HTTP2Transport":
+        return cls(headers=client.headers, max_connections=client.pool_maxsize, pool_maxsize=client.pool_maxsize,
+                   pool_block=client.pool_block, keep_alive=client.keep_alive)
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = build_session(headers=self._headers, **self._pool_options)
+        return self._session
+
+    def _start(self):
+        """The running ``(loop, client)`` pair, started on first use or after :meth:`close`."""
+        with self._lock:
+            if self._loop is None:
+                # Like a requests session, a closed transport reconnects on its next request.
+                self.client = self._httpx.AsyncClient(**self._client_options)
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="paystack-http2", daemon=True)
+                self._thread.start()
+            return self._loop, self.client
+
+    def _timeout(self, timeout):
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def request(self, method: str, url: str, params=None, json=None, data=None, headers=None, timeout=None,
+                stream: bool = False, **kwargs) -> requests.Response:
+        if stream:
+            return self.session.request(method, url, params=params, json=json, data=data, headers=headers,
+                                        timeout=timeout, stream=True, **kwargs)
+        httpx = self._httpx
+        headers = headers or {}
+        # requests semantics: None drops a query parameter, or a header set on the client.
+        params = {key: value for key, value in params.items() if value is not None} if params else None
+        sent_headers = {key: value for key, value in headers.items() if value is not None}
+        loop, client = self._start()
+        request = client.build_request(method, url, params=params, json=json, data=data, headers=sent_headers,
+                                       timeout=self._timeout(timeout))
+        for key, value in headers.items():
+            if value is None:
+                request.headers.pop(key, None)
+        try:
+            response = asyncio.run_coroutine_threadsafe(client.send(request), loop).result()
+        except httpx.ConnectTimeout as error:
+            raise requests.exceptions.ConnectTimeout(str(error)) from error
+        except httpx.TimeoutException as error:
+            raise requests.exceptions.ReadTimeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.exceptions.ConnectionError(str(error)) from error
+        except httpx.HTTPError as error:
+            raise requests.exceptions.RequestException(str(error)) from error
+        return self._to_requests(response)
+
+    @staticmethod
+    def _to_requests(response) -> requests.Response:
+        """Present an ``httpx.Response`` as the ``requests.Response`` the rest of the client expects."""
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers.items())
+        result.url = str(response.url)
+        result.encoding = response.charset_encoding
+        result.elapsed = response.elapsed
+        result._content = response.content
+        result._content_consumed = True
+        prepared = requests.PreparedRequest()
+        prepared.method = response.request.method
+        prepared.url = str(response.request.url)
+        prepared.headers = CaseInsensitiveDict(response.request.headers.items())
+        prepared.body = response.request.content or None
+        result.request = prepared
+        result.http_version = response.http_version
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread, client, self._loop = self._loop, self._thread, self.client, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        if self._session is not None:
+            self._session.close()
+
+
+TRANSPORTS = {transport.name: transport for transport in (RequestsTransport, HTTP2Transport)}
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+"""Track many pending transactions together until they settle"""
+import datetime
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from .cache import ResponseCache
+from .sharding import format_timestamp
+from .transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+class _Pending:
+    __slots__ = ("reference", "future", "deadline", "next_check", "interval", "since")
+
+    def __init__(self, reference: str, future: Future, deadline: float, interval: float) -> None:
+        self.reference = reference
+        self.future = future
+        self.deadline = deadline
+        self.next_check = time.monotonic() + interval
+        self.interval = interval
+        self.since = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class SettlementWaiter:
+    """
+    Resolve futures when pending transactions reach a terminal status.
+
+    Instead of every caller polling ``verify_transaction`` in its own loop,
+    references are registered with one waiter whose background thread checks
+    them together. Each reference is re-checked on its own backoff schedule
+    (``poll_interval`` growing by ``backoff`` up to ``max_interval``). When
+    at least ``scan_threshold`` references are due at once, the waiter lists
+    recent transactions instead and settles every reference found on those
+    pages. The scan stops as soon as it would cost more pages than there are
+    references left, and those are verified one by one::
+
+        with SettlementWaiter(transaction) as waiter:
+            future = waiter.wait_for(response.transaction.reference, timeout=600)
+            future.add_done_callback(notify)
+            ...
+            transaction = future.result()       # dict, status is success/failed/reversed
+
+    Futures fail with ``TimeoutError`` at their deadline. From asyncio, await
+    ``asyncio.wrap_future(future)``.
+    """
+    TERMINAL_STATUSES = ResponseCache.TERMINAL_STATUSES
+
+    def __init__(self, transaction: Transaction, poll_interval: float = 2.0, max_interval: float = 60.0,
+                 backoff: float = 1.5, default_timeout: float = 900.0, scan_threshold: int = 10,
+                 per_page: int = 100, scan_slack: float = 300.0, max_workers: int = 8,
+                 batch_window: float = 0.5) -> None:
+        """
+        :param transaction: Client used to verify and list transactions.
+        :param poll_interval: Seconds before a new reference is first checked.
+        :param max_interval: Upper bound of the per-reference backoff.
+        :param backoff: Factor the interval grows by after each non-terminal check.
+        :param default_timeout: Deadline in seconds when :meth:`wait_for` gets none.
+        :param scan_threshold: Minimum number of due references for a ``list_transactions`` scan.
+        :param per_page: Page size of scans.
+        :param scan_slack: Seconds scans reach back before the oldest registration (clock skew).
+        :param max_workers: Concurrent ``verify_transaction`` calls.
+        :param batch_window: References due within this many seconds of each other are
+                             checked together (capped at half of ``poll_interval``).
+        """
+        self.transaction = transaction
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.default_timeout = default_timeout
+        self.scan_threshold = scan_threshold
+        self.per_page = per_page
+        self.scan_slack = datetime.timedelta(seconds=scan_slack)
+        self.max_workers = max_workers
+        self.batch_window = min(batch_window, poll_interval / 2)
+        self._pending: Dict[str, _Pending] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"verifies": 0, "scans": 0, "scan_pages": 0, "settled": 0, "timeouts": 0}
+
+    def wait_for(self, reference: str, timeout: Optional[float] = None,
+                 callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Track ``reference`` until it settles.
+
+        :param reference: Transaction reference.
+        :param timeout: Seconds until the future fails with ``TimeoutError``.
+        :param callback: Optional ``callback(future)`` run once it is resolved.
+        :return: Future resolving to the transaction dict. Waiting twice for
+                 the same reference returns the same future.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SettlementWaiter is closed")
+            entry = self._pending.get(reference)
+            if entry is None:
+                deadline = time.monotonic() + (self.default_timeout if timeout is None else timeout)
+                entry = self._pending[reference] = _Pending(reference, Future(), deadline, self.poll_interval)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="paystack-waiter", daemon=True)
+                    self._thread.start()
+                self._condition.notify()
+        if callback is not None:
+            entry.future.add_done_callback(callback)
+        return entry.future
+
+    def wait_for_many(self, references, timeout: Optional[float] = None) -> Dict[str, Future]:
+        return {reference: self.wait_for(reference, timeout) for reference in references}
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    wake = min((min(entry.next_check, entry.deadline) for entry in self._pending.values()),
+                               default=None)
+                    if wake is not None and wake <= now:
+                        break
+                    self._condition.wait(None if wake is None else wake - now)
+                if self._closed:
+                    return
+                now = time.monotonic()
+                expired = [entry for entry in self._pending.values() if entry.deadline <= now]
+                due = [entry for entry in self._pending.values()
+                       if entry.next_check <= now + self.batch_window and now < entry.deadline]
+            for entry in expired:
+                self._settle(entry, error=TimeoutError(f"{entry.reference} did not settle before its deadline"))
+            if due:
+                try:
+                    self._check(due)
+                except Exception:
+                    logger.exception("Settlement check failed")
+                    for entry in due:
+                        self._reschedule(entry)
+
+    def _check(self, due: List[_Pending]) -> None:
+        remaining = {entry.reference: entry for entry in due}
+        if len(remaining) >= self.scan_threshold:
+            self._scan(remaining)
+        if remaining:
+            self._verify(remaining)
+
+    def _scan(self, remaining: Dict[str, _Pending]) -> None:
+        """Settle references found in the recent transaction list; stop once verifying is cheaper."""
+        since = min(entry.since for entry in remaining.values()) - self.scan_slack
+        self.stats["scans"] += 1
+        page = 1
+        while remaining:
+            body = self.transaction.list_transactions(perPage=self.per_page, page=page,
+                                                      **{"from": format_timestamp(since)})["response_from_api"]
+            self.stats["scan_pages"] += 1
+            data = body.get("data") or []
+            for transaction in data:
+                entry = remaining.get(transaction.get("reference"))
+                if entry is None:
+                    continue
+                if transaction.get("status") in self.TERMINAL_STATUSES:
+                    self._settle(entry, transaction)
+                else:
+                    self._reschedule(entry)
+                del remaining[entry.reference]
+            meta = body.get("meta") or {}
+            pages_left = Transaction._has_next_page(meta, page, len(data), self.per_page)
+            if not data or not pages_left:
+                return
+            total = meta.get("total")
+            if total is not None and -(-int(total) // self.per_page) - page >= len(remaining):
+                return
+            page += 1
+
+    def _verify(self, remaining: Dict[str, _Pending]) -> None:
+        self.stats["verifies"] += len(remaining)
+        for result in self.transaction.verify_transactions(list(remaining), max_workers=self.max_workers):
+            entry = remaining[result.reference]
+            transaction = result.response.data if result.response is not None else None
+            if isinstance(transaction, dict) and transaction.get("status") in self.TERMINAL_STATUSES:
+                self._settle(entry, transaction)
+            else:
+                # Not terminal yet, not created yet (404) or a transient error: try again later.
+                self._reschedule(entry)
+
+    def _reschedule(self, entry: _Pending) -> None:
+        entry.interval = min(entry.interval * self.backoff, self.max_interval)
+        entry.next_check = time.monotonic() + entry.interval * random.uniform(0.8, 1.0)
+
+    def _settle(self, entry: _Pending, transaction: Optional[Dict] = None,
+                error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            if self._pending.get(entry.reference) is not entry:
+                return
+            del self._pending[entry.reference]
+        if not entry.future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            self.stats["timeouts"] += 1
+            entry.future.set_exception(error)
+        else:
+            self.stats["settled"] += 1
+            entry.future.set_result(transaction)
+
+    def close(self) -> None:
+        """Stop polling; futures still pending are cancelled."""
+        with self._condition:
+            self._closed = True
+            pending, self._pending = list(self._pending.values()), {}
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        for entry in pending:
+            entry.future.cancel()
+
+    def __enter__(self) -> "SettlementWaiter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
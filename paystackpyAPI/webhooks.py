@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+
+"""Verify, deduplicate and dispatch Paystack webhook events"""
+import asyncio
+import hashlib
+import hmac
+import inspect
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional
+
+from .models import TransactionData, loads
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "x-paystack-signature"
+OK, UNAUTHORIZED, BAD_REQUEST, UNAVAILABLE = 200, 401, 400, 503
+STATUS_LINES = {OK: "200 OK", UNAUTHORIZED: "401 Unauthorized", BAD_REQUEST: "400 Bad Request",
+                UNAVAILABLE: "503 Service Unavailable", 405: "405 Method Not Allowed"}
+
+
+def compute_signature(secret: str, body: bytes) -> str:
+    """Hex HMAC-SHA512 of the raw request body, keyed with the secret key, as Paystack sends it."""
+    return hmac.new(secret.encode(), body, hashlib.sha512).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Constant-time check of an ``x-paystack-signature`` header against the raw body."""
+    if not signature:
+        return False
+    # Compared as bytes: compare_digest rejects non-ASCII str, and headers arrive decoded as latin-1.
+    received = signature.strip().lower().encode("latin-1", "replace")
+    return hmac.compare_digest(compute_signature(secret, body).encode(), received)
+
+
+class WebhookEvent:
+    """
+    One decoded webhook delivery.
+
+    ``key`` identifies the event across redeliveries: the event type plus the
+    object id when there is one, else a digest of the body.
+    """
+    __slots__ = ("event", "data", "body", "received_at", "key")
+
+    def __init__(self, event: str, data, body: bytes) -> None:
+        self.event = event
+        self.data = data
+        self.body = body
+        self.received_at = time.time()
+        object_id = data.get("id") if isinstance(data, dict) else None
+        self.key = f"{event}:{object_id}" if object_id is not None else hashlib.sha256(body).hexdigest()
+
+    @classmethod
+    def parse(cls, body: bytes) -> "WebhookEvent":
+        payload = loads(body)
+        if not isinstance(payload, dict) or not isinstance(payload.get("event"), str):
+            raise ValueError("Not a Paystack event")
+        return cls(payload["event"], payload.get("data") or {}, body)
+
+    @property
+    def transaction(self) -> Optional[TransactionData]:
+        """Typed view of ``data`` for ``charge.*`` events."""
+        if self.event.startswith("charge.") and isinstance(self.data, dict):
+            return TransactionData(self.data)
+        return None
+
+    def __repr__(self) -> str:
+        return f"<WebhookEvent {self.event} key={self.key}>"
+
+
+class SeenSet:
+    """Thread-safe, size-bounded set of recently seen keys (oldest forgotten first)."""
+
+    def __init__(self, max_size: int = 100000) -> None:
+        self.max_size = max_size
+        self._keys: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: Hashable) -> bool:
+        """Remember ``key``; returns False if it was already present."""
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return False
+            self._keys[key] = None
+            if len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._keys
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+
+class _WebhookProcessorBase:
+    def __init__(self, secret: str, seen: Optional[SeenSet] = None) -> None:
+        self.secret = secret
+        self.seen = seen if seen is not None else SeenSet()
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._counters = {"received": 0, "invalid_signature": 0, "malformed": 0, "duplicates": 0,
+                          "dispatched": 0, "handler_errors": 0, "rejected": 0}
+        self._counter_lock = threading.Lock()
+
+    def on(self, event: str, handler: Optional[Callable] = None):
+        """
+        Register ``handler(event)`` for an event type (``"*"`` for every event).
+
+        Usable as a decorator: ``@processor.on("charge.success")``.
+        """
+        if handler is None:
+            return lambda function: self.on(event, function)
+        self._handlers.setdefault(event, []).append(handler)
+        return handler
+
+    def _count(self, name: str) -> None:
+        with self._counter_lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._counter_lock:
+            return dict(self._counters)
+
+    def _accept(self, body: bytes, signature: Optional[str]):
+        """``(status, event)``; ``event`` is set only for new, verified events to dispatch."""
+        self._count("received")
+        if not verify_signature(self.secret, body, signature):
+            self._count("invalid_signature")
+            return UNAUTHORIZED, None
+        try:
+            event = WebhookEvent.parse(body)
+        except ValueError:
+            self._count("malformed")
+            return BAD_REQUEST, None
+        if not self.seen.add(event.key):
+            self._count("duplicates")
+            return OK, None
+        return OK, event
+
+    def _handlers_for(self, event: WebhookEvent) -> List[Callable]:
+        return self._handlers.get(event.event, []) + self._handlers.get("*", [])
+
+
+class WebhookProcessor(_WebhookProcessorBase):
+    """
+    Thread-pool webhook dispatcher::
+
+        processor = WebhookProcessor(secret_key, workers=8)
+
+        @processor.on("charge.success")
+        def fulfil(event):
+            orders.mark_paid(event.transaction.reference)
+
+        app = wsgi_app(processor)   # mount in any WSGI server
+
+    :meth:`handle` verifies and deduplicates on the request thread and only
+    queues the event, so the HTTP response goes back immediately. When the
+    queue is full it answers 503 so that Paystack redelivers later.
+    """
+
+    def __init__(self, secret: str, workers: int = 4, queue_size: int = 10000,
+                 seen: Optional[SeenSet] = None) -> None:
+        """
+        :param secret: Paystack secret key the deliveries are signed with.
+        :param workers: Number of handler threads.
+        :param queue_size: Maximum number of accepted events waiting for a worker.
+        :param seen: Dedupe set, e.g. shared between processors (default: 100k entries).
+        """
+        super().__init__(secret, seen)
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[WebhookEvent]]" = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"paystack-webhook-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is None:
+                    return
+                self.dispatch(event)
+            finally:
+                self._queue.task_done()
+
+    def dispatch(self, event: WebhookEvent) -> None:
+        """Run every handler registered for ``event`` on the calling thread."""
+        for handler in self._handlers_for(event):
+            try:
+                handler(event)
+            except Exception:
+                self._count("handler_errors")
+                logger.exception("Webhook handler %r failed for %r", handler, event)
+        self._count("dispatched")
+
+    def handle(self, body: bytes, signature: Optional[str]) -> int:
+        """Process one delivery; returns the HTTP status to answer with."""
+        status, event = self._accept(body, signature)
+        if event is None:
+            return status
+        if not self._threads:
+            self._start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.seen.discard(event.key)
+            self._count("rejected")
+            return UNAVAILABLE
+        return OK
+
+    def join(self) -> None:
+        """Block until every queued event was dispatched."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Dispatch what is queued, then stop the workers."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+
+class AsyncWebhookProcessor(_WebhookProcessorBase):
+    """
+    asyncio counterpart of :class:`WebhookProcessor`: events go through an
+    ``asyncio.Queue`` to ``workers`` tasks. Handlers may be plain functions or
+    coroutines. Mount with :func:`asgi_app`.
+    """
+
+    def __init__(self, secret: str, workers: int = 4, queue_size: int = 10000,
+                 seen: Optional[SeenSet] = None) -> None:
+        super().__init__(secret, seen)
+        self.workers = workers
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def _work(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                await self.dispatch(event)
+            finally:
+                self._queue.task_done()
+
+    async def dispatch(self, event: WebhookEvent) -> None:
+        for handler in self._handlers_for(event):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self._count("handler_errors")
+                logger.exception("Webhook handler %r failed for %r", handler, event)
+        self._count("dispatched")
+
+    async def handle(self, body: bytes, signature: Optional[str]) -> int:
+        status, event = self._accept(body, signature)
+        if event is None:
+            return status
+        if self._queue is None:
+            self._start()
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.seen.discard(event.key)
+            self._count("rejected")
+            return UNAVAILABLE
+        return OK
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Dispatch what is queued, then cancel the workers."""
+        await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue, self._tasks = None, []
+
+
+def wsgi_app(processor: WebhookProcessor, max_body: int = 1024 * 1024):
+    """Minimal WSGI application accepting Paystack deliveries on any path."""
+
+    def app(environ, start_response):
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = 405
+        else:
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = -1
+            if not 0 <= length <= max_body:
+                status = BAD_REQUEST
+            else:
+                body = environ["wsgi.input"].read(length)
+                status = processor.handle(body, environ.get("HTTP_X_PAYSTACK_SIGNATURE"))
+        start_response(STATUS_LINES[status], [("Content-Type", "text/plain"), ("Content-Length", "0")])
+        return [b""]
+    return app
+
+
+def asgi_app(processor: AsyncWebhookProcessor, max_body: int = 1024 * 1024):
+    """Minimal ASGI (HTTP) application accepting Paystack deliveries on any path."""
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        status = 405
+        if scope["method"] == "POST":
+            chunks, size, more = [], 0, True
+            while more:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > max_body:
+                    status = BAD_REQUEST
+                    break
+                chunks.append(chunk)
+                more = message.get("more_body", False)
+            else:
+                signature = None
+                for name, value in scope.get("headers", []):
+                    if name.lower() == SIGNATURE_HEADER.encode():
+                        signature = value.decode("latin-1")
+                status = await processor.handle(b"".join(chunks), signature)
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"text/plain"), (b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
+    return app
@@ -12,8 +12,13 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/NUCCASJNR/PaystackPy",  # Replace with your GitHub repository URL
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=["requests"],
+    extras_require={
+        "async": ["httpx"],
+        "http2": ["httpx[http2]"],
+        "fast": ["orjson"],
+    },
     entry_points={
         'console_scripts': [
             'paystack-transaction=paystackpyAPI.transaction:Transaction',
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import unittest
+from paystackpyAPI.async_transaction import AsyncTransaction
+from paystackpyAPI.retry import CircuitBreaker
+from errors import APIError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def handler(request):
+    if request.url.path.startswith("/transaction/verify/"):
+        reference = request.url.path.rsplit("/", 1)[-1]
+        if reference == "missing":
+            return httpx.Response(404, json={"status": False, "message": "Transaction reference not found"})
+        return httpx.Response(200, json={"status": True, "data": {"reference": reference, "status": "success"}})
+    if request.url.path == "/transaction/initialize":
+        return httpx.Response(200, json={"status": True, "data": json.loads(request.content)})
+    if request.url.path == "/transaction" and "page" in request.url.params:
+        page, per_page = int(request.url.params["page"]), int(request.url.params["perPage"])
+        ids = range((page - 1) * per_page + 1, min(page * per_page, 7) + 1)
+        return httpx.Response(200, json={"status": True, "data": [{"id": i} for i in ids],
+                                         "meta": {"total": 7, "page": page, "pageCount": 3}})
+    if request.url.path == "/transaction":
+        return httpx.Response(200, json={"status": True, "data": [], "meta": dict(request.url.params)})
+    return httpx.Response(404, json={"status": False})
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncTransaction(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = AsyncTransaction("sk_test_key", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.api.aclose()
+
+    async def test_concurrent_verifies(self):
+        references = [f"ref-{i}" for i in range(50)]
+        results = await asyncio.gather(*(self.api.verify_transaction(ref) for ref in references))
+        self.assertEqual([r["response_from_api"]["data"]["reference"] for r in results], references)
+        self.assertEqual(results[0]["message"], "Transaction details retrieved successfully")
+
+    async def test_initialize_filters_params(self):
+        response = await self.api.initialize_transaction("test@example.com", 10, currency="NGN", bogus=1)
+        data = response["response_from_api"]["data"]
+        self.assertEqual(data, {"email": "test@example.com", "amount": 1000, "currency": "NGN"})
+
+    async def test_list_filters_params(self):
+        response = await self.api.list_transactions(status="success", bogus=1)
+        self.assertEqual(response["response_from_api"]["meta"], {"status": "success"})
+
+    async def test_iter_transactions(self):
+        ids = [transaction["id"] async for transaction in self.api.iter_transactions(per_page=3)]
+        self.assertEqual(ids, list(range(1, 8)))
+
+    async def test_verify_transactions(self):
+        references = [f"ref-{i}" for i in range(20)] + ["missing"]
+        results = [result async for result in self.api.verify_transactions(references, concurrency=5)]
+        self.assertEqual(sorted(result.reference for result in results), sorted(references))
+        errors = [result for result in results if result.error]
+        self.assertEqual([result.reference for result in errors], ["missing"])
+        self.assertEqual(errors[0].error.status_code, 404)
+
+    async def test_identical_verifies_are_coalesced(self):
+        calls = []
+
+        async def slow_handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"status": True, "data": {"reference": "ref", "status": "success"}})
+
+        async with AsyncTransaction("sk_test_key", transport=httpx.MockTransport(slow_handler)) as api:
+            results = await asyncio.gather(*(api.verify_transaction("ref") for _ in range(10)))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result["response_from_api"]) for result in results}), 10)
+
+    async def test_api_error(self):
+        with self.assertRaises(APIError) as context:
+            await self.api.verify_transaction("missing")
+        self.assertEqual(context.exception.status_code, 404)
+
+    async def test_missing_reference(self):
+        with self.assertRaises(APIError) as context:
+            await self.api.verify_transaction(None)
+        self.assertEqual(context.exception.status_code, 400)
+
+    async def test_failed_probe_frees_the_breaker(self):
+        def broken(request):
+            raise httpx.DecodingError("bad gzip")
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record(500)
+        async with AsyncTransaction("sk_test_key", transport=httpx.MockTransport(broken),
+                                    circuit_breaker=breaker) as api:
+            with self.assertRaises(httpx.DecodingError):
+                await api.verify_transaction("ref")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        breaker.before_request()
+
+
+if __name__ == '__main__':
+    unittest.main()
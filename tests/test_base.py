@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+import responses
+from paystackpyAPI.cache import ResponseCache
+from paystackpyAPI.metrics import InMemoryMetrics
+from paystackpyAPI.ratelimit import RateLimiter
+from paystackpyAPI.retry import CircuitBreaker, RetryPolicy
+from paystackpyAPI.transaction import Transaction
+
+
+def report_child_session(api, queue):
+    inherited = api._transport
+    fresh = api.transport
+    queue.put((fresh is not inherited, fresh.session.get_adapter(api.BASE_URL)._pool_maxsize))
+
+
+def locked_parts(api):
+    return [part._lock for part in (api.cache, api.metrics, api.retry, api.circuit_breaker, api.rate_limiter.backend)]
+
+
+def report_child_locks(api, queue):
+    queue.put([lock.locked() for lock in locked_parts(api)])
+
+
+class TestPaystackAPISession(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key", pool_maxsize=4)
+
+    def test_session_is_shared(self):
+        self.assertIs(self.api.session, self.api.session)
+        adapter = self.api.session.get_adapter(self.api.BASE_URL)
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    @responses.activate
+    def test_auth_header_is_prebuilt(self):
+        responses.add(responses.GET, f"{self.api.paystack_verification_url}/ref", status=200,
+                      json={"status": True, "data": {}})
+        self.api.verify_transaction("ref")
+        self.assertEqual(responses.calls[0].request.headers["Authorization"], "Bearer sk_test_key")
+
+    @responses.activate
+    def test_download_does_not_leak_key(self):
+        responses.add(responses.GET, "https://files.example.com/export.csv", status=200, body=b"a,b\n")
+        with tempfile.TemporaryDirectory() as tmp:
+            self.api.download_csv("https://files.example.com/export.csv", os.path.join(tmp, "export.csv"))
+        self.assertNotIn("Authorization", responses.calls[0].request.headers)
+
+
+class TestTransportLifecycle(unittest.TestCase):
+    def test_close_and_context_manager(self):
+        with Transaction(api_key="sk_test_key") as api:
+            session = api.session
+        self.assertIsNone(api._transport)
+        self.assertIsNot(api.session, session)
+        api.close()
+        api.close()
+
+    def test_inherited_state_is_replaced_after_fork(self):
+        api = Transaction(api_key="sk_test_key", max_concurrency=1)
+        session, lock = api.session, api._transport_lock
+        closed = []
+        session.close = lambda: closed.append(session)
+        api._slots.acquire()          # held by a thread that will not exist in the child
+        api._pid = -1                 # what a forked child sees
+        self.assertIsNot(api.session, session)
+        self.assertIsNot(api._transport_lock, lock)
+        self.assertTrue(api._slots.acquire(blocking=False))
+        # The parent's sockets are left alone.
+        api.close()
+        self.assertEqual(closed, [])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_forked_child_builds_its_own_transport(self):
+        api = Transaction(api_key="sk_test_key", pool_maxsize=3)
+        api.transport
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=report_child_session, args=(api, queue))
+        child.start()
+        self.assertEqual(queue.get(timeout=10), (True, 3))
+        child.join()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_locks_held_at_fork_are_free_in_the_child(self):
+        api = Transaction(api_key="sk_test_key", cache=ResponseCache(), metrics=InMemoryMetrics(),
+                          retry=RetryPolicy(), circuit_breaker=CircuitBreaker(), rate_limiter=RateLimiter(10))
+        locks = locked_parts(api)
+        for lock in locks:
+            lock.acquire()          # as if parent threads were mid-call when another one forked
+        try:
+            context = multiprocessing.get_context("fork")
+            queue = context.Queue()
+            child = context.Process(target=report_child_locks, args=(api, queue))
+            child.start()
+            self.assertEqual(queue.get(timeout=10), [False] * len(locks))
+            child.join()
+        finally:
+            for lock in locks:
+                lock.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
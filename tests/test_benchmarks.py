@@ -0,0 +1,54 @@
+import unittest
+from benchmarks.bench_transaction import run_benchmarks
+from benchmarks import bench_transports, bench_webhooks
+from benchmarks.fake_paystack import FakePaystackServer, point_at
+from paystackpyAPI.transaction import Transaction
+from errors import APIError
+
+
+class TestFakePaystack(unittest.TestCase):
+    def test_transaction_against_fake_server(self):
+        with FakePaystackServer() as server:
+            api = point_at(Transaction(api_key="sk_test_key"), server.base_url)
+            self.assertEqual(api.verify_transaction("ref-7")["response_from_api"]["data"]["id"], 7)
+            pages = list(api.iter_transactions(per_page=100))
+            self.assertEqual(len(pages), 1000)
+            self.assertEqual(server.connections, 1)
+
+    def test_error_rate(self):
+        with FakePaystackServer(error_rate=1.0) as server:
+            api = point_at(Transaction(api_key="sk_test_key"), server.base_url)
+            with self.assertRaises(APIError) as context:
+                api.fetch_transaction(1)
+            self.assertEqual(context.exception.status_code, 500)
+
+    def test_run_benchmarks(self):
+        with FakePaystackServer() as server:
+            results = run_benchmarks(server.base_url, modes=("sequential", "threaded"), calls=4,
+                                     concurrency=2, alloc_samples=2, export_calls=1)
+        self.assertEqual(len(results), 16)
+        for row in results:
+            self.assertEqual(row["errors"], 0)
+            self.assertIsNotNone(row["p99_ms"])
+            self.assertGreater(row["throughput"], 0)
+
+    def test_transport_benchmark(self):
+        with FakePaystackServer(latency=0.01) as server:
+            results = bench_transports.run_benchmarks(server.base_url, levels=(4,), calls=8)
+        by_transport = {row["transport"]: row for row in results}
+        self.assertGreater(by_transport["requests"]["server_connections"], 1)
+        if "http2" in by_transport:
+            self.assertEqual(by_transport["http2"]["server_connections"], 1)
+        for row in results:
+            self.assertEqual(row["errors"], 0)
+
+    def test_webhook_benchmark(self):
+        results = bench_webhooks.run_benchmarks(events=200, senders=2, workers=2, duplicates=0.2)
+        self.assertEqual([row["mode"] for row in results], ["wsgi", "asgi"])
+        for row in results:
+            self.assertEqual(row["dispatched"] + row["duplicates"], 200)
+            self.assertGreater(row["events_per_s"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+import responses
+from paystackpyAPI.billing import (BatchCharger, ChargeJob, ChargeJournal, FAILED, REJECTED, SKIPPED, SUCCEEDED,
+                                   charge_reference)
+from paystackpyAPI.transaction import Transaction
+
+
+class TestBatchCharger(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "journal.jsonl")
+        self.jobs = [ChargeJob(f"user{i}@example.com", 100 + i, f"code{i}") for i in range(12)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @staticmethod
+    def charge_callback(request):
+        body = json.loads(request.body)
+        status = "failed" if body["email"] == "user3@example.com" else "success"
+        return 200, {}, json.dumps({"status": True, "data": {"reference": body["reference"], "status": status}})
+
+    def run_batch(self, jobs):
+        with ChargeJournal(self.path, fsync=False) as journal:
+            return list(BatchCharger(self.api, journal, cycle="2023-11", max_workers=3).run(jobs))
+
+    def test_charge_reference_is_deterministic(self):
+        job = ChargeJob("User@Example.com", 100, "code")
+        self.assertEqual(charge_reference(job, "2023-11"), charge_reference(job._replace(email="user@example.com"), "2023-11"))
+        self.assertNotEqual(charge_reference(job, "2023-11"), charge_reference(job, "2023-12"))
+        self.assertEqual(charge_reference(job._replace(reference="mine"), "2023-11"), "mine")
+
+    @responses.activate
+    def test_rerun_skips_finished_charges(self):
+        responses.add_callback(responses.POST, self.api.charge_authorization_url, callback=self.charge_callback)
+        results = self.run_batch(self.jobs + self.jobs[:2])
+        statuses = [result.status for result in results]
+        self.assertEqual(statuses.count(SUCCEEDED), 11)
+        self.assertEqual(statuses.count(FAILED), 1)
+        self.assertEqual(statuses.count(SKIPPED), 2)
+        self.assertEqual(len(responses.calls), 12)
+        references = {json.loads(call.request.body)["reference"] for call in responses.calls}
+        self.assertEqual(references, {charge_reference(job, "2023-11") for job in self.jobs})
+
+        results = self.run_batch(self.jobs)
+        self.assertEqual({result.status for result in results}, {SKIPPED})
+        self.assertEqual(len(responses.calls), 12)
+
+    @responses.activate
+    def test_in_doubt_charges_are_reconciled_before_retrying(self):
+        charged, never_sent = self.jobs[:2]
+        with ChargeJournal(self.path) as journal:
+            journal.record(charge_reference(charged, "2023-11"), "started")
+            journal.record(charge_reference(never_sent, "2023-11"), "started")
+        with open(self.path, "a") as file:
+            file.write('{"reference": "torn')
+
+        def verify_callback(request):
+            reference = request.url.rsplit("/", 1)[-1]
+            if reference == charge_reference(charged, "2023-11"):
+                return 200, {}, json.dumps({"status": True, "data": {"reference": reference, "status": "success"}})
+            return 400, {}, json.dumps({"status": False, "message": "Transaction reference not found"})
+
+        responses.add_callback(responses.GET, re.compile(f"{self.api.paystack_verification_url}/.*"),
+                               callback=verify_callback)
+        responses.add_callback(responses.POST, self.api.charge_authorization_url, callback=self.charge_callback)
+        results = {result.job: result for result in self.run_batch([charged, never_sent])}
+        self.assertEqual(results[charged].status, SUCCEEDED)
+        self.assertEqual(results[never_sent].status, SUCCEEDED)
+        posts = [call for call in responses.calls if call.request.method == "POST"]
+        self.assertEqual([json.loads(call.request.body)["email"] for call in posts], [never_sent.email])
+        with ChargeJournal(self.path) as journal:
+            self.assertEqual(journal.counts(), {SUCCEEDED: 2})
+
+    @responses.activate
+    def test_server_errors_leave_charge_in_doubt(self):
+        responses.add(responses.POST, self.api.charge_authorization_url, status=502, body="Bad gateway")
+        [result] = self.run_batch(self.jobs[:1])
+        self.assertEqual(result.status, "unknown")
+        self.assertEqual(result.error.status_code, 502)
+        with ChargeJournal(self.path) as journal:
+            self.assertEqual(journal.state(result.reference), "unknown")
+
+    @responses.activate
+    def test_rejected_charges_are_sent_again(self):
+        responses.add(responses.POST, self.api.charge_authorization_url, status=401,
+                      json={"status": False, "message": "Invalid key"})
+        results = self.run_batch(self.jobs[:2])
+        self.assertEqual({result.status for result in results}, {REJECTED})
+
+        responses.reset()
+        responses.add_callback(responses.POST, self.api.charge_authorization_url, callback=self.charge_callback)
+        results = self.run_batch(self.jobs[:2])
+        self.assertEqual({result.status for result in results}, {SUCCEEDED})
+        # Nothing was charged the first time, so there is nothing to look up before charging.
+        self.assertEqual([call.request.method for call in responses.calls], ["POST"] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
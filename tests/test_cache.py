@@ -0,0 +1,48 @@
+import time
+import unittest
+import responses
+from paystackpyAPI.cache import ResponseCache
+from paystackpyAPI.transaction import Transaction
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_terminal_responses_do_not_expire(self):
+        cache = ResponseCache(pending_ttl=0.01)
+        cache.store("done", b"{}", {"data": {"status": "success"}})
+        cache.store("pending", b"{}", {"data": {"status": "ongoing"}})
+        time.sleep(0.02)
+        self.assertEqual(cache.get("done"), b"{}")
+        self.assertIsNone(cache.get("pending"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_lru_bounds(self):
+        cache = ResponseCache(max_entries=2, max_bytes=10)
+        terminal = {"data": {"status": "failed"}}
+        cache.store("a", b"1234", terminal)
+        cache.store("b", b"1234", terminal)
+        cache.get("a")
+        cache.store("c", b"1234", terminal)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        cache.store("d", b"12345678", terminal)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.stats()["bytes"], 10)
+
+    @responses.activate
+    def test_verify_transaction_uses_cache(self):
+        cache = ResponseCache()
+        api = Transaction(api_key="sk_test_key", cache=cache)
+        url = f"{api.paystack_verification_url}/ref-1"
+        responses.add(responses.GET, url, json={"status": True, "data": {"reference": "ref-1", "status": "success"}})
+        first = api.verify_transaction("ref-1")
+        first["response_from_api"]["data"]["status"] = "mutated"
+        second = api.verify_transaction("ref-1")
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(second["response_from_api"]["data"]["status"], "success")
+        self.assertEqual(second["message"], "Transaction details retrieved successfully")
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
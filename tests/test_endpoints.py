@@ -0,0 +1,73 @@
+import inspect
+import json
+import unittest
+import responses
+from errors import APIError
+from paystackpyAPI.base import PaystackAPI
+from paystackpyAPI.endpoints import EndpointSpec, endpoint_method
+from paystackpyAPI.transaction import Transaction
+
+
+class Customer(PaystackAPI):
+    customer_url = "https://api.paystack.co/customer"
+    fetch_customer = endpoint_method(EndpointSpec(
+        name="fetch_customer", method="GET", url_attr="customer_url", message="Customer retrieved",
+        path="/{email_or_code}", required=("email_or_code",)))
+    create_customer = endpoint_method(EndpointSpec(
+        name="create_customer", method="POST", url_attr="customer_url", message="Customer created",
+        required=("email",), optional=frozenset(["first_name", "last_name"])))
+
+
+class TestEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+
+    def test_generated_methods_keep_their_signatures(self):
+        self.assertEqual(list(inspect.signature(Transaction.charge_authorization).parameters),
+                         ["self", "email", "amount", "authorization_code", "timeout", "kwargs"])
+        self.assertEqual(Transaction.verify_transaction.__name__, "verify_transaction")
+        self.assertIsInstance(Transaction.TRANSACTION_LIST_OPTIONAL_PARAMS, frozenset)
+        self.assertIn("perPage", Transaction.TRANSACTION_LIST_OPTIONAL_PARAMS)
+
+    @responses.activate
+    def test_charge_authorization_request(self):
+        responses.add(responses.POST, self.api.charge_authorization_url, json={"status": True, "data": {}})
+        response = self.api.charge_authorization("a@example.com", 25, authorization_code="abc", currency="NGN",
+                                                 unknown="dropped")
+        self.assertEqual(response["message"], "Transaction initialized successfully")
+        self.assertEqual(json.loads(responses.calls[0].request.body), {
+            "email": "a@example.com", "amount": 2500, "authorization_code": "AUTH_abc", "currency": "NGN"})
+
+    def test_validation_order_and_messages(self):
+        with self.assertRaises(APIError) as context:
+            Transaction(api_key=None).initialize_transaction("", 10)
+        self.assertEqual(context.exception.status_code, 400)
+        with self.assertRaises(APIError) as context:
+            Transaction(api_key=None).charge_authorization("a@example.com", 0, "abc")
+        self.assertEqual(context.exception.status_code, 401)
+        with self.assertRaises(APIError) as context:
+            self.api.charge_authorization("a@example.com", 10, "")
+        self.assertEqual(str(context.exception), "Missing required parameter authorization_code")
+        with self.assertRaises(TypeError):
+            self.api.verify_transaction("ref", "extra")
+
+    def test_timeline_checks_api_key(self):
+        with self.assertRaises(APIError) as context:
+            Transaction(api_key="").show_transaction_timeline("ref-1")
+        self.assertEqual(context.exception.status_code, 401)
+
+    @responses.activate
+    def test_new_resource_from_spec(self):
+        client = Customer(api_key="sk_test_key")
+        responses.add(responses.GET, f"{client.customer_url}/CUS_1", json={"status": True, "data": {"id": 1}})
+        responses.add(responses.POST, client.customer_url, json={"status": True, "data": {"id": 2}})
+        self.assertEqual(client.fetch_customer("CUS_1").data, {"id": 1})
+        self.assertEqual(client.create_customer(email="b@example.com", first_name="B").data, {"id": 2})
+        self.assertEqual(json.loads(responses.calls[1].request.body), {"email": "b@example.com", "first_name": "B"})
+        with self.assertRaises(APIError) as context:
+            client.fetch_customer("")
+        self.assertEqual(str(context.exception), "Missing required parameter: email_or_code")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import datetime
+import gzip
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from paystackpyAPI.export import aggregate_export, normalize_column, read_export
+
+EXPORT = (
+    "Id,Reference,Status,Channel,Currency,Amount,Fees,Customer Email,Paid At\n"
+    "1,ref-1,success,card,NGN,5000.00,75.00,a@example.com,2023-11-01T10:00:00.000Z\n"
+    "2,ref-2,failed,card,NGN,2500.50,,b@example.com,\n"
+    "3,ref-3,success,bank,NGN,1000.00,15.00,a@example.com,2023-11-02T10:00:00.000Z\n"
+    "4,ref-4,success,card,USD,20.00,0.80,c@example.com,2023-11-03T10:00:00.000Z\n"
+)
+
+
+class TestExportReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "export.csv")
+        with open(self.path, "w") as file:
+            file.write(EXPORT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalize_column(self):
+        self.assertEqual(normalize_column(" Customer Email "), "customer_email")
+        self.assertEqual(normalize_column("Paid At"), "paid_at")
+
+    def test_read_export_types(self):
+        records = list(read_export(self.path))
+        self.assertEqual(len(records), 4)
+        first = records[0]
+        self.assertEqual(first.id, 1)
+        self.assertEqual(first.amount, Decimal("5000.00"))
+        self.assertEqual(first.customer_email, "a@example.com")
+        self.assertEqual(first.paid_at, datetime.datetime(2023, 11, 1, 10, tzinfo=datetime.timezone.utc))
+        self.assertIsNone(records[1].fees)
+        self.assertIsNone(records[1].paid_at)
+
+    def test_read_gzip_export(self):
+        gz_path = self.path + ".gz"
+        with gzip.open(gz_path, "wt") as file:
+            file.write(EXPORT)
+        self.assertEqual([record.reference for record in read_export(gz_path)], ["ref-1", "ref-2", "ref-3", "ref-4"])
+
+    def test_aggregate_export(self):
+        totals = aggregate_export(self.path, group_by=("status", "currency"), sum_columns=("amount", "fees"))
+        self.assertEqual(totals[("success", "NGN")], {"count": 2, "amount": Decimal("6000.00"), "fees": Decimal("90.00")})
+        self.assertEqual(totals[("failed", "NGN")], {"count": 1, "amount": Decimal("2500.50"), "fees": Decimal(0)})
+        self.assertEqual(totals[("success", "USD")]["count"], 1)
+
+    def test_aggregate_unknown_column(self):
+        with self.assertRaises(ValueError):
+            aggregate_export(self.path, group_by=("gateway",))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import threading
+import time
+import unittest
+import responses
+from paystackpyAPI.hedging import HedgePolicy, LatencyTracker
+from paystackpyAPI.transaction import Transaction
+
+
+class TestHedgePolicy(unittest.TestCase):
+    def test_delay_follows_the_quantile(self):
+        tracker = LatencyTracker(window=100, quantile=0.95, refresh=1)
+        for latency in range(100):
+            tracker.observe(latency / 100)
+        self.assertAlmostEqual(tracker.value(), 0.95)
+
+        policy = HedgePolicy(min_delay=0.01, max_delay=0.5, min_samples=10)
+        self.assertEqual(policy.delay("GET /x"), 0.5)
+        for _ in range(10):
+            policy.observe("GET /x", 0.2)
+        self.assertAlmostEqual(policy.delay("GET /x"), 0.2)
+        for _ in range(200):
+            policy.observe("GET /x", 0.001)
+        self.assertEqual(policy.delay("GET /x"), 0.01)
+
+    def test_hedges_are_budgeted(self):
+        policy = HedgePolicy(max_delay=0.01, budget_ratio=0)
+        results = [policy.run("slow", lambda: time.sleep(0.03) or "done") for _ in range(3)]
+        self.assertEqual(results, ["done"] * 3)
+        self.assertEqual(policy.stats()["hedges"], 1)
+        policy.close(wait=True)
+
+
+class TestHedgedTransaction(unittest.TestCase):
+    @responses.activate
+    def test_slow_lookup_is_raced(self):
+        calls = []
+        lock = threading.Lock()
+
+        def callback(request):
+            with lock:
+                calls.append(time.monotonic())
+                first = len(calls) == 1
+            if first:
+                time.sleep(0.5)
+            return 200, {}, '{"status": true, "data": {"status": "success"}}'
+
+        policy = HedgePolicy(max_delay=0.05)
+        api = Transaction(api_key="sk_test_key", hedge=policy)
+        responses.add_callback(responses.GET, f"{api.paystack_verification_url}/ref", callback=callback)
+        started = time.monotonic()
+        response = api.verify_transaction("ref")
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(response.data["status"], "success")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(policy.stats(), {"requests": 1, "hedges": 1, "hedge_wins": 1})
+        # The losing copy is still inside the mock; let it finish before the next test's mock starts.
+        policy.close(wait=True)
+
+    @responses.activate
+    def test_fast_lookup_is_not_hedged(self):
+        policy = HedgePolicy(max_delay=1)
+        api = Transaction(api_key="sk_test_key", hedge=policy)
+        responses.add(responses.GET, f"{api.fetch_transaction_url}/42", json={"status": True, "data": {}})
+        api.fetch_transaction(42)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(policy.stats()["hedges"], 0)
+        policy.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import requests
+import responses
+from paystackpyAPI.metrics import InMemoryMetrics, endpoint_name
+from paystackpyAPI.transaction import Transaction
+from errors import APIError
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = InMemoryMetrics()
+        self.api = Transaction(api_key="sk_test_key", metrics=self.metrics)
+
+    def test_endpoint_name(self):
+        self.assertEqual(endpoint_name("get", "https://api.paystack.co/transaction/verify/ref_abc"),
+                         "GET /transaction/verify/:id")
+        self.assertEqual(endpoint_name("GET", "https://api.paystack.co/transaction/12345"), "GET /transaction/:id")
+        self.assertEqual(endpoint_name("POST", "https://api.paystack.co/transaction/initialize"),
+                         "POST /transaction/initialize")
+        self.assertEqual(endpoint_name("GET", "https://files.example.com/exports/abc-1.csv"),
+                         "GET files.example.com/exports/:id")
+
+    @responses.activate
+    def test_records_statuses_errors_and_bytes(self):
+        responses.add(responses.GET, f"{self.api.paystack_verification_url}/ok", json={"status": True, "data": {}})
+        responses.add(responses.GET, f"{self.api.paystack_verification_url}/missing", status=404,
+                      json={"status": False})
+        responses.add(responses.POST, self.api.paystack_initialization_url,
+                      body=requests.exceptions.ConnectionError("reset"))
+        self.api.verify_transaction("ok")
+        with self.assertRaises(APIError):
+            self.api.verify_transaction("missing")
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.api.initialize_transaction("test@example.com", 10)
+
+        snapshot = self.metrics.snapshot()
+        verify = snapshot["GET /transaction/verify/:id"]
+        self.assertEqual(verify["count"], 2)
+        self.assertEqual(verify["statuses"], {200: 1, 404: 1})
+        self.assertEqual(verify["errors"], {"APIError": 1})
+        self.assertEqual(verify["in_flight"], 0)
+        self.assertGreater(verify["bytes_in"], 0)
+        self.assertEqual(snapshot["POST /transaction/initialize"]["errors"], {"ConnectionError": 1})
+
+        exported = self.metrics.export_prometheus()
+        self.assertIn('paystack_responses_total{endpoint="GET /transaction/verify/:id",status="404"} 1', exported)
+        self.assertIn('paystack_request_duration_seconds_count{endpoint="GET /transaction/verify/:id"} 2', exported)
+
+
+if __name__ == '__main__':
+    unittest.main()
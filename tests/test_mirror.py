@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from urllib.parse import parse_qs, urlparse
+import responses
+from paystackpyAPI.mirror import TransactionMirror
+from paystackpyAPI.transaction import Transaction
+
+
+def make_transaction(i):
+    return {
+        "id": i,
+        "reference": f"ref-{i}",
+        "status": "failed" if i % 4 == 0 else "success",
+        "amount": 1000 * i,
+        "currency": "USD" if i % 5 == 0 else "NGN",
+        "channel": "card",
+        "customer": {"id": i % 3, "email": f"customer{i % 3}@example.com"},
+        "created_at": f"2023-11-{i:02d}T10:00:00.000Z",
+    }
+
+
+class TestTransactionMirror(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+        self.store = [make_transaction(i) for i in range(1, 11)]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "mirror.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def list_callback(self, request):
+        query = {key: values[-1] for key, values in parse_qs(urlparse(request.url).query).items()}
+        rows = sorted((t for t in self.store if t["created_at"] >= query.get("from", "")),
+                      key=lambda t: t["created_at"], reverse=True)
+        per_page, page = int(query["perPage"]), int(query["page"])
+        data = rows[(page - 1) * per_page:page * per_page]
+        return 200, {}, json.dumps({"status": True, "data": data,
+                                    "meta": {"total": len(rows), "page": page, "perPage": per_page}})
+
+    @responses.activate
+    def test_backfill_then_incremental_sync(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=self.list_callback)
+        with TransactionMirror(self.api, self.path, per_page=3, batch_size=4) as mirror:
+            self.assertEqual(mirror.sync(), 10)
+            self.assertEqual(mirror.watermark, "2023-11-10T10:00:00.000Z")
+        self.assertEqual(len(responses.calls), 4)
+        self.assertNotIn("from=", responses.calls[0].request.url)
+
+        self.store[9]["status"] = "reversed"
+        self.store.append(make_transaction(11))
+        with TransactionMirror(self.api, self.path, per_page=3) as mirror:
+            self.assertEqual(mirror.sync(), 2)
+            self.assertIn("from=2023-11-10T09%3A00%3A00.000Z", responses.calls[-1].request.url)
+            self.assertEqual(len(mirror), 11)
+            self.assertEqual(mirror.get("ref-10")["status"], "reversed")
+            self.assertEqual(mirror.watermark, "2023-11-11T10:00:00.000Z")
+
+    @responses.activate
+    def test_local_queries_and_totals(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=self.list_callback)
+        mirror = TransactionMirror(self.api)
+        mirror.sync()
+        calls = len(responses.calls)
+
+        self.assertEqual([t["id"] for t in mirror.query(status="failed")], [8, 4])
+        self.assertEqual([t["id"] for t in mirror.query(customer="customer1@example.com", limit=2)], [10, 7])
+        self.assertEqual([t["id"] for t in mirror.query(customer=0, currency="NGN")], [9, 6, 3])
+        self.assertEqual([t["id"] for t in mirror.query(from_date="2023-11-03", to_date="2023-11-05")], [4, 3])
+        self.assertEqual(mirror.get(7)["reference"], "ref-7")
+
+        totals = mirror.totals(from_date="2023-11-01", to_date="2023-11-06")
+        self.assertEqual(totals["total_transactions"], 5)
+        self.assertEqual(totals["total_volume"], 1000 + 2000 + 3000 + 5000)
+        self.assertEqual(totals["total_volume_by_currency"],
+                         [{"currency": "NGN", "amount": 6000}, {"currency": "USD", "amount": 5000}])
+        self.assertEqual(mirror.totals(status="failed")["total_volume"], 0)
+        self.assertEqual(len(responses.calls), calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
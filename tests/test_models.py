@@ -0,0 +1,74 @@
+import json
+import pickle
+import unittest
+import responses
+from paystackpyAPI.models import Customer, PaystackResponse, TransactionData
+from paystackpyAPI.transaction import Transaction
+
+
+BODY = {
+    "status": True,
+    "data": [{"id": 1, "reference": "ref-1", "amount": 5000,
+              "customer": {"email": "a@example.com"}, "authorization": {"last4": "4081"}}],
+    "meta": {"total": 1, "page": 1, "pageCount": 1},
+}
+
+
+class TestPaystackResponse(unittest.TestCase):
+    def test_decodes_lazily_and_once(self):
+        response = PaystackResponse(200, "ok", json.dumps(BODY).encode())
+        self.assertEqual(response["status_code"], 200)
+        self.assertFalse(response.decoded)
+        self.assertIs(response["response_from_api"], response.body)
+        self.assertTrue(response.decoded)
+
+    def test_dict_compatible_view(self):
+        response = PaystackResponse(200, "ok", json.dumps(BODY).encode())
+        self.assertEqual(dict(response), {"status_code": 200, "message": "ok", "response_from_api": BODY})
+        self.assertEqual(response.to_dict(), dict(response))
+        self.assertEqual(set(response), {"status_code", "message", "response_from_api"})
+        self.assertIsNone(response.get("data"))
+        with self.assertRaises(KeyError):
+            response["data"]
+
+    def test_behaves_as_a_dict(self):
+        response = PaystackResponse(200, "ok", json.dumps(BODY).encode())
+        self.assertIsInstance(response, dict)
+        self.assertEqual(json.loads(json.dumps(response))["response_from_api"], BODY)
+        self.assertEqual(repr(PaystackResponse(200, "ok", b'{"status": true}')),
+                         "{'status_code': 200, 'message': 'ok', 'response_from_api': {'status': True}}")
+        self.assertEqual(pickle.loads(pickle.dumps(response)), response)
+        response["message"] = "changed"
+        response["extra"] = 1
+        self.assertEqual(response.message, "changed")
+        self.assertEqual(list(response), ["status_code", "message", "response_from_api", "extra"])
+        response["response_from_api"] = {}
+        self.assertEqual(response.body, {})
+
+    def test_typed_accessors(self):
+        response = PaystackResponse(200, "ok", json.dumps(BODY).encode())
+        transaction = response.transactions[0]
+        self.assertIsInstance(transaction, TransactionData)
+        self.assertEqual((transaction.id, transaction.reference, transaction.paid_at), (1, "ref-1", None))
+        self.assertEqual(transaction.customer, Customer({"email": "a@example.com"}))
+        self.assertEqual(transaction.authorization.last4, "4081")
+        self.assertEqual(response.meta.pageCount, 1)
+        self.assertIsNone(response.transaction)
+        with self.assertRaises(AttributeError):
+            transaction.not_a_field
+        with self.assertRaises(AttributeError):
+            transaction.extra = 1
+
+    @responses.activate
+    def test_transaction_methods_return_lazy_responses(self):
+        api = Transaction(api_key="sk_test_key")
+        responses.add(responses.GET, api.list_transaction_url, json=BODY)
+        response = api.list_transactions(perPage=1)
+        self.assertIsInstance(response, PaystackResponse)
+        self.assertEqual(response["message"], "Transactions details below")
+        self.assertFalse(response.decoded)
+        self.assertEqual(response["response_from_api"], BODY)
+
+
+if __name__ == '__main__':
+    unittest.main()
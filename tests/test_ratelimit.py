@@ -0,0 +1,59 @@
+import multiprocessing
+import tempfile
+import time
+import unittest
+import responses
+from paystackpyAPI.ratelimit import FileLockBackend, InProcessBackend, RateLimiter
+from paystackpyAPI.transaction import Transaction
+
+
+def reserve_many(directory, count, queue):
+    limiter = RateLimiter(rate=1, burst=5, backend=FileLockBackend(directory))
+    queue.put([limiter.reserve("sk_test_key", "https://api.paystack.co/transaction") for _ in range(count)])
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_queue(self):
+        limiter = RateLimiter(rate=100, burst=3, backend=InProcessBackend())
+        waits = [limiter.reserve("key", "https://api.paystack.co/transaction") for _ in range(5)]
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 0.01, places=2)
+        self.assertAlmostEqual(waits[4], 0.02, places=2)
+
+    def test_endpoint_weights(self):
+        limiter = RateLimiter(rate=10, burst=10, weights={"/transaction/export": 5, "/transaction": 1})
+        self.assertEqual(limiter.weight("https://api.paystack.co/transaction/export?page=1"), 5)
+        self.assertEqual(limiter.weight("https://api.paystack.co/transaction/verify/ref"), 1)
+        self.assertEqual(limiter.weight("https://api.paystack.co/customer"), 1.0)
+
+    def test_keys_are_isolated(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        self.assertEqual(limiter.reserve("key-a", "/"), 0)
+        self.assertEqual(limiter.reserve("key-b", "/"), 0)
+        self.assertGreater(limiter.reserve("key-a", "/"), 0)
+
+    def test_file_backend_is_shared_across_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            queue = multiprocessing.Queue()
+            workers = [multiprocessing.Process(target=reserve_many, args=(directory, 5, queue)) for _ in range(2)]
+            for worker in workers:
+                worker.start()
+            waits = sorted(queue.get(timeout=10) + queue.get(timeout=10))
+            for worker in workers:
+                worker.join()
+        # Only the burst is free; everything else queues behind it.
+        self.assertEqual(sum(1 for wait in waits if wait == 0), 5)
+        self.assertGreater(waits[-1], 4)
+
+    @responses.activate
+    def test_transaction_waits_for_tokens(self):
+        api = Transaction(api_key="sk_test_key", rate_limiter=RateLimiter(rate=50, burst=1))
+        responses.add(responses.GET, f"{api.paystack_verification_url}/ref", json={"status": True, "data": {}})
+        started = time.monotonic()
+        for _ in range(3):
+            api.verify_transaction("ref")
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import requests
+import responses
+from paystackpyAPI.retry import CircuitBreaker, Deadline, RetryPolicy
+from paystackpyAPI.transaction import Transaction
+from errors import APIError, CircuitOpenError
+
+
+class FakeClock:
+    """Stands in for the ``time`` module: ``monotonic`` only moves when ``sleep`` is called."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+def frozen_clock(test):
+    """Run ``test`` with the deadline and retry code on a :class:`FakeClock`, passed as ``clock``."""
+    def wrapper(self):
+        clock = FakeClock()
+        with patch("paystackpyAPI.retry.time", clock), patch("paystackpyAPI.base.time", clock):
+            return test(self, clock)
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_idempotency_rules(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_idempotent("GET", {}))
+        self.assertFalse(policy.is_idempotent("POST", {"json": {"email": "a@example.com"}}))
+        self.assertTrue(policy.is_idempotent("POST", {"json": {"reference": "ref-1"}}))
+
+    def test_retry_delay(self):
+        policy = RetryPolicy(max_attempts=3, backoff_base=1, max_retry_after=10)
+        self.assertIsNone(policy.retry_delay("GET", {}, 0, 400))
+        self.assertIsNone(policy.retry_delay("GET", {}, 2, 503))
+        self.assertLessEqual(policy.retry_delay("GET", {}, 0, 503), 1)
+        self.assertEqual(policy.retry_delay("GET", {}, 0, 429, "5"), 5)
+        self.assertIsNone(policy.retry_delay("GET", {}, 0, 429, "120"))
+
+    def test_retry_budget(self):
+        policy = RetryPolicy(budget_min_tokens=2, budget_ratio=0)
+        delays = [policy.retry_delay("GET", {}, 0, 503) for _ in range(3)]
+        self.assertIsNone(delays[-1])
+
+
+class TestDeadline(unittest.TestCase):
+    @frozen_clock
+    def test_budget_is_split_across_attempts(self, clock):
+        deadline = Deadline(3.0)
+        self.assertEqual(deadline.attempt_timeout(3), 1.0)
+        self.assertTrue(deadline.allows(1))
+        self.assertFalse(deadline.allows(5))
+        clock.sleep(3)
+        self.assertIsNone(deadline.attempt_timeout())
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_and_half_opens(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+        breaker.record(503)
+        breaker.record(500)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        breaker.before_request()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record(200)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_probe_is_released_on_any_error(self):
+        for error, state in ((requests.exceptions.ChunkedEncodingError("cut"), CircuitBreaker.OPEN),
+                             (ValueError("hook failed"), CircuitBreaker.HALF_OPEN)):
+            breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+            api = Transaction(api_key="sk_test_key", circuit_breaker=breaker)
+            breaker.record(500)
+            with responses.RequestsMock() as mock:
+                mock.add(responses.GET, f"{api.fetch_transaction_url}/1", body=error)
+                with self.assertRaises(type(error)):
+                    api.fetch_transaction(1)
+            self.assertEqual(breaker.state, state)
+            # The next call gets to probe instead of failing with "probe in progress".
+            breaker.before_request()
+
+    @responses.activate
+    def test_other_hosts_do_not_trip_the_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        api = Transaction(api_key="sk_test_key", circuit_breaker=breaker, retry=RetryPolicy(backoff_base=0))
+        responses.add(responses.GET, "https://files.example.com/export.csv", status=503)
+        responses.add(responses.GET, f"{api.paystack_verification_url}/ref-1", json={"status": True, "data": {}})
+        with tempfile.TemporaryDirectory() as tmp:
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    api.download_csv("https://files.example.com/export.csv", os.path.join(tmp, "export.csv"))
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(api.retry._tokens, api.retry.budget_min_tokens)
+        self.assertEqual(api.verify_transaction("ref-1")["status_code"], 200)
+
+
+class TestTransportRetries(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key", retry=RetryPolicy(backoff_base=0),
+                               circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        self.url = f"{self.api.paystack_verification_url}/ref-1"
+
+    @responses.activate
+    def test_get_is_retried(self):
+        responses.add(responses.GET, self.url, status=503)
+        responses.add(responses.GET, self.url, status=200, json={"status": True, "data": {}})
+        response = self.api.verify_transaction("ref-1")
+        self.assertEqual(response["status_code"], 200)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_post_without_reference_is_not_retried(self):
+        responses.add(responses.POST, self.api.paystack_initialization_url, status=502)
+        with self.assertRaises(APIError):
+            self.api.initialize_transaction("test@example.com", 100)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_breaker_fails_fast(self):
+        responses.add(responses.GET, self.url, status=500)
+        with self.assertRaises(APIError):
+            self.api.verify_transaction("ref-1")
+        with self.assertRaises(CircuitOpenError):
+            self.api.verify_transaction("ref-1")
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    @frozen_clock
+    def test_attempts_share_the_call_deadline(self, clock):
+        responses.add(responses.GET, self.url, status=503)
+        responses.add(responses.GET, self.url, body=requests.exceptions.ReadTimeout("stalled"))
+        responses.add(responses.GET, self.url, status=200, json={"status": True, "data": {}})
+        self.api.verify_transaction("ref-1", timeout=3)
+        timeouts = [call.request.req_kwargs["timeout"] for call in responses.calls]
+        self.assertEqual(len(timeouts), 3)
+        # Each attempt gets an equal share of what is left: 1/3, then 1/2, then all of it.
+        self.assertEqual(timeouts, [1.0, 1.5, 3.0])
+
+    @responses.activate
+    @frozen_clock
+    def test_call_that_cannot_be_retried_keeps_its_deadline(self, clock):
+        responses.add(responses.POST, self.api.paystack_initialization_url,
+                      json={"status": True, "data": {"reference": "ref-1"}})
+        self.api.initialize_transaction("test@example.com", 100, timeout=30)
+        self.assertEqual(responses.calls[0].request.req_kwargs["timeout"], 30)
+
+    @responses.activate
+    @frozen_clock
+    def test_client_default_timeout_and_spent_deadline(self, clock):
+        api = Transaction(api_key="sk_test_key", timeout=5, retry=RetryPolicy(backoff_base=0))
+        responses.add(responses.GET, self.url, json={"status": True, "data": {}})
+        api.verify_transaction("ref-1")
+        self.assertEqual(responses.calls[0].request.req_kwargs["timeout"], 5 / 3)
+        api.retry = RetryPolicy(backoff_base=0.2, max_attempts=5)
+        responses.replace(responses.GET, self.url, status=503)
+        started = clock.now
+        with self.assertRaises(APIError):
+            api.verify_transaction("ref-1", timeout=0.1)
+        # A backoff that does not fit in the budget ends the call instead of overrunning it.
+        self.assertLess(clock.now - started, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
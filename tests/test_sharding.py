@@ -0,0 +1,112 @@
+import datetime
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+import responses
+from paystackpyAPI.sharding import Window, merge_totals, range_params, split_range
+from paystackpyAPI.transaction import Transaction
+
+
+def timestamp(day, minute=0):
+    return f"2023-11-{day:02d}T{minute // 60:02d}:{minute % 60:02d}:00.000Z"
+
+
+# 30 spread-out transactions plus a burst of 200 on the 15th.
+STORE = sorted([{"id": day, "created_at": timestamp(day), "amount": 100, "currency": "NGN"} for day in range(1, 31)]
+               + [{"id": 100 + i, "created_at": timestamp(15, 10 + i), "amount": 1, "currency": "USD"}
+                  for i in range(200)],
+               key=lambda t: t["created_at"], reverse=True)
+
+
+def query(request):
+    return {key: values[-1] for key, values in parse_qs(urlparse(request.url).query).items()}
+
+
+def in_range(transaction, params):
+    return params.get("from", "") <= transaction["created_at"] <= params.get("to", "9999")
+
+
+def list_callback(request):
+    params = query(request)
+    rows = [t for t in STORE if in_range(t, params)]
+    per_page, page = int(params["perPage"]), int(params["page"])
+    return 200, {}, json.dumps({"status": True, "data": rows[(page - 1) * per_page:page * per_page],
+                                "meta": {"total": len(rows), "page": page, "perPage": per_page}})
+
+
+def totals_callback(request):
+    rows = [t for t in STORE if in_range(t, query(request))]
+    by_currency = {}
+    for row in rows:
+        by_currency[row["currency"]] = by_currency.get(row["currency"], 0) + row["amount"]
+    return 200, {}, json.dumps({"status": True, "data": {
+        "total_transactions": len(rows), "unique_customers": 1, "total_volume": sum(by_currency.values()),
+        "total_volume_by_currency": [{"currency": c, "amount": a} for c, a in by_currency.items()]}})
+
+
+class TestSharding(unittest.TestCase):
+    def test_split_range(self):
+        windows = split_range("2023-11-01", datetime.date(2023, 11, 30), 3)
+        self.assertEqual(windows[0].end, datetime.datetime(2023, 12, 1))
+        self.assertEqual(windows[-1].start, datetime.datetime(2023, 11, 1))
+        self.assertEqual([w.span for w in windows], [datetime.timedelta(days=10)] * 3)
+        self.assertEqual(windows[0].params()["to"], "2023-11-30T23:59:59.999Z")
+        # A timestamp ``to`` is inclusive, as in an unsharded query.
+        self.assertEqual(split_range("2023-11-01", "2023-11-02T12:00:00Z", 2)[0].params()["to"],
+                         "2023-11-02T12:00:00.000Z")
+        self.assertEqual(Window(*windows[2]).halves()[0].end, windows[2].end)
+        with self.assertRaises(ValueError):
+            split_range("2023-11-02T00:00:00Z", "2023-11-01T00:00:00Z", 2)
+
+    def test_merge_totals(self):
+        merged = merge_totals([
+            {"total_transactions": 2, "unique_customers": 2, "total_volume_by_currency": [{"currency": "NGN", "amount": 5}]},
+            {"total_transactions": 3, "total_volume_by_currency": [{"currency": "NGN", "amount": 1},
+                                                                   {"currency": "USD", "amount": 7}]},
+        ])
+        self.assertEqual(merged, {"total_transactions": 5, "total_volume_by_currency": [
+            {"currency": "NGN", "amount": 6}, {"currency": "USD", "amount": 7}]})
+
+
+class TestShardedTransactions(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+
+    @responses.activate
+    def test_iter_transactions_sharded_matches_serial_order(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=list_callback)
+        rows = list(self.api.iter_transactions_sharded("2023-11-01", "2023-11-30", shards=4, max_workers=4,
+                                                       per_page=20, max_pages_per_window=2))
+        self.assertEqual([row["id"] for row in rows], [row["id"] for row in STORE])
+        probes = [call for call in responses.calls if "perPage=1&" in call.request.url]
+        # The dense window around the 15th was split repeatedly.
+        self.assertGreater(len(probes), 4)
+
+    @responses.activate
+    def test_sharded_totals(self):
+        responses.add_callback(responses.GET, self.api.transaction_totals_url, callback=totals_callback)
+        response = self.api.get_total_transactions(from_date="2023-11-01", to_date="2023-11-30", shards=5)
+        data = response["response_from_api"]["data"]
+        self.assertEqual(len(responses.calls), 5)
+        self.assertEqual(data["total_transactions"], 230)
+        self.assertEqual(data["total_volume"], 3200)
+        self.assertEqual(data["total_volume_by_currency"],
+                         [{"currency": "NGN", "amount": 3000}, {"currency": "USD", "amount": 200}])
+        self.assertNotIn("unique_customers", data)
+
+    @responses.activate
+    def test_sharding_does_not_change_the_range(self):
+        responses.add_callback(responses.GET, self.api.transaction_totals_url, callback=totals_callback)
+        for to_date in ("2023-11-15", "2023-11-15T00:20:00.000Z"):
+            serial = self.api.get_total_transactions(from_date="2023-11-01", to_date=to_date)
+            sharded = self.api.get_total_transactions(from_date="2023-11-01", to_date=to_date, shards=3)
+            self.assertEqual(sharded.data["total_transactions"], serial.data["total_transactions"])
+            # Shards run on threads, so their calls are recorded in any order.
+            windows = [query(call.request) for call in responses.calls[-3:]]
+            self.assertEqual({"from": min(w["from"] for w in windows), "to": max(w["to"] for w in windows)},
+                             range_params("2023-11-01", to_date))
+        self.assertEqual(query(responses.calls[0].request)["to"], "2023-11-15T23:59:59.999Z")
+
+
+if __name__ == '__main__':
+    unittest.main()
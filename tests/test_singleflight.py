@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from paystackpyAPI.singleflight import AsyncSingleFlight, SingleFlight
+from errors import APIError
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        def caller():
+            barrier.wait()
+            return flight.do("key", slow)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: caller(), range(8)))
+        self.assertEqual(results, ["result"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_error_is_shared(self):
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.05)
+            raise APIError(503, "unavailable")
+
+        def caller():
+            try:
+                flight.do("key", failing)
+            except APIError as error:
+                return error.status_code
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(list(executor.map(lambda _: caller(), range(4))), [503] * 4)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+
+        results = await asyncio.gather(*(flight.do("key", slow) for _ in range(20)))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == {"ok": True} for result in results))
+        self.assertEqual(await flight.do("key", slow), {"ok": True})
+        self.assertEqual(len(calls), 2)
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("key", slow))
+        second = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
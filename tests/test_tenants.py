@@ -0,0 +1,69 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import responses
+from paystackpyAPI.cache import ResponseCache
+from paystackpyAPI.tenants import ClientRegistry
+
+VERIFY_URL = "https://api.paystack.co/transaction/verify/ref"
+
+
+class TestClientRegistry(unittest.TestCase):
+    @responses.activate
+    def test_one_client_per_key_over_a_shared_session(self):
+        responses.add(responses.GET, VERIFY_URL, json={"status": True, "data": {}})
+        with ClientRegistry(cache_factory=ResponseCache) as registry:
+            first = registry.get("sk_test_a")
+            self.assertIs(registry["sk_test_a"], first)
+            second = registry.get("sk_test_b")
+            self.assertIsNot(first.cache, second.cache)
+            self.assertIs(first.transport, second.transport)
+            first.verify_transaction("ref")
+            second.verify_transaction("ref")
+        self.assertEqual([call.request.headers["Authorization"] for call in responses.calls],
+                         ["Bearer sk_test_a", "Bearer sk_test_b"])
+        self.assertNotIn("Authorization", registry.transport.session.headers)
+        self.assertEqual(registry.stats(), {"tenants": 0, "hits": 1, "created": 2, "evicted": 0})
+
+    def test_lru_and_idle_eviction(self):
+        registry = ClientRegistry(max_tenants=2, idle_timeout=0.05)
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+        registry.get("c")
+        self.assertNotIn("b", registry)
+        self.assertEqual(len(registry), 2)
+        time.sleep(0.06)
+        registry.get("d")
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(registry.stats()["evicted"], 3)
+
+    def test_shared_cache_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ClientRegistry(cache=ResponseCache())
+
+    @responses.activate
+    def test_concurrency_quota_is_per_tenant(self):
+        in_flight, peaks, lock = {}, {}, threading.Lock()
+
+        def callback(request):
+            key = request.headers["Authorization"]
+            with lock:
+                in_flight[key] = in_flight.get(key, 0) + 1
+                peaks[key] = max(peaks.get(key, 0), in_flight[key])
+            time.sleep(0.02)
+            with lock:
+                in_flight[key] -= 1
+            return 200, {}, '{"status": true, "data": {}}'
+
+        responses.add_callback(responses.GET, "https://api.paystack.co/transaction", callback=callback)
+        registry = ClientRegistry(max_concurrency=2, rate=None)
+        keys = ["sk_noisy"] * 8 + ["sk_quiet"]
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            list(executor.map(lambda key: registry.get(key).list_transactions(), keys))
+        self.assertEqual(peaks, {"Bearer sk_noisy": 2, "Bearer sk_quiet": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
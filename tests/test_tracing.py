@@ -0,0 +1,103 @@
+import json
+import socket
+import threading
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from paystackpyAPI.tracing import RequestHooks, SlowRequestLog
+from paystackpyAPI.transaction import Transaction
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"status": True, "data": {"reference": self.path.rsplit("/", 1)[-1]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_request_start(self, timing):
+        self.started.append(timing)
+
+    def on_request_end(self, timing):
+        self.ended.append(timing)
+
+
+class TestTracing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def make_api(self, hooks):
+        api = Transaction(api_key="sk_test_key", hooks=hooks)
+        api.paystack_verification_url = f"{self.base_url}/transaction/verify"
+        return api
+
+    def test_phase_breakdown(self):
+        recorder = Recorder()
+        api = self.make_api(recorder)
+        first = api.verify_transaction("ref-1")
+        api.verify_transaction("ref-2")
+        self.assertEqual(first["response_from_api"]["data"]["reference"], "ref-1")
+        self.assertEqual(len(recorder.started), 2)
+        cold, warm = recorder.ended
+        self.assertFalse(cold.connection_reused)
+        self.assertIsNotNone(cold.dns)
+        self.assertIsNone(cold.tls)
+        self.assertTrue(warm.connection_reused)
+        for timing in (cold, warm):
+            self.assertEqual(timing.status_code, 200)
+            self.assertEqual(timing.endpoint, "GET 127.0.0.1:%d/transaction/verify/:id" % self.server.server_address[1])
+            self.assertGreater(timing.bytes_in, 0)
+            self.assertIsNotNone(timing.ttfb)
+            self.assertIsNotNone(timing.decode)
+            self.assertGreaterEqual(timing.total, timing.ttfb)
+
+    def test_new_connection_resolves_the_host_once(self):
+        recorder = Recorder()
+        api = self.make_api(recorder)
+        api.paystack_verification_url = api.paystack_verification_url.replace("127.0.0.1", "localhost")
+        lookups = []
+        getaddrinfo = socket.getaddrinfo
+
+        def counting_getaddrinfo(host, *args, **kwargs):
+            lookups.append(host)
+            return getaddrinfo(host, *args, **kwargs)
+
+        with patch("socket.getaddrinfo", counting_getaddrinfo):
+            api.verify_transaction("ref-1")
+        self.assertEqual(lookups.count("localhost"), 1)
+        self.assertIsNotNone(recorder.ended[0].dns)
+        self.assertIsNotNone(recorder.ended[0].connect)
+
+    def test_slow_request_log_keeps_slowest(self):
+        log = SlowRequestLog(size=2)
+        api = self.make_api(log)
+        for i in range(5):
+            api.verify_transaction(f"ref-{i}")
+        slowest = log.slowest()
+        self.assertEqual(len(slowest), 2)
+        self.assertGreaterEqual(slowest[0].total, slowest[1].total)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,15 @@ from unittest.mock import Mock, patch
 from paystackpyAPI.transaction import Transaction
 from errors import APIError
 from os import getenv
+import gzip
+import json
+import os
+import re
 import secrets
+import tempfile
+import time
 import responses
+from urllib.parse import parse_qs, urlparse
 
 REFERENCE = secrets.token_hex(16)
 ID = ''
@@ -206,5 +213,208 @@ class TestPaystackAPI(unittest.TestCase):
             self.assertEqual(e.status_code, 404)
             self.assertEqual(e.message, 'Not Found')
 
+
+def paged_transactions(total, per_page):
+    """responses callback serving ``total`` fake transactions in pages."""
+    def callback(request):
+        params = parse_qs(urlparse(request.url).query)
+        page = int(params["page"][0])
+        size = int(params["perPage"][0])
+        ids = range((page - 1) * size + 1, min(page * size, total) + 1)
+        body = {
+            "status": True,
+            "data": [{"id": i, "status": "success"} for i in ids],
+            "meta": {"total": total, "perPage": size, "page": page, "pageCount": -(-total // size)},
+        }
+        return 200, {}, json.dumps(body)
+    return callback
+
+
+class TestTransactionPagination(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+
+    @responses.activate
+    def test_iter_transactions_walks_every_page(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=paged_transactions(23, 10))
+        ids = [transaction["id"] for transaction in self.api.iter_transactions(per_page=10, status="success")]
+        self.assertEqual(ids, list(range(1, 24)))
+        self.assertEqual(len(responses.calls), 3)
+        self.assertIn("status=success", responses.calls[0].request.url)
+
+    @responses.activate
+    def test_iter_transactions_without_prefetch(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=paged_transactions(5, 5))
+        ids = [transaction["id"] for transaction in self.api.iter_transactions(per_page=5, prefetch=False)]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_list_transactions_keeps_pagination_params(self):
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=paged_transactions(5, 2))
+        response = self.api.list_transactions(perPage=2, page=3)
+        self.assertEqual(response["response_from_api"]["meta"]["page"], 3)
+
+
+class TestBulkVerify(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+
+    @staticmethod
+    def verify_callback(request):
+        reference = urlparse(request.url).path.rsplit("/", 1)[-1]
+        if reference.endswith("7"):
+            return 404, {}, json.dumps({"status": False, "message": "Transaction reference not found"})
+        return 200, {}, json.dumps({"status": True, "data": {"reference": reference}})
+
+    @responses.activate
+    def test_verify_transactions_captures_errors(self):
+        responses.add_callback(responses.GET, re.compile(f"{self.api.paystack_verification_url}/.*"),
+                               callback=self.verify_callback)
+        references = [f"ref-{i}" for i in range(30)]
+        results = list(self.api.verify_transactions(iter(references), max_workers=4))
+        self.assertEqual(sorted(result.reference for result in results), sorted(references))
+        failed = {result.reference for result in results if result.error}
+        self.assertEqual(failed, {"ref-7", "ref-17", "ref-27"})
+        for result in results:
+            if result.error:
+                self.assertEqual(result.error.status_code, 404)
+                self.assertIsNone(result.response)
+            else:
+                self.assertEqual(result.response["response_from_api"]["data"]["reference"], result.reference)
+
+
+class TestDownloadCSV(unittest.TestCase):
+    URL = "https://files.example.com/export.csv"
+    BODY = b"id,status\n" + b"".join(b"%d,success\n" % i for i in range(1000))
+
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "export.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    ETAG = '"v1"'
+
+    def range_callback(self, request):
+        range_header = request.headers.get("Range")
+        if not range_header or request.headers.get("If-Range", self.ETAG) != self.ETAG:
+            return 200, {"Content-Length": str(len(self.BODY)), "ETag": self.ETAG}, self.BODY
+        start = int(range_header.split("=")[1].rstrip("-"))
+        headers = {"Content-Range": f"bytes {start}-{len(self.BODY) - 1}/{len(self.BODY)}"}
+        return 206, headers, self.BODY[start:]
+
+    @responses.activate
+    def test_download_streams_and_reports_progress(self):
+        responses.add_callback(responses.GET, self.URL, callback=self.range_callback)
+        progress = []
+        self.api.download_csv(self.URL, self.filename, chunk_size=1024,
+                              progress_callback=lambda done, total, rate: progress.append((done, total)))
+        with open(self.filename, "rb") as file:
+            self.assertEqual(file.read(), self.BODY)
+        self.assertFalse(os.path.exists(self.filename + ".part"))
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress[-1], (len(self.BODY), len(self.BODY)))
+
+    def leave_partial_download(self, url, etag):
+        with open(self.filename + ".part", "wb") as file:
+            file.write(self.BODY[:500])
+        Transaction._save_resume_state(self.filename + ".part", url, etag)
+
+    @responses.activate
+    def test_download_resumes_partial_file(self):
+        responses.add_callback(responses.GET, self.URL, callback=self.range_callback)
+        self.leave_partial_download(self.URL, self.ETAG)
+        self.api.download_csv(self.URL, self.filename)
+        self.assertEqual(responses.calls[0].request.headers["Range"], "bytes=500-")
+        self.assertEqual(responses.calls[0].request.headers["If-Range"], self.ETAG)
+        with open(self.filename, "rb") as file:
+            self.assertEqual(file.read(), self.BODY)
+        self.assertEqual(os.listdir(self.tmp.name), ["export.csv"])
+
+    @responses.activate
+    def test_stale_partial_file_is_discarded(self):
+        responses.add_callback(responses.GET, self.URL, callback=self.range_callback)
+        for url, etag in (("https://files.example.com/other.csv", self.ETAG), (self.URL, '"v0"'), (self.URL, None)):
+            self.leave_partial_download(url, etag)
+            self.api.download_csv(self.URL, self.filename)
+            with open(self.filename, "rb") as file:
+                self.assertEqual(file.read(), self.BODY)
+        # An unrecorded .part (e.g. from an older version) is never resumed either.
+        with open(self.filename + ".part", "wb") as file:
+            file.write(b"stale")
+        self.api.download_csv(self.URL, self.filename)
+        with open(self.filename, "rb") as file:
+            self.assertEqual(file.read(), self.BODY)
+        self.assertNotIn("Range", responses.calls[-1].request.headers)
+
+
+class TestExportAllTransactions(unittest.TestCase):
+    FILES = "https://files.example.com/exports"
+
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.exported_rows = 25
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=paged_transactions(25, 10))
+        responses.add_callback(responses.GET, self.api.export_transactions_url, callback=self.export_callback)
+        responses.add_callback(responses.GET, re.compile(rf"{self.FILES}/page-\d+\.csv"), callback=self.file_callback)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def export_callback(self, request):
+        page = parse_qs(urlparse(request.url).query)["page"][0]
+        return 200, {}, json.dumps({"status": True, "data": {"path": f"{self.FILES}/page-{page}.csv"}})
+
+    def file_callback(self, request):
+        page = int(re.search(r"page-(\d+)", request.url).group(1))
+        if page == 1:
+            time.sleep(0.1)  # finishes last, but must still come first
+        rows = "".join(f"{i},success\n" for i in range((page - 1) * 10 + 1, min(page * 10, self.exported_rows) + 1))
+        return 200, {}, ("\ufeffid,status\n" + rows).rstrip("\n") if page == 3 else "id,status\n" + rows
+
+    @responses.activate
+    def test_pages_are_merged_in_order(self):
+        filename = os.path.join(self.tmp.name, "all.csv")
+        response = self.api.export_all_transactions(filename, per_page=10, max_workers=3, status="success")
+        self.assertEqual(response["data"], {"exported_file": filename, "pages": 3})
+        with open(filename) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines[0], "id,status")
+        self.assertEqual([int(line.split(",")[0]) for line in lines[1:]], list(range(1, 26)))
+        self.assertEqual(os.listdir(self.tmp.name), ["all.csv"])
+
+    @responses.activate
+    def test_stops_at_the_first_empty_page(self):
+        # The listing cannot filter on "settled", so it counts 3 pages for an export of 2.
+        self.exported_rows = 20
+        filename = os.path.join(self.tmp.name, "all.csv")
+        response = self.api.export_all_transactions(filename, per_page=10, settled=True, currency="NGN")
+        self.assertEqual(response["data"]["pages"], 2)
+        listing = parse_qs(urlparse(responses.calls[0].request.url).query)
+        self.assertEqual(listing["currency"], ["NGN"])
+        self.assertNotIn("settled", listing)
+        with open(filename) as file:
+            self.assertEqual(len(file.read().splitlines()), 21)
+
+    @responses.activate
+    def test_gzip_output(self):
+        filename = os.path.join(self.tmp.name, "all.csv.gz")
+        self.api.export_all_transactions(filename, per_page=10, pages=2)
+        with gzip.open(filename, "rt") as file:
+            self.assertEqual(len(file.read().splitlines()), 21)
+
+    @responses.activate
+    def test_failed_page_leaves_no_output(self):
+        responses.replace(responses.GET, self.api.export_transactions_url, status=400, body="Bad request")
+        filename = os.path.join(self.tmp.name, "all.csv")
+        with self.assertRaises(APIError):
+            self.api.export_all_transactions(filename, per_page=10)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
 if __name__ == '__main__':
     unittest.main()
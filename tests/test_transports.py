@@ -0,0 +1,82 @@
+import threading
+import unittest
+import requests
+import responses
+from benchmarks.fake_paystack import FakePaystackServer, point_at
+from paystackpyAPI.tenants import ClientRegistry
+from paystackpyAPI.transaction import Transaction
+from paystackpyAPI.transports import HTTP2Transport, RequestsTransport
+
+try:
+    import h2  # noqa: F401
+    import httpx  # noqa: F401
+    HAVE_HTTP2 = True
+except ImportError:
+    HAVE_HTTP2 = False
+
+
+class TestTransportSelection(unittest.TestCase):
+    @responses.activate
+    def test_requests_is_the_default(self):
+        api = Transaction(api_key="sk_test_key")
+        self.assertIsInstance(api.transport, RequestsTransport)
+        responses.add(responses.GET, f"{api.fetch_transaction_url}/1", json={"status": True, "data": {}})
+        api.fetch_transaction(1)
+        self.assertEqual(responses.calls[0].request.headers["Authorization"], "Bearer sk_test_key")
+        api.close()
+
+    def test_unknown_transport(self):
+        with self.assertRaises(ValueError):
+            Transaction(api_key="sk_test_key", transport="carrier-pigeon")
+
+
+@unittest.skipUnless(HAVE_HTTP2, "httpx[http2] is not installed")
+class TestHTTP2Transport(unittest.TestCase):
+    def test_concurrent_calls_share_one_connection(self):
+        with FakePaystackServer(latency=0.05) as server:
+            backend = HTTP2Transport(headers={"Authorization": "Bearer sk_test_key"}, prior_knowledge=True)
+            api = point_at(Transaction(api_key="sk_test_key", transport=backend, coalesce=False),
+                           server.base_url)
+            results = {}
+            threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, api.fetch_transaction(i)))
+                       for i in range(1, 17)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(sorted(result.data["id"] for result in results.values()), list(range(1, 17)))
+            self.assertEqual(server.connections, 1)
+            backend.close()
+
+    def test_responses_look_like_requests(self):
+        with FakePaystackServer() as server:
+            with HTTP2Transport(prior_knowledge=True) as backend:
+                response = backend.request("GET", f"{server.base_url}/transaction",
+                                           params={"page": 2, "perPage": 5, "status": None},
+                                           headers={"Authorization": "Bearer sk_test_key"}, timeout=(1, 5))
+                self.assertIsInstance(response, requests.Response)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.http_version, "HTTP/2")
+                self.assertNotIn("status", response.request.url)
+                self.assertEqual(response.json()["meta"]["page"], 2)
+
+    def test_closed_transport_reconnects(self):
+        with FakePaystackServer() as server:
+            with ClientRegistry(transport="http2") as registry:
+                api = point_at(registry.get("sk_test_key"), server.base_url)
+                api.fetch_transaction(1)
+                registry.close()
+                api = point_at(registry.get("sk_test_key"), server.base_url)
+                self.assertEqual(api.fetch_transaction(2).data["id"], 2)
+            self.assertEqual(server.connections, 2)
+
+    def test_connection_errors_are_requests_errors(self):
+        with FakePaystackServer() as server:
+            url = server.base_url
+        with HTTP2Transport(prior_knowledge=True) as backend:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                backend.request("GET", f"{url}/transaction", timeout=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
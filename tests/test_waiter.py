@@ -0,0 +1,76 @@
+import json
+import re
+import unittest
+from concurrent.futures import CancelledError
+import responses
+from paystackpyAPI.transaction import Transaction
+from paystackpyAPI.waiter import SettlementWaiter
+
+
+class TestSettlementWaiter(unittest.TestCase):
+    def setUp(self):
+        self.api = Transaction(api_key="sk_test_key")
+        self.checks = {}
+
+    def verify_callback(self, request):
+        reference = request.url.rsplit("/", 1)[-1]
+        self.checks[reference] = self.checks.get(reference, 0) + 1
+        if reference == "missing":
+            return 404, {}, json.dumps({"status": False, "message": "Transaction reference not found"})
+        status = "ongoing" if self.checks[reference] < 2 else "success"
+        return 200, {}, json.dumps({"status": True, "data": {"reference": reference, "status": status}})
+
+    @responses.activate
+    def test_verify_with_backoff(self):
+        responses.add_callback(responses.GET, re.compile(f"{self.api.paystack_verification_url}/.*"),
+                               callback=self.verify_callback)
+        done = []
+        with SettlementWaiter(self.api, poll_interval=0.01, backoff=2, scan_threshold=10) as waiter:
+            first = waiter.wait_for("ref-1", timeout=5, callback=done.append)
+            self.assertIs(waiter.wait_for("ref-1"), first)
+            second = waiter.wait_for("ref-2", timeout=5)
+            self.assertEqual(first.result(timeout=5)["status"], "success")
+            self.assertEqual(second.result(timeout=5)["reference"], "ref-2")
+        self.assertEqual(done, [first])
+        self.assertEqual(self.checks, {"ref-1": 2, "ref-2": 2})
+
+    @responses.activate
+    def test_due_batches_are_scanned_with_list_transactions(self):
+        references = [f"ref-{i}" for i in range(5)]
+
+        def list_callback(request):
+            self.assertIn("from=", request.url)
+            data = [{"reference": reference, "status": "success"} for reference in references[:4]]
+            data.append({"reference": "ref-4", "status": "ongoing"})
+            return 200, {}, json.dumps({"status": True, "data": data, "meta": {"total": 5, "perPage": 100, "page": 1}})
+
+        responses.add_callback(responses.GET, self.api.list_transaction_url, callback=list_callback)
+        responses.add_callback(responses.GET, re.compile(f"{self.api.paystack_verification_url}/.*"),
+                               callback=self.verify_callback)
+        with SettlementWaiter(self.api, poll_interval=0.05, scan_threshold=3) as waiter:
+            futures = waiter.wait_for_many(references, timeout=5)
+            results = {reference: future.result(timeout=5) for reference, future in futures.items()}
+        self.assertEqual({result["status"] for result in results.values()}, {"success"})
+        self.assertEqual(waiter.stats["scans"], 1)
+        # ref-4 was still ongoing in the scan; being alone, it was then verified directly.
+        self.assertEqual(list(self.checks), ["ref-4"])
+
+    @responses.activate
+    def test_deadline_and_close(self):
+        responses.add_callback(responses.GET, re.compile(f"{self.api.paystack_verification_url}/.*"),
+                               callback=self.verify_callback)
+        waiter = SettlementWaiter(self.api, poll_interval=0.01)
+        expired = waiter.wait_for("missing", timeout=0.1)
+        with self.assertRaises(TimeoutError):
+            expired.result(timeout=5)
+        self.assertGreater(self.checks["missing"], 1)
+        open_future = waiter.wait_for("never", timeout=60)
+        waiter.close()
+        with self.assertRaises(CancelledError):
+            open_future.result(timeout=5)
+        with self.assertRaises(RuntimeError):
+            waiter.wait_for("late")
+
+
+if __name__ == '__main__':
+    unittest.main()
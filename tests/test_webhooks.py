@@ -0,0 +1,136 @@
+import asyncio
+import io
+import json
+import threading
+import unittest
+from paystackpyAPI.webhooks import (AsyncWebhookProcessor, SeenSet, WebhookProcessor, asgi_app, compute_signature,
+                                    verify_signature, wsgi_app)
+
+SECRET = "sk_test_key"
+
+
+def delivery(event="charge.success", **data):
+    body = json.dumps({"event": event, "data": {"id": 1, "reference": "ref-1", "status": "success", **data}}).encode()
+    return body, compute_signature(SECRET, body)
+
+
+class TestSignatures(unittest.TestCase):
+    def test_verify_signature(self):
+        body, signature = delivery()
+        self.assertTrue(verify_signature(SECRET, body, signature))
+        self.assertTrue(verify_signature(SECRET, body, signature.upper()))
+        self.assertFalse(verify_signature(SECRET, body + b" ", signature))
+        self.assertFalse(verify_signature("sk_other", body, signature))
+        self.assertFalse(verify_signature(SECRET, body, None))
+        self.assertFalse(verify_signature(SECRET, body, "\xe9" * 128))
+        self.assertFalse(verify_signature(SECRET, body, "\u2603"))
+
+    def test_seen_set_is_bounded(self):
+        seen = SeenSet(max_size=2)
+        self.assertTrue(seen.add("a"))
+        self.assertFalse(seen.add("a"))
+        seen.add("b")
+        seen.add("c")
+        self.assertEqual(len(seen), 2)
+        self.assertNotIn("a", seen)
+
+
+class TestWebhookProcessor(unittest.TestCase):
+    def test_dispatch_dedupe_and_rejections(self):
+        processor = WebhookProcessor(SECRET, workers=2)
+        received, threads = [], set()
+
+        @processor.on("charge.success")
+        def on_charge(event):
+            received.append(event.transaction.reference)
+            threads.add(threading.current_thread().name)
+
+        processor.on("*", lambda event: 1 / 0)
+        body, signature = delivery()
+        self.assertEqual(processor.handle(body, signature), 200)
+        self.assertEqual(processor.handle(body, signature), 200)
+        self.assertEqual(processor.handle(*delivery(id=2, reference="ref-2")), 200)
+        self.assertEqual(processor.handle(body, "0" * 128), 401)
+        bad = b"not json"
+        self.assertEqual(processor.handle(bad, compute_signature(SECRET, bad)), 400)
+        processor.join()
+        processor.close()
+        self.assertEqual(sorted(received), ["ref-1", "ref-2"])
+        self.assertTrue(all(name.startswith("paystack-webhook-") for name in threads))
+        stats = processor.stats()
+        self.assertEqual((stats["received"], stats["duplicates"], stats["dispatched"]), (5, 1, 2))
+        self.assertEqual((stats["invalid_signature"], stats["malformed"], stats["handler_errors"]), (1, 1, 2))
+
+    def test_full_queue_asks_for_redelivery(self):
+        processor = WebhookProcessor(SECRET, workers=1, queue_size=1)
+        gate = threading.Event()
+        processor.on("*", lambda event: gate.wait(5))
+        statuses = [processor.handle(*delivery(id=i)) for i in range(1, 6)]
+        self.assertEqual(statuses[0], 200)
+        self.assertIn(503, statuses)
+        gate.set()
+        processor.join()
+        processor.close()
+        self.assertEqual(processor.stats()["rejected"], statuses.count(503))
+        # A rejected event is not remembered, so its redelivery is accepted.
+        self.assertEqual(processor.handle(*delivery(id=statuses.index(503) + 1)), 200)
+        processor.join()
+        processor.close()
+
+    def test_wsgi_app(self):
+        processor = WebhookProcessor(SECRET)
+        events = []
+        processor.on("charge.success", events.append)
+        app = wsgi_app(processor)
+        body, signature = delivery()
+        responses = []
+        environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body),
+                   "HTTP_X_PAYSTACK_SIGNATURE": signature}
+        app(environ, lambda status, headers: responses.append(status))
+        app({"REQUEST_METHOD": "GET"}, lambda status, headers: responses.append(status))
+        # WSGI servers decode header bytes as latin-1, so garbage arrives as non-ASCII text.
+        environ.update({"wsgi.input": io.BytesIO(body), "HTTP_X_PAYSTACK_SIGNATURE": "\xff\xfe garbage"})
+        app(environ, lambda status, headers: responses.append(status))
+        processor.join()
+        processor.close()
+        self.assertEqual(responses, ["200 OK", "405 Method Not Allowed", "401 Unauthorized"])
+        self.assertEqual(events[0].data["reference"], "ref-1")
+
+
+class TestAsyncWebhookProcessor(unittest.TestCase):
+    def test_asgi_app(self):
+        async def main():
+            processor = AsyncWebhookProcessor(SECRET)
+            events = []
+
+            @processor.on("charge.success")
+            async def on_charge(event):
+                events.append(event.key)
+
+            app = asgi_app(processor)
+            body, signature = delivery()
+            sent = []
+
+            async def send(message):
+                sent.append(message)
+
+            for chunks, signature_value in (([body[:10], body[10:]], signature), ([body], signature),
+                                            ([body], "bad"), ([body], "\xe9t\xe9")):
+                messages = [{"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+                            for i, chunk in enumerate(chunks)]
+
+                async def receive():
+                    return messages.pop(0)
+                scope = {"type": "http", "method": "POST",
+                         "headers": [(b"X-Paystack-Signature", signature_value.encode("latin-1"))]}
+                await app(scope, receive, send)
+            await processor.aclose()
+            return events, [message["status"] for message in sent if message["type"] == "http.response.start"]
+
+        events, statuses = asyncio.run(main())
+        self.assertEqual(events, ["charge.success:1"])
+        self.assertEqual(statuses, [200, 200, 401, 401])
+
+
+if __name__ == '__main__':
+    unittest.main()